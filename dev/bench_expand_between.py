@@ -0,0 +1,89 @@
+"""Benchmark ``recurrence.expand_between`` against plain dateutil expansion.
+
+Expands a one-year window for a few thousand series whose rules started years earlier,
+the shape of an "occurrences in the next year" question across the whole tenant.
+
+    uv run python dev/bench_expand_between.py --series 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import UTC, datetime, timedelta, tzinfo
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import rrulestr
+
+from agendable.recurrence import build_rrule, expand_between
+
+_ZONES = ("America/New_York", "America/Chicago", "Europe/London", "Asia/Tokyo", "UTC")
+
+
+def _random_series(rng: random.Random, count: int) -> list[tuple[str, datetime]]:
+    series: list[tuple[str, datetime]] = []
+    for _ in range(count):
+        zone: tzinfo = ZoneInfo(rng.choice(_ZONES))
+        dtstart = datetime(
+            rng.randint(2020, 2025), rng.randint(1, 12), rng.randint(1, 28), 9, 0, tzinfo=zone
+        )
+        freq = rng.choice(("DAILY", "WEEKLY", "WEEKLY", "MONTHLY"))
+        rrule = build_rrule(
+            freq=freq,
+            interval=rng.choice((1, 1, 2)),
+            dtstart=dtstart,
+            weekly_byday=rng.sample(("MO", "TU", "WE", "TH", "FR"), rng.randint(1, 2)),
+            monthly_mode=rng.choice(("monthday", "nth_weekday")),
+            monthly_bysetpos=[rng.choice((1, 2, 3, -1))],
+        )
+        series.append((rrule, dtstart))
+    return series
+
+
+def _dateutil_between(
+    series: list[tuple[str, datetime]], start: datetime, end: datetime
+) -> list[list[datetime]]:
+    return [
+        [dt for dt in rrulestr(rrule, dtstart=dtstart).between(start, end, inc=True) if dt < end]
+        for rrule, dtstart in series
+    ]
+
+
+def _expand_between(
+    series: list[tuple[str, datetime]], start: datetime, end: datetime
+) -> list[list[datetime]]:
+    return [
+        expand_between(rrule=rrule, dtstart=dtstart, start=start, end=end)
+        for rrule, dtstart in series
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--series", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    series = _random_series(random.Random(args.seed), args.series)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    end = start + timedelta(days=365)
+
+    began = time.perf_counter()
+    expected = _dateutil_between(series, start, end)
+    dateutil_seconds = time.perf_counter() - began
+
+    began = time.perf_counter()
+    expanded = _expand_between(series, start, end)
+    fast_seconds = time.perf_counter() - began
+
+    if expanded != expected:
+        raise SystemExit("expand_between disagrees with dateutil")
+    occurrences = sum(len(dates) for dates in expanded)
+    print(f"series={args.series} occurrences={occurrences}")
+    print(f"dateutil between: {dateutil_seconds:.3f}s")
+    print(f"expand_between:   {fast_seconds:.3f}s ({dateutil_seconds / fast_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
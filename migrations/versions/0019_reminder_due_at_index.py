@@ -0,0 +1,32 @@
+"""Add a partial expression index for due-reminder scans.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reminder_unsent_due_at",
+        "reminder",
+        [sa.text("coalesce(next_attempt_at, send_at)")],
+        unique=False,
+        postgresql_where=sa.text("sent_at IS NULL"),
+        sqlite_where=sa.text("sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminder_unsent_due_at", table_name="reminder")
@@ -0,0 +1,104 @@
+"""Add reminder shards and worker shard leases.
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0020"
+down_revision = "0019"
+branch_labels = None
+depends_on = None
+
+# Mirrors agendable.db.models.REMINDER_SHARD_COUNT at the time of this revision.
+_REMINDER_SHARD_COUNT = 64
+_BACKFILL_CHUNK_SIZE = 500
+
+
+def upgrade() -> None:
+    # Plain ALTERs: batch mode rebuilds the table on SQLite and would drop the expression
+    # index added in 0019, which SQLAlchemy cannot reflect.
+    op.add_column("reminder", sa.Column("shard", sa.Integer(), nullable=False, server_default="0"))
+
+    _backfill_unsent_reminder_shards()
+
+    op.create_index(
+        "ix_reminder_unsent_shard_due_at",
+        "reminder",
+        ["shard", sa.text("coalesce(next_attempt_at, send_at)")],
+        unique=False,
+        postgresql_where=sa.text("sent_at IS NULL"),
+        sqlite_where=sa.text("sent_at IS NULL"),
+    )
+
+    op.create_table(
+        "reminder_shard_lease",
+        sa.Column("shard", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("worker_id", sa.String(length=128), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("shard"),
+    )
+    op.create_index(
+        op.f("ix_reminder_shard_lease_worker_id"),
+        "reminder_shard_lease",
+        ["worker_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "reminder_worker_heartbeat",
+        sa.Column("worker_id", sa.String(length=128), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("worker_id"),
+    )
+    op.create_index(
+        op.f("ix_reminder_worker_heartbeat_last_seen_at"),
+        "reminder_worker_heartbeat",
+        ["last_seen_at"],
+        unique=False,
+    )
+
+
+def _backfill_unsent_reminder_shards() -> None:
+    # Sent reminders are never scanned again, so only unsent rows need their real shard.
+    reminder = sa.table(
+        "reminder",
+        sa.column("id", sa.Uuid()),
+        sa.column("occurrence_id", sa.Uuid()),
+        sa.column("shard", sa.Integer()),
+        sa.column("sent_at", sa.DateTime(timezone=True)),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(reminder.c.id, reminder.c.occurrence_id).where(reminder.c.sent_at.is_(None))
+    ).all()
+
+    ids_by_shard: dict[int, list[uuid.UUID]] = defaultdict(list)
+    for reminder_id, occurrence_id in rows:
+        ids_by_shard[occurrence_id.int % _REMINDER_SHARD_COUNT].append(reminder_id)
+
+    for shard, reminder_ids in ids_by_shard.items():
+        for start in range(0, len(reminder_ids), _BACKFILL_CHUNK_SIZE):
+            chunk = reminder_ids[start : start + _BACKFILL_CHUNK_SIZE]
+            bind.execute(sa.update(reminder).where(reminder.c.id.in_(chunk)).values(shard=shard))
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_reminder_worker_heartbeat_last_seen_at"),
+        table_name="reminder_worker_heartbeat",
+    )
+    op.drop_table("reminder_worker_heartbeat")
+    op.drop_index(op.f("ix_reminder_shard_lease_worker_id"), table_name="reminder_shard_lease")
+    op.drop_table("reminder_shard_lease")
+    op.drop_index("ix_reminder_unsent_shard_due_at", table_name="reminder")
+    op.drop_column("reminder", "shard")
@@ -0,0 +1,29 @@
+"""Record the idempotency key of each reminder's latest committed attempt.
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0021"
+down_revision = "0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Plain ALTERs keep the 0019/0020 expression indexes intact on SQLite (see 0020).
+    op.add_column(
+        "reminder",
+        sa.Column("outcome_idempotency_key", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("reminder", "outcome_idempotency_key")
@@ -0,0 +1,64 @@
+"""Track how far ahead each series' default reminders are materialized.
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0022"
+down_revision = "0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("meeting_series") as batch_op:
+        batch_op.add_column(
+            sa.Column("reminders_materialized_until", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.create_index(
+            batch_op.f("ix_meeting_series_reminders_materialized_until"),
+            ["reminders_materialized_until"],
+            unique=False,
+        )
+
+    # Series created before this revision had every reminder written up front, so their
+    # high-water mark is their latest reminder. Series without reminders stay NULL.
+    meeting_series = sa.table(
+        "meeting_series",
+        sa.column("id", sa.Uuid()),
+        sa.column("reminders_materialized_until", sa.DateTime(timezone=True)),
+    )
+    meeting_occurrence = sa.table(
+        "meeting_occurrence",
+        sa.column("id", sa.Uuid()),
+        sa.column("series_id", sa.Uuid()),
+    )
+    reminder = sa.table(
+        "reminder",
+        sa.column("occurrence_id", sa.Uuid()),
+        sa.column("send_at", sa.DateTime(timezone=True)),
+    )
+    latest_send_at = (
+        sa.select(sa.func.max(reminder.c.send_at))
+        .select_from(
+            reminder.join(meeting_occurrence, reminder.c.occurrence_id == meeting_occurrence.c.id)
+        )
+        .where(meeting_occurrence.c.series_id == meeting_series.c.id)
+        .scalar_subquery()
+    )
+    op.get_bind().execute(
+        sa.update(meeting_series).values(reminders_materialized_until=latest_send_at)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("meeting_series") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_meeting_series_reminders_materialized_until"))
+        batch_op.drop_column("reminders_materialized_until")
@@ -0,0 +1,146 @@
+"""Add archive tables for reminders, occurrences, tasks and agenda items.
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0023"
+down_revision = "0022"
+branch_labels = None
+depends_on = None
+
+_CHANNELS = ("email", "slack")
+_DELIVERY_STATUSES = ("pending", "retry_scheduled", "sent", "failed_terminal", "skipped")
+
+
+def upgrade() -> None:
+    # Both enum types already exist (0001, 0016); reuse them instead of creating new ones.
+    channel_type: sa.TypeEngine[object]
+    delivery_status_type: sa.TypeEngine[object]
+    if op.get_bind().dialect.name == "postgresql":
+        channel_type = postgresql.ENUM(*_CHANNELS, name="reminder_channel", create_type=False)
+        delivery_status_type = postgresql.ENUM(
+            *_DELIVERY_STATUSES, name="reminder_delivery_status", create_type=False
+        )
+    else:
+        channel_type = sa.Enum(*_CHANNELS, name="reminder_channel")
+        delivery_status_type = sa.Enum(*_DELIVERY_STATUSES, name="reminder_delivery_status")
+
+    op.create_table(
+        "meeting_occurrence_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("series_id", sa.Uuid(), nullable=False),
+        sa.Column("scheduled_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=False),
+        sa.Column("is_completed", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_meeting_occurrence_archive_series_id"),
+        "meeting_occurrence_archive",
+        ["series_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "meeting_occurrence_attendee_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("occurrence_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_meeting_occurrence_attendee_archive_occurrence_id"),
+        "meeting_occurrence_attendee_archive",
+        ["occurrence_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "agenda_item_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("occurrence_id", sa.Uuid(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("is_done", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_agenda_item_archive_occurrence_id"),
+        "agenda_item_archive",
+        ["occurrence_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "task_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("occurrence_id", sa.Uuid(), nullable=False),
+        sa.Column("assigned_user_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=300), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("due_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_done", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_task_archive_occurrence_id"),
+        "task_archive",
+        ["occurrence_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "reminder_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("occurrence_id", sa.Uuid(), nullable=False),
+        sa.Column("channel", channel_type, nullable=False),
+        sa.Column("send_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_attempted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempt_count", sa.Integer(), nullable=False),
+        sa.Column("delivery_status", delivery_status_type, nullable=False),
+        sa.Column("failure_reason_code", sa.String(length=64), nullable=True),
+        sa.Column("outcome_idempotency_key", sa.String(length=64), nullable=True),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_reminder_archive_occurrence_id"),
+        "reminder_archive",
+        ["occurrence_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    for table_name in (
+        "reminder_archive",
+        "task_archive",
+        "agenda_item_archive",
+        "meeting_occurrence_attendee_archive",
+    ):
+        op.drop_index(op.f(f"ix_{table_name}_occurrence_id"), table_name=table_name)
+        op.drop_table(table_name)
+    op.drop_index(
+        op.f("ix_meeting_occurrence_archive_series_id"), table_name="meeting_occurrence_archive"
+    )
+    op.drop_table("meeting_occurrence_archive")
@@ -0,0 +1,66 @@
+"""Track how far ahead each series' occurrences are materialized.
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0024"
+down_revision = "0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("meeting_series") as batch_op:
+        batch_op.add_column(
+            sa.Column("occurrences_materialized_until", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.create_index(
+            batch_op.f("ix_meeting_series_occurrences_materialized_until"),
+            ["occurrences_materialized_until"],
+            unique=False,
+        )
+
+    # Locally created recurring series had every occurrence written up front, so their
+    # high-water mark is their latest occurrence. Imported series follow the provider's
+    # events instead of the rule and stay NULL, as do series without a rule.
+    meeting_series = sa.table(
+        "meeting_series",
+        sa.column("id", sa.Uuid()),
+        sa.column("recurrence_rrule", sa.Text()),
+        sa.column("recurrence_dtstart", sa.DateTime(timezone=True)),
+        sa.column("imported_from_provider", sa.String()),
+        sa.column("occurrences_materialized_until", sa.DateTime(timezone=True)),
+    )
+    meeting_occurrence = sa.table(
+        "meeting_occurrence",
+        sa.column("series_id", sa.Uuid()),
+        sa.column("scheduled_at", sa.DateTime(timezone=True)),
+    )
+    latest_scheduled_at = (
+        sa.select(sa.func.max(meeting_occurrence.c.scheduled_at))
+        .where(meeting_occurrence.c.series_id == meeting_series.c.id)
+        .scalar_subquery()
+    )
+    op.get_bind().execute(
+        sa.update(meeting_series)
+        .where(
+            meeting_series.c.recurrence_rrule.is_not(None),
+            meeting_series.c.recurrence_dtstart.is_not(None),
+            meeting_series.c.imported_from_provider.is_(None),
+        )
+        .values(occurrences_materialized_until=latest_scheduled_at)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("meeting_series") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_meeting_series_occurrences_materialized_until"))
+        batch_op.drop_column("occurrences_materialized_until")
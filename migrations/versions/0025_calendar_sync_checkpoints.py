@@ -0,0 +1,35 @@
+"""Checkpoint in-progress Google Calendar syncs so they can resume.
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0025"
+down_revision = "0024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("external_calendar_connection") as batch_op:
+        batch_op.add_column(sa.Column("sync_page_token", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("sync_page_time_min", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("sync_pages_processed", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("external_calendar_connection") as batch_op:
+        batch_op.drop_column("sync_pages_processed")
+        batch_op.drop_column("sync_page_time_min")
+        batch_op.drop_column("sync_page_token")
@@ -0,0 +1,146 @@
+"""Allow one occurrence per series and start time.
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0026"
+down_revision = "0025"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _merge_duplicate_occurrences() -> None:
+    # Concurrent opens of a planned occurrence could write the same instance twice. The
+    # oldest row of each pair survives; tasks, agenda items, calendar links and attendees
+    # move onto it, its notes gain the duplicate's notes and it counts as completed if either
+    # was. The duplicates' reminders are dropped since the survivor has its own; every merge
+    # is logged so the dropped rows can be traced.
+    bind = op.get_bind()
+    occurrence = sa.table(
+        "meeting_occurrence",
+        sa.column("id", sa.Uuid()),
+        sa.column("series_id", sa.Uuid()),
+        sa.column("scheduled_at", sa.DateTime(timezone=True)),
+        sa.column("notes", sa.Text()),
+        sa.column("is_completed", sa.Boolean()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    duplicated = (
+        sa.select(occurrence.c.series_id, occurrence.c.scheduled_at)
+        .group_by(occurrence.c.series_id, occurrence.c.scheduled_at)
+        .having(sa.func.count() > 1)
+        .subquery()
+    )
+    rows = bind.execute(
+        sa.select(
+            occurrence.c.id,
+            occurrence.c.series_id,
+            occurrence.c.scheduled_at,
+            occurrence.c.notes,
+            occurrence.c.is_completed,
+        )
+        .join(
+            duplicated,
+            sa.and_(
+                occurrence.c.series_id == duplicated.c.series_id,
+                occurrence.c.scheduled_at == duplicated.c.scheduled_at,
+            ),
+        )
+        .order_by(occurrence.c.created_at.asc(), occurrence.c.id.asc())
+    ).all()
+
+    survivors: dict[tuple[object, object], _Survivor] = {}
+    for occurrence_id, series_id, scheduled_at, notes, is_completed in rows:
+        survivor = survivors.setdefault(
+            (series_id, scheduled_at),
+            _Survivor(id=occurrence_id, notes=notes or "", is_completed=bool(is_completed)),
+        )
+        if survivor.id == occurrence_id:
+            continue
+        dropped_reminders = _merge_into(bind, duplicate_id=occurrence_id, survivor_id=survivor.id)
+        if notes and notes.strip() and notes != survivor.notes:
+            survivor.notes = f"{survivor.notes}\n\n{notes}" if survivor.notes.strip() else notes
+        survivor.is_completed = survivor.is_completed or bool(is_completed)
+        bind.execute(
+            sa.update(occurrence)
+            .where(occurrence.c.id == survivor.id)
+            .values(notes=survivor.notes, is_completed=survivor.is_completed)
+        )
+        bind.execute(sa.delete(occurrence).where(occurrence.c.id == occurrence_id))
+        logger.warning(
+            "merged duplicate meeting occurrence %s into %s (series %s at %s); "
+            "dropped %d of its reminders",
+            occurrence_id,
+            survivor.id,
+            series_id,
+            scheduled_at,
+            dropped_reminders,
+        )
+
+
+@dataclass(slots=True)
+class _Survivor:
+    id: object
+    notes: str
+    is_completed: bool
+
+
+def _merge_into(bind: sa.Connection, *, duplicate_id: object, survivor_id: object) -> int:
+    """Move the duplicate's rows onto the survivor; return how many reminders were dropped."""
+    for table_name, column_name in (
+        ("task", "occurrence_id"),
+        ("agenda_item", "occurrence_id"),
+        ("external_calendar_event_mirror", "linked_occurrence_id"),
+    ):
+        table = sa.table(table_name, sa.column(column_name, sa.Uuid()))
+        bind.execute(
+            sa.update(table)
+            .where(table.c[column_name] == duplicate_id)
+            .values({column_name: survivor_id})
+        )
+
+    attendee = sa.table(
+        "meeting_occurrence_attendee",
+        sa.column("occurrence_id", sa.Uuid()),
+        sa.column("user_id", sa.Uuid()),
+    )
+    survivor_user_ids = sa.select(attendee.c.user_id).where(attendee.c.occurrence_id == survivor_id)
+    bind.execute(
+        sa.update(attendee)
+        .where(
+            attendee.c.occurrence_id == duplicate_id,
+            attendee.c.user_id.not_in(survivor_user_ids),
+        )
+        .values(occurrence_id=survivor_id)
+    )
+    bind.execute(sa.delete(attendee).where(attendee.c.occurrence_id == duplicate_id))
+
+    reminder = sa.table("reminder", sa.column("occurrence_id", sa.Uuid()))
+    result = bind.execute(sa.delete(reminder).where(reminder.c.occurrence_id == duplicate_id))
+    return result.rowcount
+
+
+def upgrade() -> None:
+    _merge_duplicate_occurrences()
+    with op.batch_alter_table("meeting_occurrence") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_meeting_occurrence_series_scheduled_at", ["series_id", "scheduled_at"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("meeting_occurrence") as batch_op:
+        batch_op.drop_constraint("uq_meeting_occurrence_series_scheduled_at", type_="unique")
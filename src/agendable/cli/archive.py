@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from agendable.cli.shutdown import WorkerShutdown, handle_shutdown_signals
+from agendable.logging_config import log_with_fields
+from agendable.services.archive_service import ArchiveStats, archive_expired_rows
+from agendable.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def run_archive(*, should_stop: Callable[[], bool] | None = None) -> ArchiveStats:
+    settings = get_settings()
+    stats = await archive_expired_rows(
+        now=datetime.now(UTC), settings=settings, should_stop=should_stop
+    )
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "archive complete",
+        archived_reminders=stats.reminders,
+        archived_occurrences=stats.occurrences,
+        batch_count=stats.batches,
+    )
+    return stats
+
+
+async def run_archive_worker(poll_seconds: int) -> None:
+    shutdown = WorkerShutdown(grace_seconds=get_settings().worker_shutdown_grace_seconds)
+    # The run that was in flight when shutdown was requested, if any.
+    drained: ArchiveStats | None = None
+    with handle_shutdown_signals(shutdown):
+        while not shutdown.is_requested():
+            started_at = datetime.now(UTC)
+            stats: ArchiveStats | None = None
+            try:
+                stats = await shutdown.finish(run_archive(should_stop=shutdown.is_requested))
+                if shutdown.is_requested():
+                    drained = stats
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("archive worker iteration failed")
+            finally:
+                duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
+                log_with_fields(
+                    logger,
+                    logging.INFO,
+                    "archive worker iteration complete",
+                    duration_ms=duration_ms,
+                    archived_reminders=stats.reminders if stats is not None else None,
+                    archived_occurrences=stats.occurrences if stats is not None else None,
+                )
+            await shutdown.sleep(poll_seconds)
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "archive worker drained",
+        signal=shutdown.signal_name,
+        drain_ms=shutdown.drain_ms(),
+        deadline_exceeded=shutdown.deadline_exceeded,
+        archived_reminders=drained.reminders if drained is not None else 0,
+        archived_occurrences=drained.occurrences if drained is not None else 0,
+    )
@@ -2,62 +2,145 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 
-import agendable.db as db
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.cli.shutdown import WorkerShutdown, handle_shutdown_signals
 from agendable.db.repos import (
     ExternalCalendarConnectionRepository,
     ExternalCalendarEventMirrorRepository,
 )
-from agendable.logging_config import log_with_fields
+from agendable.logging_config import format_tenths, log_with_fields, percentile
 from agendable.services.calendar_event_mapping_service import CalendarEventMappingService
-from agendable.services.google_calendar_client import GoogleCalendarHttpClient
-from agendable.services.google_calendar_sync_service import GoogleCalendarSyncService
-from agendable.settings import get_settings
+from agendable.services.google_calendar_client import (
+    GoogleCalendarHttpClient,
+    build_google_http_client,
+)
+from agendable.services.google_calendar_sync_service import (
+    GoogleCalendarSyncService,
+    sync_enabled_connections_concurrently,
+)
+from agendable.settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
 
-async def run_google_calendar_sync() -> int:
+def _google_http_client(settings: Settings) -> httpx.AsyncClient:
+    return build_google_http_client(max_connections=settings.google_calendar_http_max_connections)
+
+
+def _build_sync_service(
+    session: AsyncSession, settings: Settings, http_client: httpx.AsyncClient
+) -> GoogleCalendarSyncService:
+    return GoogleCalendarSyncService(
+        connection_repo=ExternalCalendarConnectionRepository(session),
+        event_mirror_repo=ExternalCalendarEventMirrorRepository(session),
+        calendar_client=GoogleCalendarHttpClient(
+            api_base_url=settings.google_calendar_api_base_url,
+            initial_sync_days_back=settings.google_calendar_initial_sync_days_back,
+            client=http_client,
+        ),
+        event_mapper=CalendarEventMappingService.from_session(session),
+        settings=settings,
+        http_client=http_client,
+    )
+
+
+async def run_google_calendar_sync(
+    *,
+    should_stop: Callable[[], bool] | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> int:
+    """Run one sync pass; without ``http_client``, the pass opens and closes its own."""
     settings = get_settings()
     if not settings.google_calendar_sync_enabled:
         logger.info("google calendar sync skipped: feature disabled")
         return 0
 
-    async with db.SessionMaker() as session:
-        sync_service = GoogleCalendarSyncService(
-            connection_repo=ExternalCalendarConnectionRepository(session),
-            event_mirror_repo=ExternalCalendarEventMirrorRepository(session),
-            calendar_client=GoogleCalendarHttpClient(
-                api_base_url=settings.google_calendar_api_base_url,
-                initial_sync_days_back=settings.google_calendar_initial_sync_days_back,
-            ),
-            event_mapper=CalendarEventMappingService.from_session(session),
-            settings=settings,
-        )
-        synced_event_count = await sync_service.sync_all_enabled_connections()
+    if http_client is None:
+        async with _google_http_client(settings) as owned_client:
+            return await _sync_enabled_connections(
+                settings=settings, http_client=owned_client, should_stop=should_stop
+            )
+    return await _sync_enabled_connections(
+        settings=settings, http_client=http_client, should_stop=should_stop
+    )
+
 
-    logger.info("google calendar sync complete: synced_event_count=%s", synced_event_count)
-    return synced_event_count
+async def _sync_enabled_connections(
+    *,
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    should_stop: Callable[[], bool] | None,
+) -> int:
+    started = time.perf_counter()
+    stats = await sync_enabled_connections_concurrently(
+        build_service=lambda session: _build_sync_service(session, settings, http_client),
+        concurrency=settings.google_calendar_sync_concurrency,
+        should_stop=should_stop,
+    )
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "google calendar sync complete",
+        synced_event_count=stats.synced_event_count,
+        connection_count=stats.connections,
+        synced_connection_count=stats.synced,
+        failed_connection_count=stats.failed,
+        skipped_connection_count=stats.skipped,
+        concurrency=settings.google_calendar_sync_concurrency,
+        duration_ms=int((time.perf_counter() - started) * 1000),
+        connection_latency_p50_ms=format_tenths(percentile(stats.connection_latencies_ms, 50)),
+        connection_latency_p95_ms=format_tenths(percentile(stats.connection_latencies_ms, 95)),
+        connection_latency_p99_ms=format_tenths(percentile(stats.connection_latencies_ms, 99)),
+        connection_latency_max_ms=format_tenths(max(stats.connection_latencies_ms, default=None)),
+    )
+    return stats.synced_event_count
 
 
 async def run_google_calendar_sync_worker(poll_seconds: int) -> None:
-    while True:
-        started_at = datetime.now(UTC)
-        synced_event_count: int | None = None
-        try:
-            synced_event_count = await run_google_calendar_sync()
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            logger.exception("google calendar sync worker iteration failed")
-        finally:
-            duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
-            log_with_fields(
-                logger,
-                logging.INFO,
-                "google calendar sync worker iteration complete",
-                duration_ms=duration_ms,
-                synced_event_count=synced_event_count,
-            )
-        await asyncio.sleep(poll_seconds)
+    settings = get_settings()
+    shutdown = WorkerShutdown(grace_seconds=settings.worker_shutdown_grace_seconds)
+    # Events synced by the run that was in flight when shutdown was requested, if any.
+    drained_event_count: int | None = None
+    # One keep-alive client for the life of the worker, closed once it has drained.
+    async with _google_http_client(settings) as http_client:
+        with handle_shutdown_signals(shutdown):
+            while not shutdown.is_requested():
+                started_at = datetime.now(UTC)
+                synced_event_count: int | None = None
+                try:
+                    synced_event_count = await shutdown.finish(
+                        run_google_calendar_sync(
+                            should_stop=shutdown.is_requested, http_client=http_client
+                        )
+                    )
+                    if shutdown.is_requested():
+                        drained_event_count = synced_event_count
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("google calendar sync worker iteration failed")
+                finally:
+                    duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
+                    log_with_fields(
+                        logger,
+                        logging.INFO,
+                        "google calendar sync worker iteration complete",
+                        duration_ms=duration_ms,
+                        synced_event_count=synced_event_count,
+                    )
+                await shutdown.sleep(poll_seconds)
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "google calendar sync worker drained",
+        signal=shutdown.signal_name,
+        drain_ms=shutdown.drain_ms(),
+        deadline_exceeded=shutdown.deadline_exceeded,
+        synced_event_count=drained_event_count,
+    )
@@ -3,16 +3,56 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
 
+from agendable.cli.archive import run_archive, run_archive_worker
 from agendable.cli.calendar_sync import run_google_calendar_sync, run_google_calendar_sync_worker
 from agendable.cli.db import check_db, init_db
-from agendable.cli.reminders import run_due_reminders, run_reminders_worker
+from agendable.cli.occurrences import run_occurrence_horizon, run_occurrences_worker
+from agendable.cli.reminders import (
+    run_due_reminders,
+    run_reminder_horizon,
+    run_reminders_worker,
+)
 from agendable.cli.seed import seed_dev_data
 from agendable.logging_config import configure_logging
 from agendable.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Commands that run one coroutine without arguments.
+_COMMANDS: dict[str, Callable[[], Coroutine[Any, Any, object]]] = {
+    "init-db": init_db,
+    "run-reminders": run_due_reminders,
+    "materialize-reminders": run_reminder_horizon,
+    "materialize-occurrences": run_occurrence_horizon,
+    "run-google-calendar-sync": run_google_calendar_sync,
+    "archive": run_archive,
+}
+
+# Long-running workers that take ``--poll-seconds``.
+_WORKERS: dict[str, Callable[[int], Coroutine[Any, Any, None]]] = {
+    "run-reminders-worker": run_reminders_worker,
+    "run-google-calendar-sync-worker": run_google_calendar_sync_worker,
+    "run-archive-worker": run_archive_worker,
+    "run-occurrences-worker": run_occurrences_worker,
+}
+
+
+def _seed(args: argparse.Namespace) -> None:
+    summary = asyncio.run(seed_dev_data(reset=bool(args.reset), password=str(args.password)))
+    logger.info(
+        "seed-dev-data complete: reset=%s users_created=%s series_created=%s occurrences_created=%s attendees_added=%s agenda_items_created=%s tasks_created=%s",
+        summary.reset_applied,
+        summary.users_created,
+        summary.series_created,
+        summary.occurrences_created,
+        summary.attendees_added,
+        summary.agenda_items_created,
+        summary.tasks_created,
+    )
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog="agendable")
@@ -29,7 +69,15 @@ def main() -> None:
         help="Fail if the DB ping exceeds this timeout.",
     )
     sub.add_parser("run-reminders")
+    sub.add_parser(
+        "materialize-reminders",
+        help="Write default reminder rows for occurrences whose reminders send within the horizon.",
+    )
     sub.add_parser("run-google-calendar-sync")
+    sub.add_parser(
+        "archive",
+        help="Move finished reminders and old completed meetings into the archive tables.",
+    )
     seed = sub.add_parser(
         "seed-dev-data",
         help="Create deterministic local sample data for recurring meetings, tasks, and agenda items.",
@@ -57,39 +105,38 @@ def main() -> None:
         type=int,
         default=settings.google_calendar_sync_worker_poll_seconds,
     )
+    archive_worker = sub.add_parser("run-archive-worker")
+    archive_worker.add_argument(
+        "--poll-seconds",
+        type=int,
+        default=settings.archive_worker_poll_seconds,
+    )
+    sub.add_parser(
+        "materialize-occurrences",
+        help="Top every recurring series up to the configured number of future meetings.",
+    )
+    occurrences_worker = sub.add_parser("run-occurrences-worker")
+    occurrences_worker.add_argument(
+        "--poll-seconds",
+        type=int,
+        default=settings.occurrence_horizon_worker_poll_seconds,
+    )
 
     args = parser.parse_args()
 
-    if args.cmd == "init-db":
-        asyncio.run(init_db())
-    elif args.cmd == "check-db":
+    if args.cmd == "check-db":
         timeout_seconds = max(0.1, float(args.timeout_seconds))
         try:
             asyncio.run(check_db(timeout_seconds=timeout_seconds))
         except Exception:
             logger.exception("db healthcheck failed")
             raise SystemExit(1) from None
-    elif args.cmd == "run-reminders":
-        asyncio.run(run_due_reminders())
-    elif args.cmd == "run-reminders-worker":
-        poll_seconds = max(1, int(args.poll_seconds))
-        asyncio.run(run_reminders_worker(poll_seconds))
-    elif args.cmd == "run-google-calendar-sync":
-        asyncio.run(run_google_calendar_sync())
     elif args.cmd == "seed-dev-data":
-        summary = asyncio.run(seed_dev_data(reset=bool(args.reset), password=str(args.password)))
-        logger.info(
-            "seed-dev-data complete: reset=%s users_created=%s series_created=%s occurrences_created=%s attendees_added=%s agenda_items_created=%s tasks_created=%s",
-            summary.reset_applied,
-            summary.users_created,
-            summary.series_created,
-            summary.occurrences_created,
-            summary.attendees_added,
-            summary.agenda_items_created,
-            summary.tasks_created,
-        )
-    elif args.cmd == "run-google-calendar-sync-worker":
+        _seed(args)
+    elif args.cmd in _WORKERS:
         poll_seconds = max(1, int(args.poll_seconds))
-        asyncio.run(run_google_calendar_sync_worker(poll_seconds))
+        asyncio.run(_WORKERS[args.cmd](poll_seconds))
+    elif args.cmd in _COMMANDS:
+        asyncio.run(_COMMANDS[args.cmd]())
     else:
         raise SystemExit(2)
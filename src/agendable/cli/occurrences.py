@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from agendable.cli.shutdown import WorkerShutdown, handle_shutdown_signals
+from agendable.logging_config import log_with_fields
+from agendable.services.occurrence_horizon_service import (
+    OccurrenceHorizonStats,
+    materialize_occurrence_horizon,
+)
+from agendable.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def run_occurrence_horizon(
+    *, should_stop: Callable[[], bool] | None = None
+) -> OccurrenceHorizonStats:
+    settings = get_settings()
+    stats = await materialize_occurrence_horizon(
+        now=datetime.now(UTC), settings=settings, should_stop=should_stop
+    )
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "occurrence horizon materialized",
+        horizon_count=settings.occurrence_horizon_count,
+        series_count=stats.series,
+        series_topped_up=stats.series_topped_up,
+        occurrences_created=stats.occurrences_created,
+        attendee_links_created=stats.attendee_links_created,
+        reminders_created=stats.reminders_created,
+        batch_count=stats.batches,
+    )
+    return stats
+
+
+async def run_occurrences_worker(poll_seconds: int) -> None:
+    shutdown = WorkerShutdown(grace_seconds=get_settings().worker_shutdown_grace_seconds)
+    # The run that was in flight when shutdown was requested, if any.
+    drained: OccurrenceHorizonStats | None = None
+    with handle_shutdown_signals(shutdown):
+        while not shutdown.is_requested():
+            started_at = datetime.now(UTC)
+            stats: OccurrenceHorizonStats | None = None
+            try:
+                stats = await shutdown.finish(
+                    run_occurrence_horizon(should_stop=shutdown.is_requested)
+                )
+                if shutdown.is_requested():
+                    drained = stats
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("occurrences worker iteration failed")
+            finally:
+                duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
+                log_with_fields(
+                    logger,
+                    logging.INFO,
+                    "occurrences worker iteration complete",
+                    duration_ms=duration_ms,
+                    occurrences_created=stats.occurrences_created if stats is not None else None,
+                )
+            await shutdown.sleep(poll_seconds)
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "occurrences worker drained",
+        signal=shutdown.signal_name,
+        drain_ms=shutdown.drain_ms(),
+        deadline_exceeded=shutdown.deadline_exceeded,
+        occurrences_created=drained.occurrences_created if drained is not None else 0,
+    )
@@ -2,60 +2,334 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import UTC, datetime
+import os
+import socket
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 import agendable.db as db
-from agendable.db.models import Reminder
+from agendable.cli.shutdown import WorkerShutdown, handle_shutdown_signals
+from agendable.db.models import ReminderChannel
 from agendable.db.repos import ReminderRepository
+from agendable.db.repos.reminders import REMINDER_SCHEDULED_CHANNEL
 from agendable.logging_config import log_with_fields
-from agendable.reminders import ReminderSender, build_reminder_sender
+from agendable.reminders import (
+    ReminderSender,
+    SlackReminderSender,
+    as_utc,
+    build_reminder_sender,
+    build_slack_reminder_sender,
+)
 from agendable.services.reminder_claim_service import (
-    claim_reminder_attempt as claim_reminder_attempt_in_service,
+    claim_due_reminder_batch as claim_due_reminder_batch_in_service,
+)
+from agendable.services.reminder_delivery_service import (
+    ReminderRunStats,
+    lateness_histogram,
 )
 from agendable.services.reminder_delivery_service import run_due_reminders as run_due_reminders_impl
+from agendable.services.reminder_horizon_service import (
+    ReminderHorizonStats,
+    materialize_reminder_horizon,
+)
+from agendable.services.reminder_shard_service import (
+    rebalance_reminder_shards,
+    release_reminder_shards,
+)
 from agendable.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# A reminder still due after a full run is leased by another worker; look again shortly.
+_OVERDUE_RECHECK_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class ReminderWakeup:
+    """Wakes the worker early when a reminder is scheduled before its planned wakeup."""
+
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    deadline: datetime | None = None
+
+    def notify(self, payload: str) -> None:
+        try:
+            send_at = as_utc(datetime.fromisoformat(payload))
+        except ValueError:
+            self.event.set()
+            return
+        if self.deadline is None or send_at < self.deadline:
+            self.event.set()
+
+    async def wait(self, timeout_seconds: float) -> None:
+        self.deadline = datetime.now(UTC) + timedelta(seconds=timeout_seconds)
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                await self.event.wait()
+        except TimeoutError:
+            pass
+        finally:
+            self.deadline = None
+
 
-async def claim_reminder_attempt(*, reminder: Reminder, now: datetime) -> bool:
+async def claim_due_reminder_batch(
+    *,
+    now: datetime,
+    limit: int,
+    channels: Sequence[ReminderChannel],
+    shards: Sequence[int] | None = None,
+) -> list[uuid.UUID]:
     settings = get_settings()
-    return await claim_reminder_attempt_in_service(
-        reminder=reminder,
+    return await claim_due_reminder_batch_in_service(
         now=now,
+        limit=limit,
         claim_lease_seconds=settings.reminder_claim_lease_seconds,
+        channels=channels,
+        shards=shards,
     )
 
 
-async def run_due_reminders(sender: ReminderSender | None = None) -> None:
+async def run_due_reminders(
+    sender: ReminderSender | None = None,
+    *,
+    shards: Sequence[int] | None = None,
+    slack_sender: SlackReminderSender | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ReminderRunStats:
     settings = get_settings()
     selected_sender = sender if sender is not None else build_reminder_sender(settings)
+    selected_slack_sender = (
+        slack_sender if slack_sender is not None else build_slack_reminder_sender(settings)
+    )
+    try:
+        async with db.SessionMaker() as session:
+            reminder_repo = ReminderRepository(session)
+            return await run_due_reminders_impl(
+                reminder_repo=reminder_repo,
+                sender=selected_sender,
+                logger=logger,
+                settings=settings,
+                claim_batch=claim_due_reminder_batch,
+                shards=shards,
+                slack_sender=selected_slack_sender,
+                should_stop=should_stop,
+            )
+    finally:
+        if sender is None:
+            await selected_sender.aclose()
+        if slack_sender is None and selected_slack_sender is not None:
+            await selected_slack_sender.aclose()
+
+
+async def run_reminder_horizon() -> ReminderHorizonStats:
+    settings = get_settings()
+    stats = await materialize_reminder_horizon(now=datetime.now(UTC), settings=settings)
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "reminder horizon materialized",
+        horizon_days=settings.reminder_horizon_days,
+        series_count=stats.series,
+        reminders_created=stats.reminders_created,
+        occurrences_created=stats.occurrences_created,
+        batch_count=stats.batches,
+    )
+    return stats
+
+
+async def _run_reminder_horizon_step(now: datetime, *, interval_seconds: int) -> datetime | None:
+    """Materialize the reminder horizon; return when to next run it (None retries next time).
+
+    A failure here must not hold up delivering reminders that already exist.
+    """
+    try:
+        await run_reminder_horizon()
+    except Exception:
+        logger.exception("reminders worker could not materialize the reminder horizon")
+        return None
+    return now + timedelta(seconds=interval_seconds)
+
+
+def seconds_until_next_run(
+    next_due_at: datetime | None, *, now: datetime, poll_seconds: float
+) -> float:
+    if next_due_at is None:
+        return float(poll_seconds)
+    delay_seconds = (as_utc(next_due_at) - now).total_seconds()
+    if delay_seconds <= 0:
+        return min(_OVERDUE_RECHECK_SECONDS, float(poll_seconds))
+    return min(delay_seconds, float(poll_seconds))
+
+
+async def _seconds_until_next_run(poll_seconds: float, *, shards: Sequence[int]) -> float:
     async with db.SessionMaker() as session:
-        reminder_repo = ReminderRepository(session)
-        await run_due_reminders_impl(
-            reminder_repo=reminder_repo,
-            sender=selected_sender,
-            logger=logger,
-            settings=settings,
-            claim_attempt=claim_reminder_attempt,
-        )
+        next_due_at = await ReminderRepository(session).next_due_at(shards=shards)
+    return seconds_until_next_run(next_due_at, now=datetime.now(UTC), poll_seconds=poll_seconds)
+
+
+def _reminder_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@asynccontextmanager
+async def listen_for_scheduled_reminders(wakeup: ReminderWakeup) -> AsyncIterator[None]:
+    """Subscribe ``wakeup`` to Postgres reminder NOTIFYs for the life of the context.
+
+    Other dialects (e.g. SQLite) have no NOTIFY, so the worker keeps polling there.
+    """
+    if db.engine.dialect.name != "postgresql":
+        yield
+        return
+
+    def _on_notify(_connection: object, _pid: int, _channel: str, payload: str) -> None:
+        wakeup.notify(payload)
+
+    connection: AsyncConnection | None = None
+    try:
+        connection = await db.engine.connect()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        await driver_connection.add_listener(REMINDER_SCHEDULED_CHANNEL, _on_notify)
+    except Exception:
+        logger.exception("reminders worker could not listen for wakeups; polling instead")
+        if connection is not None:
+            await connection.close()
+        connection = None
+
+    try:
+        yield
+    finally:
+        if connection is not None:
+            try:
+                await driver_connection.remove_listener(REMINDER_SCHEDULED_CHANNEL, _on_notify)
+            finally:
+                await connection.close()
 
 
 async def run_reminders_worker(poll_seconds: int) -> None:
-    while True:
-        started_at = datetime.now(UTC)
+    settings = get_settings()
+    worker_id = _reminder_worker_id()
+    # Renew shard leases well before they expire, even when nothing is due for a while.
+    max_sleep_seconds = min(float(poll_seconds), settings.reminder_shard_lease_seconds / 3)
+    wakeup = ReminderWakeup()
+    shutdown = WorkerShutdown(
+        grace_seconds=settings.worker_shutdown_grace_seconds, on_request=wakeup.event.set
+    )
+    # Cumulative over the worker's lifetime, like a Prometheus histogram's bucket counters.
+    lateness_buckets: Counter[str] = Counter()
+    next_horizon_run_at: datetime | None = None
+    # The run that was in flight when shutdown was requested, if any.
+    drained: ReminderRunStats | None = None
+    # One email sender (with its SMTP sessions or HTTP client) and one Slack client for the
+    # life of the worker, closed once it has drained.
+    sender = build_reminder_sender(settings)
+    slack_sender = build_slack_reminder_sender(settings)
+    try:
+        with handle_shutdown_signals(shutdown):
+            async with listen_for_scheduled_reminders(wakeup):
+                while not shutdown.is_requested():
+                    # Clear before running so a reminder scheduled mid-run still triggers a rerun.
+                    wakeup.event.clear()
+                    started_at = datetime.now(UTC)
+                    sleep_seconds = max_sleep_seconds
+                    shards: list[int] = []
+                    stats: ReminderRunStats | None = None
+                    try:
+                        if next_horizon_run_at is None or started_at >= next_horizon_run_at:
+                            next_horizon_run_at = await shutdown.finish(
+                                _run_reminder_horizon_step(
+                                    started_at,
+                                    interval_seconds=settings.reminder_horizon_interval_seconds,
+                                )
+                            )
+                        if shutdown.is_requested():
+                            break
+                        shards = await rebalance_reminder_shards(
+                            worker_id=worker_id,
+                            now=started_at,
+                            lease_seconds=settings.reminder_shard_lease_seconds,
+                        )
+                        if shards:
+                            stats = await shutdown.finish(
+                                run_due_reminders(
+                                    sender,
+                                    shards=shards,
+                                    slack_sender=slack_sender,
+                                    should_stop=shutdown.is_requested,
+                                )
+                            )
+                            if shutdown.is_requested():
+                                drained = stats
+                            if stats.lateness_seconds:
+                                lateness_buckets.update(lateness_histogram(stats.lateness_seconds))
+                                log_with_fields(
+                                    logger,
+                                    logging.INFO,
+                                    "reminders worker lateness histogram",
+                                    worker_id=worker_id,
+                                    **lateness_buckets,
+                                )
+                            sleep_seconds = await _seconds_until_next_run(
+                                max_sleep_seconds, shards=shards
+                            )
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        logger.exception("reminders worker iteration failed")
+                    finally:
+                        duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
+                        log_with_fields(
+                            logger,
+                            logging.INFO,
+                            "reminders worker iteration complete",
+                            duration_ms=duration_ms,
+                            sleep_seconds=round(sleep_seconds, 3),
+                            worker_id=worker_id,
+                            shard_count=len(shards),
+                            queue_depth=stats.queue_depth_at_start if stats is not None else None,
+                            oldest_overdue_seconds=(
+                                round(stats.oldest_overdue_seconds, 1)
+                                if stats is not None and stats.oldest_overdue_seconds is not None
+                                else None
+                            ),
+                        )
+                    await wakeup.wait(sleep_seconds)
+        log_with_fields(
+            logger,
+            logging.INFO,
+            "reminders worker drained",
+            worker_id=worker_id,
+            signal=shutdown.signal_name,
+            drain_ms=shutdown.drain_ms(),
+            deadline_exceeded=shutdown.deadline_exceeded,
+            sent=drained.sent if drained is not None else 0,
+            failed=drained.failed if drained is not None else 0,
+            retried=drained.retried if drained is not None else 0,
+            released=drained.released if drained is not None else 0,
+        )
+    finally:
+        # Hand shards back right away instead of making peers wait for the leases to expire.
         try:
-            await run_due_reminders()
-        except asyncio.CancelledError:
-            raise
+            await release_reminder_shards(worker_id=worker_id)
         except Exception:
-            logger.exception("reminders worker iteration failed")
-        finally:
-            duration_ms = int((datetime.now(UTC) - started_at).total_seconds() * 1000)
-            log_with_fields(
-                logger,
-                logging.INFO,
-                "reminders worker iteration complete",
-                duration_ms=duration_ms,
-            )
-        await asyncio.sleep(poll_seconds)
+            logger.exception("reminders worker could not release shard leases")
+        await _close_senders(sender, slack_sender)
+
+
+async def _close_senders(sender: ReminderSender, slack_sender: SlackReminderSender | None) -> None:
+    try:
+        await sender.aclose()
+    except Exception:
+        logger.exception("reminders worker could not close the email sender")
+    if slack_sender is None:
+        return
+    try:
+        await slack_sender.aclose()
+    except Exception:
+        logger.exception("reminders worker could not close the slack sender")
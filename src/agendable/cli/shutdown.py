@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from agendable.logging_config import log_with_fields
+
+logger = logging.getLogger(__name__)
+
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+class WorkerDrainTimeoutError(TimeoutError):
+    """In-flight work was cancelled because it outlived the shutdown grace period."""
+
+
+@dataclass(slots=True)
+class WorkerShutdown:
+    """Tracks a SIGTERM/SIGINT so a worker drains its current iteration instead of dying in it.
+
+    The first signal asks the worker to stop claiming new work. In-flight work then gets
+    ``grace_seconds`` to finish; a second signal, or the deadline, cancels it.
+    """
+
+    grace_seconds: float
+    on_request: Callable[[], None] | None = None
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    forced: asyncio.Event = field(default_factory=asyncio.Event)
+    signal_name: str | None = None
+    requested_at: datetime | None = None
+    deadline_exceeded: bool = False
+
+    def is_requested(self) -> bool:
+        return self.event.is_set()
+
+    def request(self, signal_name: str) -> None:
+        if self.event.is_set():
+            log_with_fields(logger, logging.WARNING, "worker shutdown forced", signal=signal_name)
+            self.forced.set()
+            return
+        self.signal_name = signal_name
+        self.requested_at = datetime.now(UTC)
+        log_with_fields(
+            logger,
+            logging.INFO,
+            "worker shutdown requested",
+            signal=signal_name,
+            grace_seconds=self.grace_seconds,
+        )
+        self.event.set()
+        if self.on_request is not None:
+            self.on_request()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep up to ``seconds``, returning as soon as shutdown is requested."""
+        try:
+            async with asyncio.timeout(seconds):
+                await self.event.wait()
+        except TimeoutError:
+            pass
+
+    async def finish[T](self, work: Awaitable[T]) -> T:
+        """Await ``work``; once shutdown is requested, cancel it if it outlives the grace period.
+
+        Raises ``WorkerDrainTimeoutError`` when the work had to be cancelled.
+        """
+        task = asyncio.ensure_future(work)
+        try:
+            await _wait_for_either(task, self.event)
+            if not task.done():
+                await _wait_for_either(task, self.forced, timeout=self.grace_seconds)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not task.done():
+            self.deadline_exceeded = True
+            task.cancel()
+            await asyncio.wait([task])
+            raise WorkerDrainTimeoutError(
+                f"in-flight work still running {self.grace_seconds}s after shutdown was requested"
+            )
+        return task.result()
+
+    def drain_ms(self) -> int | None:
+        if self.requested_at is None:
+            return None
+        return int((datetime.now(UTC) - self.requested_at).total_seconds() * 1000)
+
+
+async def _wait_for_either(
+    task: asyncio.Future[Any], event: asyncio.Event, *, timeout: float | None = None
+) -> None:
+    waiter = asyncio.create_task(event.wait())
+    try:
+        await asyncio.wait([task, waiter], timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+
+
+@contextmanager
+def handle_shutdown_signals(shutdown: WorkerShutdown) -> Iterator[None]:
+    """Route SIGTERM and SIGINT to ``shutdown`` for the life of the context.
+
+    Platforms without ``add_signal_handler`` (e.g. Windows) keep the default behaviour,
+    where the signal cancels the worker outright.
+    """
+    loop = asyncio.get_running_loop()
+    installed: list[signal.Signals] = []
+    for sig in _SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, shutdown.request, sig.name)
+        except NotImplementedError, RuntimeError:
+            continue
+        installed.append(sig)
+    try:
+        yield
+    finally:
+        for sig in installed:
+            loop.remove_signal_handler(sig)
@@ -9,14 +9,21 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     Uuid,
+    func,
 )
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# Reminders are hashed by occurrence into a fixed number of shards so worker replicas can
+# lease disjoint partitions. The shard is stored per row, so changing this needs a backfill.
+REMINDER_SHARD_COUNT = 64
+
 
 class Base(DeclarativeBase):
     pass
@@ -130,6 +137,17 @@ class MeetingSeries(Base):
         DateTime(timezone=True), nullable=True
     )
     recurrence_timezone: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # High-water mark of default reminder materialization: every occurrence whose reminder
+    # sends by this time already has its reminder row. The horizon job skips NULL series.
+    reminders_materialized_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    # High-water mark of occurrence materialization: every rule instance scheduled by this
+    # time has a row; later instances stay virtual until touched. NULL series have no
+    # virtual occurrences (legacy and calendar-imported series).
+    occurrences_materialized_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
 
     imported_from_provider: Mapped[CalendarProvider | None] = mapped_column(
         Enum(CalendarProvider, name="calendar_provider"),
@@ -153,6 +171,13 @@ class MeetingSeries(Base):
 
 class MeetingOccurrence(Base):
     __tablename__ = "meeting_occurrence"
+    __table_args__ = (
+        UniqueConstraint(
+            "series_id",
+            "scheduled_at",
+            name="uq_meeting_occurrence_series_scheduled_at",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     series_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("meeting_series.id"), index=True)
@@ -212,6 +237,13 @@ class ExternalCalendarConnection(Base):
     )
 
     sync_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Checkpoint of a sync that stopped partway: the next page to request, the bootstrap
+    # window it was listing (NULL for incremental syncs) and the pages already written.
+    sync_page_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sync_page_time_min: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    sync_pages_processed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     watch_channel_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     watch_resource_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     watch_expires_at: Mapped[datetime | None] = mapped_column(
@@ -355,6 +387,15 @@ class Task(Base):
     assignee: Mapped[User] = relationship(back_populates="assigned_tasks")
 
 
+def reminder_shard_for(occurrence_id: uuid.UUID) -> int:
+    return occurrence_id.int % REMINDER_SHARD_COUNT
+
+
+def _default_reminder_shard(context: DefaultExecutionContext) -> int:
+    occurrence_id = context.get_current_parameters()["occurrence_id"]  # type: ignore[no-untyped-call]
+    return reminder_shard_for(uuid.UUID(str(occurrence_id)))
+
+
 class Reminder(Base):
     __tablename__ = "reminder"
 
@@ -376,5 +417,118 @@ class Reminder(Base):
         default=ReminderDeliveryStatus.pending,
     )
     failure_reason_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Idempotency key of the latest attempt whose outcome was committed.
+    outcome_idempotency_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    shard: Mapped[int] = mapped_column(Integer, default=_default_reminder_shard, server_default="0")
 
     occurrence: Mapped[MeetingOccurrence] = relationship(back_populates="reminders")
+
+
+class ReminderShardLease(Base):
+    __tablename__ = "reminder_shard_lease"
+
+    shard: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    worker_id: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class ReminderWorkerHeartbeat(Base):
+    __tablename__ = "reminder_worker_heartbeat"
+
+    worker_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+# Archive tables hold rows moved out of the hot tables once past their retention age.
+# They mirror the source columns (plus archived_at) without foreign keys, so archived rows
+# never block deleting or changing the rows they referred to.
+
+
+class MeetingOccurrenceArchive(Base):
+    __tablename__ = "meeting_occurrence_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    series_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), index=True)
+    scheduled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    notes: Mapped[str] = mapped_column(Text, default="")
+    is_completed: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class MeetingOccurrenceAttendeeArchive(Base):
+    __tablename__ = "meeting_occurrence_attendee_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    occurrence_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class AgendaItemArchive(Base):
+    __tablename__ = "agenda_item_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    occurrence_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), index=True)
+    body: Mapped[str] = mapped_column(Text)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    is_done: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class TaskArchive(Base):
+    __tablename__ = "task_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    occurrence_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), index=True)
+    assigned_user_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True))
+    title: Mapped[str] = mapped_column(String(300))
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    due_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    is_done: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class ReminderArchive(Base):
+    __tablename__ = "reminder_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
+    occurrence_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), index=True)
+    channel: Mapped[ReminderChannel] = mapped_column(Enum(ReminderChannel, name="reminder_channel"))
+    send_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_attempted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    attempt_count: Mapped[int] = mapped_column(Integer, default=0)
+    delivery_status: Mapped[ReminderDeliveryStatus] = mapped_column(
+        Enum(ReminderDeliveryStatus, name="reminder_delivery_status"),
+    )
+    failure_reason_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    outcome_idempotency_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    shard: Mapped[int] = mapped_column(Integer)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+# Due-reminder scans filter and order on coalesce(next_attempt_at, send_at) for unsent rows.
+Index(
+    "ix_reminder_unsent_due_at",
+    func.coalesce(Reminder.next_attempt_at, Reminder.send_at),
+    postgresql_where=Reminder.sent_at.is_(None),
+    sqlite_where=Reminder.sent_at.is_(None),
+)
+
+# Sharded workers scan only their leased shards, in due order.
+Index(
+    "ix_reminder_unsent_shard_due_at",
+    Reminder.shard,
+    func.coalesce(Reminder.next_attempt_at, Reminder.send_at),
+    postgresql_where=Reminder.sent_at.is_(None),
+    sqlite_where=Reminder.sent_at.is_(None),
+)
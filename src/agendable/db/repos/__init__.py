@@ -5,6 +5,7 @@ Keep them focused on persistence/query shaping; business logic lives in services
 """
 
 from agendable.db.repos.agenda_items import AgendaItemRepository
+from agendable.db.repos.archive import ArchiveRepository
 from agendable.db.repos.dashboard import DashboardRepository
 from agendable.db.repos.external_calendar_connections import ExternalCalendarConnectionRepository
 from agendable.db.repos.external_calendar_event_mirrors import (
@@ -14,12 +15,18 @@ from agendable.db.repos.external_identities import ExternalIdentityRepository
 from agendable.db.repos.meeting_occurrence_attendees import MeetingOccurrenceAttendeeRepository
 from agendable.db.repos.meeting_occurrences import MeetingOccurrenceRepository
 from agendable.db.repos.meeting_series import MeetingSeriesRepository
-from agendable.db.repos.reminders import ReminderRepository
+from agendable.db.repos.reminder_shard_leases import ReminderShardLeaseRepository
+from agendable.db.repos.reminders import (
+    ReminderDeliveryRow,
+    ReminderQueueSnapshot,
+    ReminderRepository,
+)
 from agendable.db.repos.tasks import TaskRepository
 from agendable.db.repos.users import UserRepository
 
 __all__ = [
     "AgendaItemRepository",
+    "ArchiveRepository",
     "DashboardRepository",
     "ExternalCalendarConnectionRepository",
     "ExternalCalendarEventMirrorRepository",
@@ -27,7 +34,10 @@ __all__ = [
     "MeetingOccurrenceAttendeeRepository",
     "MeetingOccurrenceRepository",
     "MeetingSeriesRepository",
+    "ReminderDeliveryRow",
+    "ReminderQueueSnapshot",
     "ReminderRepository",
+    "ReminderShardLeaseRepository",
     "TaskRepository",
     "UserRepository",
 ]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import DateTime, delete, exists, func, insert, literal, select
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from agendable.db.models import (
+    AgendaItem,
+    AgendaItemArchive,
+    Base,
+    ExternalCalendarEventMirror,
+    MeetingOccurrence,
+    MeetingOccurrenceArchive,
+    MeetingOccurrenceAttendee,
+    MeetingOccurrenceAttendeeArchive,
+    Reminder,
+    ReminderArchive,
+    ReminderDeliveryStatus,
+    Task,
+    TaskArchive,
+)
+
+_FINISHED_REMINDER_STATUSES = (ReminderDeliveryStatus.sent, ReminderDeliveryStatus.failed_terminal)
+_AWAITING_REMINDER_STATUSES = (
+    ReminderDeliveryStatus.pending,
+    ReminderDeliveryStatus.retry_scheduled,
+)
+
+
+class ArchiveRepository:
+    """Moves rows past their retention age into the archive tables, and reads them back."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def lock_archivable_reminder_ids(
+        self, *, finished_before: datetime, limit: int
+    ) -> list[uuid.UUID]:
+        """Lock up to ``limit`` sent or terminally failed reminders finished before the cutoff."""
+        result = await self.session.execute(
+            select(Reminder.id)
+            .where(
+                Reminder.delivery_status.in_(_FINISHED_REMINDER_STATUSES),
+                func.coalesce(Reminder.sent_at, Reminder.last_attempted_at, Reminder.send_at)
+                < finished_before,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def lock_archivable_occurrence_ids(
+        self, *, scheduled_before: datetime, limit: int
+    ) -> list[uuid.UUID]:
+        """Lock up to ``limit`` completed occurrences scheduled before the cutoff.
+
+        Occurrences that still carry open tasks, reminders awaiting delivery, or a calendar
+        event mirror link stay in the hot tables: they are still live somewhere else.
+        """
+        result = await self.session.execute(
+            select(MeetingOccurrence.id)
+            .where(
+                MeetingOccurrence.is_completed.is_(True),
+                MeetingOccurrence.scheduled_at < scheduled_before,
+                ~exists().where(
+                    Task.occurrence_id == MeetingOccurrence.id, Task.is_done.is_(False)
+                ),
+                ~exists().where(
+                    Reminder.occurrence_id == MeetingOccurrence.id,
+                    Reminder.sent_at.is_(None),
+                    Reminder.delivery_status.in_(_AWAITING_REMINDER_STATUSES),
+                ),
+                ~exists().where(
+                    ExternalCalendarEventMirror.linked_occurrence_id == MeetingOccurrence.id
+                ),
+            )
+            .limit(limit)
+            .with_for_update(of=MeetingOccurrence, skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def move_reminders(
+        self, reminder_ids: Sequence[uuid.UUID], *, archived_at: datetime
+    ) -> int:
+        if not reminder_ids:
+            return 0
+        return await self._move(
+            Reminder, ReminderArchive, Reminder.id.in_(reminder_ids), archived_at=archived_at
+        )
+
+    async def move_occurrences(
+        self, occurrence_ids: Sequence[uuid.UUID], *, archived_at: datetime
+    ) -> int:
+        """Archive occurrences together with every row that references them."""
+        if not occurrence_ids:
+            return 0
+        await self._move(
+            Reminder,
+            ReminderArchive,
+            Reminder.occurrence_id.in_(occurrence_ids),
+            archived_at=archived_at,
+        )
+        await self._move(
+            Task, TaskArchive, Task.occurrence_id.in_(occurrence_ids), archived_at=archived_at
+        )
+        await self._move(
+            AgendaItem,
+            AgendaItemArchive,
+            AgendaItem.occurrence_id.in_(occurrence_ids),
+            archived_at=archived_at,
+        )
+        await self._move(
+            MeetingOccurrenceAttendee,
+            MeetingOccurrenceAttendeeArchive,
+            MeetingOccurrenceAttendee.occurrence_id.in_(occurrence_ids),
+            archived_at=archived_at,
+        )
+        return await self._move(
+            MeetingOccurrence,
+            MeetingOccurrenceArchive,
+            MeetingOccurrence.id.in_(occurrence_ids),
+            archived_at=archived_at,
+        )
+
+    async def _move(
+        self,
+        source: type[Base],
+        archive: type[Base],
+        predicate: ColumnElement[bool],
+        *,
+        archived_at: datetime,
+    ) -> int:
+        """Copy matching ``source`` rows into ``archive`` and delete them from ``source``.
+
+        Archive tables share the source column names, plus ``archived_at``.
+        """
+        source_columns = list(source.__table__.columns)
+        await self.session.execute(
+            insert(archive).from_select(
+                [*(column.name for column in source_columns), "archived_at"],
+                select(*source_columns, literal(archived_at, DateTime(timezone=True))).where(
+                    predicate
+                ),
+            )
+        )
+        delete_result = await self.session.execute(
+            delete(source).where(predicate).execution_options(synchronize_session=False)
+        )
+        return cast(CursorResult[object], delete_result).rowcount
+
+    async def list_occurrences_for_series(
+        self, series_id: uuid.UUID
+    ) -> list[MeetingOccurrenceArchive]:
+        result = await self.session.execute(
+            select(MeetingOccurrenceArchive)
+            .where(MeetingOccurrenceArchive.series_id == series_id)
+            .order_by(MeetingOccurrenceArchive.scheduled_at.desc())
+        )
+        return list(result.scalars().all())
+
+    async def list_tasks_for_occurrences(
+        self, occurrence_ids: Sequence[uuid.UUID]
+    ) -> list[TaskArchive]:
+        if not occurrence_ids:
+            return []
+        result = await self.session.execute(
+            select(TaskArchive)
+            .where(TaskArchive.occurrence_id.in_(occurrence_ids))
+            .order_by(TaskArchive.created_at.asc(), TaskArchive.id.asc())
+        )
+        return list(result.scalars().all())
+
+    async def list_agenda_items_for_occurrences(
+        self, occurrence_ids: Sequence[uuid.UUID]
+    ) -> list[AgendaItemArchive]:
+        if not occurrence_ids:
+            return []
+        result = await self.session.execute(
+            select(AgendaItemArchive)
+            .where(AgendaItemArchive.occurrence_id.in_(occurrence_ids))
+            .order_by(AgendaItemArchive.created_at.asc(), AgendaItemArchive.id.asc())
+        )
+        return list(result.scalars().all())
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
@@ -21,6 +21,12 @@ class BaseRepository[ModelT: Base]:
             await self.session.flush()  # assigns PKs, etc.
         return obj
 
+    async def insert_many(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Insert ``rows`` in multi-row INSERTs, bypassing the unit of work."""
+        if not rows:
+            return
+        await self.session.execute(insert(self.model), list(rows))
+
     async def get(self, id_: Any) -> ModelT | None:
         return await self.session.get(self.model, id_)
 
@@ -42,3 +42,14 @@ class ExternalCalendarConnectionRepository(BaseRepository[ExternalCalendarConnec
             .order_by(ExternalCalendarConnection.created_at.asc())
         )
         return list(result.scalars().all())
+
+    async def list_enabled_ids_for_provider(self, provider: CalendarProvider) -> list[uuid.UUID]:
+        result = await self.session.execute(
+            select(ExternalCalendarConnection.id)
+            .where(
+                ExternalCalendarConnection.provider == provider,
+                ExternalCalendarConnection.is_enabled,
+            )
+            .order_by(ExternalCalendarConnection.created_at.asc())
+        )
+        return list(result.scalars().all())
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping, Sequence
 from contextlib import suppress
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import ExternalCalendarEventMirror, MeetingOccurrence
 from agendable.db.repos.base import BaseRepository
 
+# Mirror rows per upsert statement; keeps bind parameters well inside Postgres' and SQLite's limits.
+UPSERT_CHUNK_SIZE = 500
+
+_UPSERT_CONFLICT_COLUMNS = ("connection_id", "external_event_id")
+# Columns an upsert overwrites on an existing mirror; the link to an occurrence is kept.
+_UPSERT_UPDATE_COLUMNS = (
+    "external_recurring_event_id",
+    "external_status",
+    "etag",
+    "summary",
+    "start_at",
+    "end_at",
+    "is_all_day",
+    "external_updated_at",
+    "last_seen_at",
+    "updated_at",
+)
+
 
 class ExternalCalendarEventMirrorRepository(BaseRepository[ExternalCalendarEventMirror]):
     def __init__(self, session: AsyncSession) -> None:
@@ -67,6 +89,63 @@ class ExternalCalendarEventMirrorRepository(BaseRepository[ExternalCalendarEvent
             raise
         return existing_after
 
+    async def upsert_for_connection_events(
+        self,
+        *,
+        connection_id: uuid.UUID,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> list[ExternalCalendarEventMirror]:
+        """Insert or update a connection's mirrors and return them in ``rows`` order.
+
+        Each row maps the event columns in ``_UPSERT_UPDATE_COLUMNS`` plus
+        ``external_event_id``; a later row for the same event wins. Each chunk of
+        ``UPSERT_CHUNK_SIZE`` rows is one ``INSERT ... ON CONFLICT (connection_id,
+        external_event_id) DO UPDATE ... RETURNING``, so concurrent syncs of the same
+        event settle on the database side instead of racing a SELECT.
+        """
+        by_event_id: dict[str, dict[str, Any]] = {}
+        now = datetime.now(UTC)
+        for row in rows:
+            by_event_id[row["external_event_id"]] = {
+                "id": uuid.uuid4(),
+                "connection_id": connection_id,
+                "created_at": now,
+                "updated_at": now,
+                **row,
+            }
+
+        values = list(by_event_id.values())
+        mirrors_by_event_id: dict[str, ExternalCalendarEventMirror] = {}
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            for mirror in await self._upsert_chunk(values[start : start + UPSERT_CHUNK_SIZE]):
+                mirrors_by_event_id[mirror.external_event_id] = mirror
+        return [mirrors_by_event_id[event_id] for event_id in by_event_id]
+
+    async def _upsert_chunk(
+        self, values: list[dict[str, Any]]
+    ) -> Sequence[ExternalCalendarEventMirror]:
+        stmt: Insert
+        if self.session.get_bind().dialect.name == "postgresql":
+            postgresql_stmt = postgresql_insert(ExternalCalendarEventMirror).values(values)
+            stmt = postgresql_stmt.on_conflict_do_update(
+                index_elements=_UPSERT_CONFLICT_COLUMNS,
+                set_={
+                    column: postgresql_stmt.excluded[column] for column in _UPSERT_UPDATE_COLUMNS
+                },
+            )
+        else:
+            sqlite_stmt = sqlite_insert(ExternalCalendarEventMirror).values(values)
+            stmt = sqlite_stmt.on_conflict_do_update(
+                index_elements=_UPSERT_CONFLICT_COLUMNS,
+                set_={column: sqlite_stmt.excluded[column] for column in _UPSERT_UPDATE_COLUMNS},
+            )
+        # populate_existing refreshes mirrors already loaded in this session.
+        result = await self.session.scalars(
+            stmt.returning(ExternalCalendarEventMirror),
+            execution_options={"populate_existing": True},
+        )
+        return result.all()
+
     async def touch_seen(self, mirror: ExternalCalendarEventMirror) -> ExternalCalendarEventMirror:
         mirror.last_seen_at = datetime.now(UTC)
         await self.session.flush()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
+from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from agendable.db.models import MeetingOccurrenceAttendee
+from agendable.db.models import MeetingOccurrence, MeetingOccurrenceAttendee
 from agendable.db.repos.base import BaseRepository
 
 
@@ -44,6 +46,48 @@ class MeetingOccurrenceAttendeeRepository(BaseRepository[MeetingOccurrenceAttend
         )
         return set(result.scalars().all())
 
+    async def list_user_ids_for_occurrence(self, occurrence_id: uuid.UUID) -> set[uuid.UUID]:
+        result = await self.session.execute(
+            select(MeetingOccurrenceAttendee.user_id).where(
+                MeetingOccurrenceAttendee.occurrence_id == occurrence_id
+            )
+        )
+        return set(result.scalars().all())
+
+    async def list_user_ids_for_latest_series_occurrences(
+        self, series_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, set[uuid.UUID]]:
+        """Map each series to the attendees of its latest occurrence."""
+        if not series_ids:
+            return {}
+        latest = (
+            select(
+                MeetingOccurrence.series_id,
+                func.max(MeetingOccurrence.scheduled_at).label("scheduled_at"),
+            )
+            .where(MeetingOccurrence.series_id.in_(series_ids))
+            .group_by(MeetingOccurrence.series_id)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(MeetingOccurrence.series_id, MeetingOccurrenceAttendee.user_id)
+            .join(
+                latest,
+                and_(
+                    MeetingOccurrence.series_id == latest.c.series_id,
+                    MeetingOccurrence.scheduled_at == latest.c.scheduled_at,
+                ),
+            )
+            .join(
+                MeetingOccurrenceAttendee,
+                MeetingOccurrenceAttendee.occurrence_id == MeetingOccurrence.id,
+            )
+        )
+        user_ids: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+        for series_id, user_id in result.tuples().all():
+            user_ids[series_id].add(user_id)
+        return dict(user_ids)
+
     async def add_link(
         self,
         *,
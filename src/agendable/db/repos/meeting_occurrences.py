@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime
 
-from sqlalchemy import and_, select
+from sqlalchemy import Insert, and_, exists, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agendable.db.models import MeetingOccurrence, MeetingOccurrenceAttendee, MeetingSeries
+from agendable.db.models import (
+    MeetingOccurrence,
+    MeetingOccurrenceAttendee,
+    MeetingSeries,
+    Reminder,
+)
 from agendable.db.repos.access_predicates import (
     attendee_matches_user_predicate,
     visible_occurrence_for_user_predicate,
@@ -45,6 +53,49 @@ class MeetingOccurrenceRepository(BaseRepository[MeetingOccurrence]):
         )
         return result.scalar_one_or_none()
 
+    async def insert_missing_for_series(
+        self,
+        *,
+        series_id: uuid.UUID,
+        scheduled: Sequence[datetime],
+    ) -> list[MeetingOccurrence]:
+        """Insert an open occurrence at each of ``scheduled`` that has no row yet.
+
+        One ``INSERT ... ON CONFLICT (series_id, scheduled_at) DO NOTHING RETURNING``, so a
+        concurrent writer of the same instance wins quietly; only the rows this call
+        inserted are returned, earliest first.
+        """
+        if not scheduled:
+            return []
+
+        now = datetime.now(UTC)
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "series_id": series_id,
+                "scheduled_at": scheduled_at,
+                "notes": "",
+                "is_completed": False,
+                "created_at": now,
+            }
+            for scheduled_at in dict.fromkeys(scheduled)
+        ]
+        stmt: Insert
+        if self.session.get_bind().dialect.name == "postgresql":
+            stmt = (
+                postgresql_insert(MeetingOccurrence)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=("series_id", "scheduled_at"))
+            )
+        else:
+            stmt = (
+                sqlite_insert(MeetingOccurrence)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=("series_id", "scheduled_at"))
+            )
+        result = await self.session.scalars(stmt.returning(MeetingOccurrence))
+        return sorted(result.all(), key=lambda occurrence: occurrence.scheduled_at)
+
     async def get_next_for_series(
         self, series_id: uuid.UUID, scheduled_after: datetime
     ) -> MeetingOccurrence | None:
@@ -60,6 +111,77 @@ class MeetingOccurrenceRepository(BaseRepository[MeetingOccurrence]):
         )
         return result.scalar_one_or_none()
 
+    async def get_latest_for_series(self, series_id: uuid.UUID) -> MeetingOccurrence | None:
+        result = await self.session.execute(
+            select(MeetingOccurrence)
+            .where(MeetingOccurrence.series_id == series_id)
+            .order_by(MeetingOccurrence.scheduled_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_scheduled_after(
+        self, series_id: uuid.UUID, scheduled_after: datetime
+    ) -> list[datetime]:
+        result = await self.session.execute(
+            select(MeetingOccurrence.scheduled_at)
+            .where(
+                MeetingOccurrence.series_id == series_id,
+                MeetingOccurrence.scheduled_at > scheduled_after,
+            )
+            .order_by(MeetingOccurrence.scheduled_at.asc())
+        )
+        return list(result.scalars().all())
+
+    async def list_scheduled_after_for_series(
+        self,
+        *,
+        series_ids: Sequence[uuid.UUID],
+        scheduled_after: datetime,
+    ) -> list[tuple[uuid.UUID, datetime]]:
+        """Return ``(series id, scheduled_at)`` for every occurrence after ``scheduled_after``."""
+        if not series_ids:
+            return []
+        result = await self.session.execute(
+            select(MeetingOccurrence.series_id, MeetingOccurrence.scheduled_at).where(
+                MeetingOccurrence.series_id.in_(series_ids),
+                MeetingOccurrence.scheduled_at > scheduled_after,
+            )
+        )
+        return list(result.tuples().all())
+
+    async def list_unreminded_after_reminder_horizon(
+        self,
+        *,
+        series_ids: Sequence[uuid.UUID],
+        scheduled_until: datetime,
+    ) -> list[tuple[uuid.UUID, uuid.UUID, datetime]]:
+        """Return ``(occurrence id, series id, scheduled_at)`` for reminder-less occurrences.
+
+        Only open occurrences scheduled after their series' reminder high-water mark and by
+        ``scheduled_until`` are returned; callers narrow the result by each series' lead time.
+        """
+        if not series_ids:
+            return []
+
+        result = await self.session.execute(
+            select(
+                MeetingOccurrence.id,
+                MeetingOccurrence.series_id,
+                MeetingOccurrence.scheduled_at,
+            )
+            .join(MeetingSeries, MeetingOccurrence.series_id == MeetingSeries.id)
+            .where(
+                MeetingOccurrence.series_id.in_(series_ids),
+                MeetingOccurrence.is_completed.is_(False),
+                MeetingOccurrence.scheduled_at > MeetingSeries.reminders_materialized_until,
+                MeetingOccurrence.scheduled_at <= scheduled_until,
+                ~exists().where(Reminder.occurrence_id == MeetingOccurrence.id),
+            )
+            .order_by(MeetingOccurrence.scheduled_at.asc())
+        )
+        return list(result.tuples().all())
+
     async def get_occurrence_with_series_for_user(
         self,
         *,
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping, Sequence
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
@@ -141,3 +143,71 @@ class MeetingSeriesRepository(BaseRepository[MeetingSeries]):
             .limit(1)
         )
         return result.scalar_one_or_none()
+
+    async def lock_behind_reminder_horizon(
+        self,
+        *,
+        horizon_end: datetime,
+        limit: int,
+    ) -> list[MeetingSeries]:
+        """Lock up to ``limit`` series whose reminders are materialized short of ``horizon_end``.
+
+        ``SKIP LOCKED`` lets concurrent horizon jobs take disjoint batches on Postgres.
+        """
+        result = await self.session.execute(
+            select(MeetingSeries)
+            .where(MeetingSeries.reminders_materialized_until < horizon_end)
+            .order_by(MeetingSeries.reminders_materialized_until.asc(), MeetingSeries.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def advance_reminder_horizon(
+        self,
+        *,
+        series_ids: Sequence[uuid.UUID],
+        materialized_until: datetime,
+    ) -> None:
+        if not series_ids:
+            return
+        await self.session.execute(
+            update(MeetingSeries)
+            .where(MeetingSeries.id.in_(series_ids))
+            .values(reminders_materialized_until=materialized_until)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def lock_with_virtual_occurrences(
+        self,
+        *,
+        after_id: uuid.UUID | None,
+        limit: int,
+    ) -> list[MeetingSeries]:
+        """Lock the next ``limit`` series, by id after ``after_id``, that have a rule mark.
+
+        ``SKIP LOCKED`` lets concurrent occurrence horizon jobs take disjoint pages.
+        """
+        stmt = select(MeetingSeries).where(
+            MeetingSeries.occurrences_materialized_until.is_not(None)
+        )
+        if after_id is not None:
+            stmt = stmt.where(MeetingSeries.id > after_id)
+        result = await self.session.execute(
+            stmt.order_by(MeetingSeries.id.asc()).limit(limit).with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def advance_occurrence_horizons(
+        self, materialized_until: Mapping[uuid.UUID, datetime]
+    ) -> None:
+        """Set each series' occurrence high-water mark in one executemany UPDATE."""
+        if not materialized_until:
+            return
+        await self.session.execute(
+            update(MeetingSeries),
+            [
+                {"id": series_id, "occurrences_materialized_until": until}
+                for series_id, until in materialized_until.items()
+            ],
+        )
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from agendable.db.models import ReminderShardLease, ReminderWorkerHeartbeat
+from agendable.db.repos.base import BaseRepository
+
+
+def _lease_available(now: datetime) -> ColumnElement[bool]:
+    return or_(
+        ReminderShardLease.worker_id.is_(None),
+        ReminderShardLease.lease_expires_at.is_(None),
+        ReminderShardLease.lease_expires_at <= now,
+    )
+
+
+class ReminderShardLeaseRepository(BaseRepository[ReminderShardLease]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, ReminderShardLease)
+
+    async def ensure_shards(self, shard_count: int) -> None:
+        result = await self.session.execute(select(ReminderShardLease.shard))
+        existing = set(result.scalars().all())
+        missing = [shard for shard in range(shard_count) if shard not in existing]
+        if not missing:
+            return
+
+        try:
+            async with self.session.begin_nested():
+                self.session.add_all([ReminderShardLease(shard=shard) for shard in missing])
+        except IntegrityError:
+            # Another worker seeded the rows concurrently; the savepoint keeps us usable.
+            return
+
+    async def record_heartbeat(self, *, worker_id: str, now: datetime) -> None:
+        heartbeat = await self.session.get(ReminderWorkerHeartbeat, worker_id)
+        if heartbeat is None:
+            self.session.add(ReminderWorkerHeartbeat(worker_id=worker_id, last_seen_at=now))
+        else:
+            heartbeat.last_seen_at = now
+        await self.session.flush()
+
+    async def prune_stale_workers(self, *, seen_before: datetime) -> None:
+        await self.session.execute(
+            delete(ReminderWorkerHeartbeat).where(
+                ReminderWorkerHeartbeat.last_seen_at < seen_before
+            )
+        )
+
+    async def count_live_workers(self) -> int:
+        result = await self.session.execute(
+            select(func.count()).select_from(ReminderWorkerHeartbeat)
+        )
+        return int(result.scalar_one())
+
+    async def remove_worker(self, worker_id: str) -> None:
+        await self.session.execute(
+            delete(ReminderWorkerHeartbeat).where(ReminderWorkerHeartbeat.worker_id == worker_id)
+        )
+
+    async def renew(self, *, worker_id: str, lease_expires_at: datetime) -> list[int]:
+        result = await self.session.execute(
+            update(ReminderShardLease)
+            .where(ReminderShardLease.worker_id == worker_id)
+            .values(lease_expires_at=lease_expires_at)
+            .returning(ReminderShardLease.shard)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.scalars().all())
+
+    async def acquire_available(
+        self,
+        *,
+        worker_id: str,
+        now: datetime,
+        lease_expires_at: datetime,
+        limit: int,
+    ) -> list[int]:
+        """Lease up to ``limit`` unowned or expired shards to ``worker_id``.
+
+        The availability check is repeated on the UPDATE so two workers racing for the
+        same shard cannot both win it; on Postgres ``SKIP LOCKED`` lets them pick others.
+        """
+        if limit <= 0:
+            return []
+
+        candidate_shards = (
+            select(ReminderShardLease.shard)
+            .where(_lease_available(now))
+            .order_by(ReminderShardLease.shard.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(ReminderShardLease)
+            .where(ReminderShardLease.shard.in_(candidate_shards.scalar_subquery()))
+            .where(_lease_available(now))
+            .values(worker_id=worker_id, lease_expires_at=lease_expires_at)
+            .returning(ReminderShardLease.shard)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.scalars().all())
+
+    async def release(self, *, worker_id: str, shards: Sequence[int] | None = None) -> None:
+        stmt = update(ReminderShardLease).where(ReminderShardLease.worker_id == worker_id)
+        if shards is not None:
+            stmt = stmt.where(ReminderShardLease.shard.in_(shards))
+        await self.session.execute(
+            stmt.values(worker_id=None, lease_expires_at=None).execution_options(
+                synchronize_session=False
+            )
+        )
@@ -1,45 +1,271 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import cast
 
-from sqlalchemy import or_, select, update
+from sqlalchemy import func, or_, select, text, update
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
 from agendable.db.models import (
     MeetingOccurrence,
     MeetingSeries,
     Reminder,
+    ReminderChannel,
     ReminderDeliveryStatus,
+    Task,
+    User,
 )
 from agendable.db.repos.base import BaseRepository
 
+_DELIVERABLE_STATUSES = (ReminderDeliveryStatus.pending, ReminderDeliveryStatus.retry_scheduled)
+
+# Postgres NOTIFY channel used to wake reminder workers when a reminder is scheduled.
+REMINDER_SCHEDULED_CHANNEL = "agendable_reminder_scheduled"
+
+
+def _awaiting_delivery() -> list[ColumnElement[bool]]:
+    return [
+        Reminder.sent_at.is_(None),
+        Reminder.delivery_status.in_(_DELIVERABLE_STATUSES),
+    ]
+
+
+def _in_shards(shards: Sequence[int] | None) -> list[ColumnElement[bool]]:
+    if shards is None:
+        return []
+    return [Reminder.shard.in_(shards)]
+
+
+def _due_for_delivery(now: datetime) -> list[ColumnElement[bool]]:
+    return [
+        *_awaiting_delivery(),
+        func.coalesce(Reminder.next_attempt_at, Reminder.send_at) <= now,
+    ]
+
+
+@dataclass(slots=True)
+class ReminderDeliveryRow:
+    reminder: Reminder
+    recipient_email: str
+    meeting_title: str
+    scheduled_at: datetime
+    incomplete_tasks: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ReminderQueueSnapshot:
+    due_count: int
+    oldest_due_at: datetime | None
+
 
 class ReminderRepository(BaseRepository[Reminder]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Reminder)
 
-    async def list_pending_for_delivery(self) -> list[Reminder]:
+    async def list_delivery_rows(
+        self, reminder_ids: Sequence[uuid.UUID]
+    ) -> list[ReminderDeliveryRow]:
+        """Load claimed reminders with only the fields the reminder message needs."""
+        if not reminder_ids:
+            return []
+
         result = await self.session.execute(
-            select(Reminder)
-            .options(
-                selectinload(Reminder.occurrence)
-                .selectinload(MeetingOccurrence.series)
-                .selectinload(MeetingSeries.owner),
-                selectinload(Reminder.occurrence).selectinload(MeetingOccurrence.tasks),
+            select(Reminder, User.email, MeetingSeries.title, MeetingOccurrence.scheduled_at)
+            .join(MeetingOccurrence, Reminder.occurrence_id == MeetingOccurrence.id)
+            .join(MeetingSeries, MeetingOccurrence.series_id == MeetingSeries.id)
+            .join(User, MeetingSeries.owner_user_id == User.id)
+            .where(Reminder.id.in_(reminder_ids))
+            .order_by(Reminder.send_at.asc(), Reminder.id.asc())
+        )
+        rows = [
+            ReminderDeliveryRow(
+                reminder=reminder,
+                recipient_email=recipient_email,
+                meeting_title=meeting_title,
+                scheduled_at=scheduled_at,
             )
-            .where(Reminder.sent_at.is_(None))
-            .where(
-                Reminder.delivery_status.in_(
-                    [ReminderDeliveryStatus.pending, ReminderDeliveryStatus.retry_scheduled]
-                )
+            for reminder, recipient_email, meeting_title, scheduled_at in result.tuples().all()
+        ]
+        if not rows:
+            return rows
+
+        occurrence_ids = {row.reminder.occurrence_id for row in rows}
+        task_result = await self.session.execute(
+            select(Task.occurrence_id, Task.title)
+            .where(Task.occurrence_id.in_(occurrence_ids))
+            .where(Task.is_done.is_(False))
+            .order_by(Task.created_at.asc(), Task.id.asc())
+        )
+        task_titles_by_occurrence: dict[uuid.UUID, list[str]] = defaultdict(list)
+        for occurrence_id, title in task_result.tuples().all():
+            task_titles_by_occurrence[occurrence_id].append(title)
+
+        for row in rows:
+            row.incomplete_tasks = list(
+                task_titles_by_occurrence.get(row.reminder.occurrence_id, [])
             )
-            .order_by(Reminder.next_attempt_at.asc())
+        return rows
+
+    async def claim_due_batch(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        claim_lease_seconds: int,
+        channels: Sequence[ReminderChannel],
+        shards: Sequence[int] | None = None,
+    ) -> list[uuid.UUID]:
+        """Lease up to ``limit`` due reminders in one statement and return their IDs.
+
+        On Postgres the candidate rows are locked with ``FOR UPDATE SKIP LOCKED`` so
+        concurrent workers claim disjoint batches instead of blocking on each other.
+        SQLite ignores the locking clause; its single-writer lock serializes claims.
+        ``shards`` restricts the scan to a worker's leased shards (``None`` scans all).
+        """
+        if limit <= 0 or not channels:
+            return []
+
+        candidate_ids = (
+            select(Reminder.id)
+            .where(*_due_for_delivery(now), *_in_shards(shards))
+            .where(Reminder.channel.in_(channels))
+            .order_by(
+                func.coalesce(Reminder.next_attempt_at, Reminder.send_at).asc(),
+                Reminder.id.asc(),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claim_result = await self.session.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(candidate_ids.scalar_subquery()))
+            .where(*_due_for_delivery(now))
+            .values(
+                attempt_count=Reminder.attempt_count + 1,
+                last_attempted_at=now,
+                next_attempt_at=now + timedelta(seconds=claim_lease_seconds),
+            )
+            .returning(Reminder.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(claim_result.scalars().all())
+
+    async def claim_upcoming_for_recipients(
+        self,
+        *,
+        recipient_emails: Sequence[str],
+        now: datetime,
+        until: datetime,
+        claim_lease_seconds: int,
+        channels: Sequence[ReminderChannel],
+        shards: Sequence[int] | None = None,
+    ) -> list[uuid.UUID]:
+        """Lease never-attempted reminders for ``recipient_emails`` sending by ``until``.
+
+        Used to pull a recipient's upcoming reminders into the digest for one that is due
+        now. Requiring ``attempt_count == 0`` on the UPDATE keeps a reminder that another
+        worker already claimed (or that is waiting on a retry) out of the digest.
+        ``shards`` restricts the pull to a worker's leased shards (``None`` scans all), so
+        reminders in shards leased to a peer stay with that peer.
+        """
+        if not recipient_emails or not channels:
+            return []
+
+        pull_forward = [
+            Reminder.sent_at.is_(None),
+            Reminder.delivery_status == ReminderDeliveryStatus.pending,
+            Reminder.attempt_count == 0,
+            Reminder.send_at <= until,
+        ]
+        candidate_ids = (
+            select(Reminder.id)
+            .join(MeetingOccurrence, Reminder.occurrence_id == MeetingOccurrence.id)
+            .join(MeetingSeries, MeetingOccurrence.series_id == MeetingSeries.id)
+            .join(User, MeetingSeries.owner_user_id == User.id)
+            .where(*pull_forward, *_in_shards(shards))
+            .where(Reminder.channel.in_(channels))
+            .where(User.email.in_(recipient_emails))
+            .with_for_update(of=Reminder, skip_locked=True)
+        )
+        claim_result = await self.session.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(candidate_ids.scalar_subquery()))
+            .where(*pull_forward)
+            .values(
+                attempt_count=Reminder.attempt_count + 1,
+                last_attempted_at=now,
+                next_attempt_at=now + timedelta(seconds=claim_lease_seconds),
+            )
+            .returning(Reminder.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(claim_result.scalars().all())
+
+    async def skip_due_for_unsupported_channels(
+        self,
+        *,
+        now: datetime,
+        supported_channels: Sequence[ReminderChannel],
+        shards: Sequence[int] | None = None,
+    ) -> int:
+        skip_result = await self.session.execute(
+            update(Reminder)
+            .where(*_due_for_delivery(now), *_in_shards(shards))
+            .where(Reminder.channel.not_in(supported_channels))
+            .values(
+                delivery_status=ReminderDeliveryStatus.skipped,
+                failure_reason_code="unsupported_channel",
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return cast(CursorResult[object], skip_result).rowcount
+
+    async def queue_snapshot(
+        self,
+        *,
+        now: datetime,
+        channels: Sequence[ReminderChannel],
+        shards: Sequence[int] | None = None,
+    ) -> ReminderQueueSnapshot:
+        """Count reminders already due on ``channels`` and find the longest-waiting one."""
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.min(func.coalesce(Reminder.next_attempt_at, Reminder.send_at)),
+            )
+            .where(*_due_for_delivery(now), *_in_shards(shards))
+            .where(Reminder.channel.in_(channels))
+        )
+        due_count, oldest_due_at = result.tuples().one()
+        return ReminderQueueSnapshot(due_count=due_count, oldest_due_at=oldest_due_at)
+
+    async def next_due_at(self, *, shards: Sequence[int] | None = None) -> datetime | None:
+        result = await self.session.execute(
+            select(func.min(func.coalesce(Reminder.next_attempt_at, Reminder.send_at))).where(
+                *_awaiting_delivery(), *_in_shards(shards)
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def notify_scheduled(self, *, send_at: datetime) -> None:
+        """Signal listening reminder workers that a reminder is due at ``send_at``.
+
+        Postgres delivers the NOTIFY only when the surrounding transaction commits.
+        Other dialects have no listeners, so this is a no-op there.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return
+
+        await self.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": REMINDER_SCHEDULED_CHANNEL, "payload": send_at.isoformat()},
         )
-        return list(result.scalars().all())
 
     async def try_claim_attempt(
         self,
@@ -53,11 +279,7 @@ class ReminderRepository(BaseRepository[Reminder]):
             update(Reminder)
             .where(Reminder.id == reminder_id)
             .where(Reminder.sent_at.is_(None))
-            .where(
-                Reminder.delivery_status.in_(
-                    [ReminderDeliveryStatus.pending, ReminderDeliveryStatus.retry_scheduled]
-                )
-            )
+            .where(Reminder.delivery_status.in_(_DELIVERABLE_STATUSES))
             .where(Reminder.attempt_count == expected_attempt_count)
             .where(or_(Reminder.next_attempt_at.is_(None), Reminder.next_attempt_at <= now))
             .values(
@@ -16,6 +16,7 @@ from agendable.db.repos import (
     MeetingOccurrenceAttendeeRepository,
     MeetingOccurrenceRepository,
     MeetingSeriesRepository,
+    ReminderRepository,
     TaskRepository,
     UserRepository,
 )
@@ -158,6 +159,7 @@ def get_series_service(
         attendees=attendees,
         series=series,
         occurrences=occurrences,
+        reminders=ReminderRepository(session),
     )
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 from contextvars import ContextVar, Token
 from datetime import UTC, datetime
 from logging.config import dictConfig
@@ -104,6 +105,21 @@ def log_with_fields(
     logger.log(level, "%s", message, exc_info=exc_info)
 
 
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``values``, or None when there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def format_tenths(value: float | None) -> str | None:
+    if value is None:
+        return None
+    return f"{value:.1f}"
+
+
 def log_security_audit_event(
     *,
     audit_event: str,
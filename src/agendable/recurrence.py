@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import calendar
+import functools
 import itertools
-from collections.abc import Iterable, Sequence
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, tzinfo
 
-from dateutil.rrule import rrulestr
+from dateutil.rrule import rrulebase, rrulestr
 
 _WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
 
+_WEEKDAY_INDEX = {code: idx for idx, code in enumerate(_WEEKDAYS)}
+
 _WEEKDAY_LABELS: dict[str, str] = {
     "MO": "Mon",
     "TU": "Tue",
@@ -351,15 +356,54 @@ def _build_monthly_nth_weekday_parts(
     return [f"BYDAY={byday}", f"BYSETPOS={','.join(str(p) for p in setpos)}"]
 
 
-def generate_datetimes(*, rrule: str, dtstart: datetime, count: int) -> list[datetime]:
-    if count <= 0:
-        return []
+# Series share a few hundred distinct rules; keep every one of them parsed, with headroom.
+_COMPILED_RRULE_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class RRuleCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
 
+
+@functools.lru_cache(maxsize=_COMPILED_RRULE_CACHE_SIZE)
+def _compile_rrule(normalized: str, wall_dtstart: datetime, tz: tzinfo) -> rrulebase:
+    return rrulestr(normalized, dtstart=wall_dtstart.replace(tzinfo=tz))
+
+
+def compile_rrule(rrule: str, *, dtstart: datetime) -> rrulebase:
+    """Parse ``rrule`` anchored at ``dtstart``, reusing a process-wide LRU of parsed rules.
+
+    Aware datetimes in different zones compare equal when they name the same instant, so
+    the cache is keyed on the wall-clock ``dtstart`` and its tzinfo separately. Naive
+    ``dtstart`` values are treated as UTC.
+    """
     if dtstart.tzinfo is None:
         dtstart = dtstart.replace(tzinfo=UTC)
+    return _compile_rrule(normalize_rrule(rrule), dtstart.replace(tzinfo=None), dtstart.tzinfo)
 
-    normalized = normalize_rrule(rrule)
-    rule = rrulestr(normalized, dtstart=dtstart)
+
+def rrule_cache_stats() -> RRuleCacheStats:
+    info = _compile_rrule.cache_info()
+    return RRuleCacheStats(
+        hits=info.hits,
+        misses=info.misses,
+        size=info.currsize,
+        max_size=info.maxsize or 0,
+    )
+
+
+def clear_rrule_cache() -> None:
+    _compile_rrule.cache_clear()
+
+
+def generate_datetimes(*, rrule: str, dtstart: datetime, count: int) -> list[datetime]:
+    if count <= 0:
+        return []
+
+    rule = compile_rrule(rrule, dtstart=dtstart)
 
     out: list[datetime] = []
     for dt in itertools.islice(rule, count):
@@ -368,3 +412,155 @@ def generate_datetimes(*, rrule: str, dtstart: datetime, count: int) -> list[dat
         else:
             out.append(dt)
     return out
+
+
+# (first rule date, window's first local date, window's last local date) -> candidate dates.
+type _DateExpander = Callable[[date, date, date], Iterator[date]]
+
+
+def _as_aware_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _strict_rrule_parts(rrule: str) -> dict[str, str] | None:
+    """Split ``rrule`` for the fast path; None for anything dateutil should judge instead."""
+    parts: dict[str, str] = {}
+    for chunk in normalize_rrule(rrule).split(";"):
+        key, sep, value = chunk.partition("=")
+        if not sep or not value or key in parts:
+            return None
+        parts[key] = value
+    return parts
+
+
+def _daily_dates(first: date, lo: date, hi: date, *, interval: int) -> Iterator[date]:
+    skip = max(0, -(-(lo - first).days // interval))
+    for ordinal in range(first.toordinal() + skip * interval, hi.toordinal() + 1, interval):
+        yield date.fromordinal(ordinal)
+
+
+def _weekly_dates(
+    first: date, lo: date, hi: date, *, interval: int, weekdays: tuple[int, ...]
+) -> Iterator[date]:
+    # Weeks start on Monday (dateutil's default WKST) and are counted from dtstart's week.
+    week_start = first.toordinal() - first.weekday()
+    step = 7 * interval
+    skip = max(0, (lo.toordinal() - week_start) // step)
+    for base in range(week_start + skip * step, hi.toordinal() + 1, step):
+        for weekday in weekdays:
+            yield date.fromordinal(base + weekday)
+
+
+def _months(first: date, lo: date, hi: date, *, interval: int) -> Iterator[tuple[int, int]]:
+    first_index = first.year * 12 + first.month - 1
+    skip = max(0, (lo.year * 12 + lo.month - 1 - first_index) // interval)
+    for index in range(first_index + skip * interval, hi.year * 12 + hi.month, interval):
+        year, month_offset = divmod(index, 12)
+        yield year, month_offset + 1
+
+
+def _monthday_dates(
+    first: date, lo: date, hi: date, *, interval: int, monthday: int
+) -> Iterator[date]:
+    for year, month in _months(first, lo, hi, interval=interval):
+        # Like dateutil, months too short for the day are skipped rather than clamped.
+        if monthday <= calendar.monthrange(year, month)[1]:
+            yield date(year, month, monthday)
+
+
+def _nth_weekday_dates(
+    first: date, lo: date, hi: date, *, interval: int, weekday: int, setpos: tuple[int, ...]
+) -> Iterator[date]:
+    for year, month in _months(first, lo, hi, interval=interval):
+        first_match = 1 + (weekday - calendar.weekday(year, month, 1)) % 7
+        matches = range(first_match, calendar.monthrange(year, month)[1] + 1, 7)
+        picked = {matches[pos - 1 if pos > 0 else pos] for pos in setpos if pos <= len(matches)}
+        for day in sorted(picked):
+            yield date(year, month, day)
+
+
+def _monthly_expander(parts: dict[str, str], *, interval: int) -> _DateExpander | None:
+    keys = parts.keys() - {"FREQ", "INTERVAL"}
+    if keys == {"BYMONTHDAY"}:
+        monthday = parts["BYMONTHDAY"]
+        if monthday.isdigit() and 1 <= int(monthday) <= 31:
+            return functools.partial(_monthday_dates, interval=interval, monthday=int(monthday))
+        return None
+    if keys == {"BYDAY", "BYSETPOS"} and parts["BYDAY"] in _WEEKDAY_INDEX:
+        setpos = tuple(int(p) for p in parts["BYSETPOS"].split(",") if p.lstrip("-").isdigit())
+        if setpos and all(p in _SETPOS_LABELS for p in setpos):
+            return functools.partial(
+                _nth_weekday_dates,
+                interval=interval,
+                weekday=_WEEKDAY_INDEX[parts["BYDAY"]],
+                setpos=setpos,
+            )
+    return None
+
+
+def _fast_date_expander(rrule: str) -> _DateExpander | None:
+    """Return an arithmetic expander for the rule shapes ``build_rrule`` generates."""
+    parts = _strict_rrule_parts(rrule)
+    if parts is None:
+        return None
+    interval_text = parts.get("INTERVAL", "1")
+    if not interval_text.isdigit() or int(interval_text) < 1:
+        return None
+    interval = int(interval_text)
+
+    freq = parts.get("FREQ")
+    if freq == "DAILY" and parts.keys() <= {"FREQ", "INTERVAL"}:
+        return functools.partial(_daily_dates, interval=interval)
+    if freq == "WEEKLY" and parts.keys() == {"FREQ", "INTERVAL", "BYDAY"}:
+        days = parts["BYDAY"].split(",")
+        if not all(day in _WEEKDAY_INDEX for day in days):
+            return None
+        weekdays = tuple(sorted({_WEEKDAY_INDEX[day] for day in days}))
+        return functools.partial(_weekly_dates, interval=interval, weekdays=weekdays)
+    if freq == "MONTHLY":
+        return _monthly_expander(parts, interval=interval)
+    return None
+
+
+def expand_between(
+    *,
+    rrule: str,
+    dtstart: datetime,
+    start: datetime,
+    end: datetime,
+    tz: tzinfo | None = None,
+) -> list[datetime]:
+    """Return the occurrences of ``rrule`` with ``start <= occurrence < end``, in order.
+
+    The rule is expanded in ``tz`` (default: ``dtstart``'s zone), so occurrences keep their
+    wall-clock time across DST changes, and are returned as aware datetimes in that zone.
+    Naive inputs are treated as UTC. The DAILY/WEEKLY/MONTHLY shapes ``build_rrule`` builds
+    are computed arithmetically, jumping straight to the window; any other rule falls back
+    to dateutil, which walks every occurrence from ``dtstart``.
+    """
+    dtstart = _as_aware_utc(dtstart)
+    start = _as_aware_utc(start)
+    end = _as_aware_utc(end)
+    if end <= start:
+        return []
+    zone = tz if tz is not None else dtstart.tzinfo or UTC
+    # dateutil drops microseconds from dtstart.
+    local_dtstart = dtstart.astimezone(zone).replace(microsecond=0)
+
+    expand_dates = _fast_date_expander(rrule)
+    if expand_dates is None:
+        rule = compile_rrule(rrule, dtstart=local_dtstart)
+        return [dt for dt in rule.between(start, end, inc=True) if dt < end]
+
+    # Pad a day on each side: which local dates the window covers depends on the UTC offset.
+    lo = start.astimezone(zone).date() - timedelta(days=1)
+    hi = end.astimezone(zone).date() + timedelta(days=1)
+    wall_time = local_dtstart.time()
+    out: list[datetime] = []
+    for day in expand_dates(local_dtstart.date(), lo, hi):
+        occurrence = datetime.combine(day, wall_time, tzinfo=zone)
+        if occurrence >= local_dtstart and start <= occurrence < end:
+            out.append(occurrence)
+    return out
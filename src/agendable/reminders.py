@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import smtplib
+import threading
+import time
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from email.message import EmailMessage
-from typing import Protocol
+from typing import Any, Protocol
+
+import aiosmtplib
+import httpx
 
 from agendable.db.models import Reminder, ReminderChannel
 from agendable.settings import Settings
@@ -18,11 +24,33 @@ class ReminderEmail:
     meeting_title: str
     scheduled_at: datetime
     incomplete_tasks: list[str] = field(default_factory=list)
+    idempotency_key: str | None = None
+
+
+@dataclass(slots=True)
+class ReminderDigest:
+    recipient_email: str
+    reminders: list[ReminderEmail]
 
 
 class ReminderSender(Protocol):
     async def send_email_reminder(self, reminder: ReminderEmail) -> None: ...
 
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        # Senders without a combined message fall back to one message per reminder.
+        for reminder in digest.reminders:
+            await self.send_email_reminder(reminder)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class SlackReminderSender(Protocol):
+    async def send_slack_reminder(self, reminder: ReminderEmail) -> None: ...
+
+    async def aclose(self) -> None:
+        return None
+
 
 @dataclass(slots=True)
 class ReminderDeliveryError(Exception):
@@ -46,48 +74,93 @@ def classify_smtp_error(exc: Exception) -> ReminderDeliveryError:
         (
             smtplib.SMTPConnectError,
             smtplib.SMTPServerDisconnected,
+            aiosmtplib.SMTPConnectError,
+            aiosmtplib.SMTPServerDisconnected,
             TimeoutError,
         ),
     ):
         return TransientReminderDeliveryError("smtp_unavailable")
 
-    if isinstance(exc, smtplib.SMTPAuthenticationError):
+    if isinstance(exc, (smtplib.SMTPAuthenticationError, aiosmtplib.SMTPAuthenticationError)):
         return TerminalReminderDeliveryError("smtp_auth_failed")
 
-    if isinstance(exc, smtplib.SMTPResponseException):
-        if 400 <= exc.smtp_code < 500:
+    response_code = _smtp_response_code(exc)
+    if response_code is not None:
+        if 400 <= response_code < 500:
             return TransientReminderDeliveryError("smtp_transient_response")
         return TerminalReminderDeliveryError("smtp_permanent_response")
 
     return TerminalReminderDeliveryError("smtp_unknown")
 
 
+def _smtp_response_code(exc: Exception) -> int | None:
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code
+    if isinstance(exc, aiosmtplib.SMTPResponseException):
+        return exc.code
+    # Reminders have a single recipient, so its refusal code stands for the whole send.
+    if isinstance(exc, smtplib.SMTPRecipientsRefused) and exc.recipients:
+        return next(iter(exc.recipients.values()))[0]
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused) and exc.recipients:
+        return exc.recipients[0].code
+    return None
+
+
+IDEMPOTENCY_KEY_HEADER = "X-Agendable-Idempotency-Key"
+
+
+def reminder_idempotency_key(reminder_id: uuid.UUID, attempt: int) -> str:
+    """Identify one delivery attempt of a reminder; a retry or re-send gets a new key."""
+    return f"{reminder_id}:{attempt}"
+
+
 def as_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
     return dt.astimezone(UTC)
 
 
-def build_default_email_reminder(
-    occurrence_id: uuid.UUID,
+def default_reminder_send_at(
     occurrence_scheduled_at: datetime,
     settings: Settings,
     lead_minutes_before: int | None = None,
-) -> Reminder:
+) -> datetime:
     configured_minutes = (
         settings.default_email_reminder_minutes_before
         if lead_minutes_before is None
         else lead_minutes_before
     )
     lead_minutes = max(configured_minutes, 0)
-    scheduled_at_utc = as_utc(occurrence_scheduled_at)
-    send_at = scheduled_at_utc - timedelta(minutes=lead_minutes)
+    return as_utc(occurrence_scheduled_at) - timedelta(minutes=lead_minutes)
+
+
+def default_email_reminder_values(
+    occurrence_id: uuid.UUID,
+    occurrence_scheduled_at: datetime,
+    settings: Settings,
+    lead_minutes_before: int | None = None,
+) -> dict[str, Any]:
+    """Column values of an occurrence's default email reminder, e.g. for a bulk insert."""
+    send_at = default_reminder_send_at(occurrence_scheduled_at, settings, lead_minutes_before)
+    return {
+        "occurrence_id": occurrence_id,
+        "channel": ReminderChannel.email,
+        "send_at": send_at,
+        "next_attempt_at": send_at,
+        "sent_at": None,
+    }
+
+
+def build_default_email_reminder(
+    occurrence_id: uuid.UUID,
+    occurrence_scheduled_at: datetime,
+    settings: Settings,
+    lead_minutes_before: int | None = None,
+) -> Reminder:
     return Reminder(
-        occurrence_id=occurrence_id,
-        channel=ReminderChannel.email,
-        send_at=send_at,
-        next_attempt_at=send_at,
-        sent_at=None,
+        **default_email_reminder_values(
+            occurrence_id, occurrence_scheduled_at, settings, lead_minutes_before
+        )
     )
 
 
@@ -95,6 +168,178 @@ class NoopReminderSender:
     async def send_email_reminder(self, reminder: ReminderEmail) -> None:
         _ = reminder
 
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        _ = digest
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _incomplete_task_lines(reminder: ReminderEmail) -> list[str]:
+    if reminder.incomplete_tasks:
+        return [f"- {task_title}" for task_title in reminder.incomplete_tasks]
+    return ["- None"]
+
+
+def build_reminder_message(reminder: ReminderEmail, *, from_email: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = f"Reminder: {reminder.meeting_title}"
+    message["From"] = from_email
+    message["To"] = reminder.recipient_email
+    if reminder.idempotency_key is not None:
+        message[IDEMPOTENCY_KEY_HEADER] = reminder.idempotency_key
+    body_lines = [
+        f"Reminder for: {reminder.meeting_title}",
+        f"Scheduled at: {reminder.scheduled_at.isoformat()}",
+        "",
+        "Incomplete tasks:",
+        *_incomplete_task_lines(reminder),
+    ]
+
+    message.set_content("\n".join(body_lines))
+    return message
+
+
+def build_reminder_digest_message(digest: ReminderDigest, *, from_email: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = f"Reminder: {len(digest.reminders)} upcoming meetings"
+    message["From"] = from_email
+    message["To"] = digest.recipient_email
+    # One header per merged reminder, so each attempt stays traceable in the digest.
+    for reminder in digest.reminders:
+        if reminder.idempotency_key is not None:
+            message[IDEMPOTENCY_KEY_HEADER] = reminder.idempotency_key
+    body_lines = [f"You have {len(digest.reminders)} upcoming meetings."]
+    for reminder in sorted(digest.reminders, key=lambda item: item.scheduled_at):
+        body_lines.extend(
+            [
+                "",
+                f"Reminder for: {reminder.meeting_title}",
+                f"Scheduled at: {reminder.scheduled_at.isoformat()}",
+                "Incomplete tasks:",
+                *_incomplete_task_lines(reminder),
+            ]
+        )
+
+    message.set_content("\n".join(body_lines))
+    return message
+
+
+@dataclass(slots=True)
+class _PooledSmtpConnection:
+    smtp: smtplib.SMTP
+    messages_sent: int = 0
+    last_used_at: float = 0.0
+
+
+class SmtpConnectionPool:
+    """Thread-safe pool of authenticated SMTP sessions reused across messages.
+
+    Sessions are retired after ``max_messages_per_connection`` messages or once they sit idle
+    longer than ``idle_timeout_seconds``. A send on a reused session that finds the server
+    gone is retried once on a fresh session; other errors propagate unchanged so callers can
+    classify them with ``classify_smtp_error``.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: Callable[[], smtplib.SMTP],
+        max_messages_per_connection: int,
+        idle_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._connect = connect
+        self._max_messages_per_connection = max(max_messages_per_connection, 1)
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._idle: list[_PooledSmtpConnection] = []
+        self._lock = threading.Lock()
+
+    def send(self, message: EmailMessage) -> None:
+        connection, reused = self._acquire()
+        try:
+            connection.smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            _close_quietly(connection.smtp)
+            if not reused:
+                raise
+            self._send_on_fresh_connection(message)
+            return
+        except Exception as exc:
+            if _smtp_session_still_usable(exc):
+                self._release(connection)
+            else:
+                _close_quietly(connection.smtp)
+            raise
+        self._release(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            _quit_quietly(connection.smtp)
+
+    def _send_on_fresh_connection(self, message: EmailMessage) -> None:
+        connection = _PooledSmtpConnection(smtp=self._connect())
+        try:
+            connection.smtp.send_message(message)
+        except Exception:
+            _close_quietly(connection.smtp)
+            raise
+        self._release(connection)
+
+    def _acquire(self) -> tuple[_PooledSmtpConnection, bool]:
+        now = self._clock()
+        expired: list[_PooledSmtpConnection] = []
+        selected: _PooledSmtpConnection | None = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used_at > self._idle_timeout_seconds:
+                    expired.append(candidate)
+                    continue
+                selected = candidate
+                break
+        for connection in expired:
+            _quit_quietly(connection.smtp)
+
+        if selected is not None:
+            return selected, True
+        return _PooledSmtpConnection(smtp=self._connect()), False
+
+    def _release(self, connection: _PooledSmtpConnection) -> None:
+        connection.messages_sent += 1
+        if connection.messages_sent >= self._max_messages_per_connection:
+            _quit_quietly(connection.smtp)
+            return
+        connection.last_used_at = self._clock()
+        with self._lock:
+            self._idle.append(connection)
+
+
+def _smtp_session_still_usable(exc: Exception) -> bool:
+    # Both clients reset the transaction after a rejected sender/recipient/data response, so
+    # the session can carry the next message unless the server announced it is closing (421).
+    if isinstance(exc, (smtplib.SMTPRecipientsRefused, aiosmtplib.SMTPRecipientsRefused)):
+        return True
+    response_code = _smtp_response_code(exc)
+    return response_code is not None and response_code != 421
+
+
+def _quit_quietly(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:
+        _close_quietly(smtp)
+
+
+def _close_quietly(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.close()
+    except Exception:
+        return
+
 
 class SmtpReminderSender:
     def __init__(
@@ -108,6 +353,8 @@ class SmtpReminderSender:
         use_ssl: bool,
         use_starttls: bool,
         timeout_seconds: float,
+        max_messages_per_connection: int = 100,
+        idle_timeout_seconds: float = 30.0,
     ) -> None:
         self.host = host
         self.port = port
@@ -117,42 +364,41 @@ class SmtpReminderSender:
         self.use_ssl = use_ssl
         self.use_starttls = use_starttls
         self.timeout_seconds = timeout_seconds
+        self.pool = SmtpConnectionPool(
+            connect=self._connect,
+            max_messages_per_connection=max_messages_per_connection,
+            idle_timeout_seconds=idle_timeout_seconds,
+        )
 
     async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        await self._send(build_reminder_message(reminder, from_email=self.from_email))
+
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        await self._send(build_reminder_digest_message(digest, from_email=self.from_email))
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.pool.close)
+
+    async def _send(self, message: EmailMessage) -> None:
         try:
-            await asyncio.to_thread(self._send_sync, reminder)
+            await asyncio.to_thread(self.pool.send, message)
         except Exception as exc:
             raise classify_smtp_error(exc) from exc
 
-    def _send_sync(self, reminder: ReminderEmail) -> None:
-        message = EmailMessage()
-        message["Subject"] = f"Reminder: {reminder.meeting_title}"
-        message["From"] = self.from_email
-        message["To"] = reminder.recipient_email
-        body_lines = [
-            f"Reminder for: {reminder.meeting_title}",
-            f"Scheduled at: {reminder.scheduled_at.isoformat()}",
-            "",
-            "Incomplete tasks:",
-        ]
-        if reminder.incomplete_tasks:
-            body_lines.extend([f"- {task_title}" for task_title in reminder.incomplete_tasks])
-        else:
-            body_lines.append("- None")
-
-        message.set_content("\n".join(body_lines))
-
+    def _connect(self) -> smtplib.SMTP:
+        smtp: smtplib.SMTP
         if self.use_ssl:
-            with smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout_seconds) as smtp:
-                self._login_if_configured(smtp)
-                smtp.send_message(message)
-            return
-
-        with smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds) as smtp:
-            if self.use_starttls:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout_seconds)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if not self.use_ssl and self.use_starttls:
                 smtp.starttls()
             self._login_if_configured(smtp)
-            smtp.send_message(message)
+        except Exception:
+            _close_quietly(smtp)
+            raise
+        return smtp
 
     def _login_if_configured(self, smtp: smtplib.SMTP) -> None:
         if self.username is None:
@@ -162,11 +408,467 @@ class SmtpReminderSender:
         smtp.login(self.username, self.password)
 
 
+@dataclass(slots=True)
+class _PooledAsyncSmtpConnection:
+    smtp: aiosmtplib.SMTP
+    messages_sent: int = 0
+    last_used_at: float = 0.0
+
+
+class AsyncSmtpConnectionPool:
+    """Event-loop counterpart of ``SmtpConnectionPool`` for ``aiosmtplib`` sessions.
+
+    Each in-flight send holds its own session, so the pool grows to the delivery
+    concurrency and idle sessions are reused by the next send.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: Callable[[], Awaitable[aiosmtplib.SMTP]],
+        max_messages_per_connection: int,
+        idle_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._connect = connect
+        self._max_messages_per_connection = max(max_messages_per_connection, 1)
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._idle: list[_PooledAsyncSmtpConnection] = []
+
+    async def send(self, message: EmailMessage) -> None:
+        connection, reused = await self._acquire()
+        try:
+            await connection.smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            await _aclose_quietly(connection.smtp)
+            if not reused:
+                raise
+            await self._send_on_fresh_connection(message)
+            return
+        except Exception as exc:
+            if _smtp_session_still_usable(exc):
+                await self._release(connection)
+            else:
+                await _aclose_quietly(connection.smtp)
+            raise
+        await self._release(connection)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await _aquit_quietly(connection.smtp)
+
+    async def _send_on_fresh_connection(self, message: EmailMessage) -> None:
+        connection = _PooledAsyncSmtpConnection(smtp=await self._connect())
+        try:
+            await connection.smtp.send_message(message)
+        except Exception:
+            await _aclose_quietly(connection.smtp)
+            raise
+        await self._release(connection)
+
+    async def _acquire(self) -> tuple[_PooledAsyncSmtpConnection, bool]:
+        now = self._clock()
+        while self._idle:
+            candidate = self._idle.pop()
+            expired = now - candidate.last_used_at > self._idle_timeout_seconds
+            if expired or not candidate.smtp.is_connected:
+                await _aquit_quietly(candidate.smtp)
+                continue
+            return candidate, True
+        return _PooledAsyncSmtpConnection(smtp=await self._connect()), False
+
+    async def _release(self, connection: _PooledAsyncSmtpConnection) -> None:
+        connection.messages_sent += 1
+        if connection.messages_sent >= self._max_messages_per_connection:
+            await _aquit_quietly(connection.smtp)
+            return
+        connection.last_used_at = self._clock()
+        self._idle.append(connection)
+
+
+async def _aquit_quietly(smtp: aiosmtplib.SMTP) -> None:
+    if not smtp.is_connected:
+        return
+    try:
+        await smtp.quit()
+    except Exception:
+        await _aclose_quietly(smtp)
+
+
+async def _aclose_quietly(smtp: aiosmtplib.SMTP) -> None:
+    try:
+        smtp.close()
+    except Exception:
+        return
+
+
+class AsyncSmtpReminderSender:
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        from_email: str,
+        username: str | None,
+        password: str | None,
+        use_ssl: bool,
+        use_starttls: bool,
+        timeout_seconds: float,
+        max_messages_per_connection: int = 100,
+        idle_timeout_seconds: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.from_email = from_email
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.use_starttls = use_starttls
+        self.timeout_seconds = timeout_seconds
+        self.pool = AsyncSmtpConnectionPool(
+            connect=self._connect,
+            max_messages_per_connection=max_messages_per_connection,
+            idle_timeout_seconds=idle_timeout_seconds,
+        )
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        await self._send(build_reminder_message(reminder, from_email=self.from_email))
+
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        await self._send(build_reminder_digest_message(digest, from_email=self.from_email))
+
+    async def aclose(self) -> None:
+        await self.pool.close()
+
+    async def _send(self, message: EmailMessage) -> None:
+        try:
+            await self.pool.send(message)
+        except Exception as exc:
+            raise classify_smtp_error(exc) from exc
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            timeout=self.timeout_seconds,
+            use_tls=self.use_ssl,
+            start_tls=self.use_starttls and not self.use_ssl,
+        )
+        await smtp.connect()
+        try:
+            if self.username is not None and self.password is not None:
+                await smtp.login(self.username, self.password)
+        except Exception:
+            await _aclose_quietly(smtp)
+            raise
+        return smtp
+
+
+def build_slack_reminder_text(reminder: ReminderEmail) -> str:
+    lines = [
+        f"*Reminder:* {reminder.meeting_title}",
+        f"Scheduled at: {reminder.scheduled_at.isoformat()}",
+        f"For: {reminder.recipient_email}",
+        "",
+        "Incomplete tasks:",
+        *_incomplete_task_lines(reminder),
+    ]
+    return "\n".join(lines)
+
+
+def classify_slack_response(response: httpx.Response) -> ReminderDeliveryError:
+    if response.status_code == 429:
+        return TransientReminderDeliveryError("slack_rate_limited")
+    if response.status_code >= 500:
+        return TransientReminderDeliveryError("slack_transient_response")
+    # Slack answers 4xx for bad payloads and for revoked, archived, or missing channels.
+    return TerminalReminderDeliveryError("slack_permanent_response")
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    try:
+        return max(float(response.headers.get("Retry-After", "1")), 0.0)
+    except ValueError:
+        return 1.0
+
+
+_SLACK_RATE_LIMIT_RETRIES = 3
+
+
+@dataclass(slots=True)
+class _SlackWebhookQueue:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Monotonic time before which Slack asked us not to post to this webhook again.
+    blocked_until: float = 0.0
+
+
+class SlackWebhookReminderSender:
+    """Posts reminders to Slack incoming webhooks over one shared keep-alive client.
+
+    Posts to the same webhook are queued one at a time, because Slack rate-limits per
+    webhook. A 429 pauses that webhook's queue for ``Retry-After`` seconds, then retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        webhook_url: str,
+        timeout_seconds: float,
+        max_retry_after_seconds: float = 30.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.webhook_url = webhook_url
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.client = client if client is not None else httpx.AsyncClient(timeout=timeout_seconds)
+        self._owns_client = client is None
+        self._queues: dict[str, _SlackWebhookQueue] = {}
+
+    async def send_slack_reminder(self, reminder: ReminderEmail) -> None:
+        await self.post(self.webhook_url, {"text": build_slack_reminder_text(reminder)})
+
+    async def post(self, webhook_url: str, payload: dict[str, object]) -> None:
+        queue = self._queues.setdefault(webhook_url, _SlackWebhookQueue())
+        async with queue.lock:
+            rate_limited_posts = 0
+            while True:
+                wait_seconds = queue.blocked_until - time.monotonic()
+                if wait_seconds > 0:
+                    await asyncio.sleep(wait_seconds)
+
+                try:
+                    response = await self.client.post(webhook_url, json=payload)
+                except httpx.HTTPError as exc:
+                    raise TransientReminderDeliveryError("slack_unavailable") from exc
+
+                if response.is_success:
+                    return
+                if response.status_code != 429:
+                    raise classify_slack_response(response)
+
+                retry_after = _retry_after_seconds(response)
+                queue.blocked_until = time.monotonic() + retry_after
+                rate_limited_posts += 1
+                if (
+                    retry_after > self.max_retry_after_seconds
+                    or rate_limited_posts > _SLACK_RATE_LIMIT_RETRIES
+                ):
+                    # Too long to hold the run; let the reminder's own retry backoff take it.
+                    raise classify_slack_response(response)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+
+def classify_email_api_response(response: httpx.Response) -> ReminderDeliveryError:
+    if response.status_code == 429 or response.status_code >= 500:
+        return TransientReminderDeliveryError("email_api_transient_response")
+    if response.status_code in (401, 403):
+        return TerminalReminderDeliveryError("email_api_auth_failed")
+    return TerminalReminderDeliveryError("email_api_permanent_response")
+
+
+def classify_email_api_result(result: object) -> ReminderDeliveryError | None:
+    status = result.get("status") if isinstance(result, dict) else None
+    if status == "accepted":
+        return None
+    if status == "deferred":
+        return TransientReminderDeliveryError("email_api_deferred")
+    if status == "rejected":
+        return TerminalReminderDeliveryError("email_api_rejected")
+    # No verdict for this message: it may or may not have been queued, so retry it.
+    return TransientReminderDeliveryError("email_api_result_missing")
+
+
+def _email_api_payload(message: EmailMessage) -> dict[str, object]:
+    # Only custom headers are forwarded; a digest's repeated keys travel as one list.
+    headers: dict[str, str] = {}
+    for name in dict.fromkeys(message.keys()):
+        if name.startswith("X-"):
+            headers[name] = ", ".join(str(value) for value in message.get_all(name, []))
+    return {
+        "from": message["From"],
+        "to": message["To"],
+        "subject": message["Subject"],
+        "text": message.get_content(),
+        "headers": headers,
+    }
+
+
+@dataclass(slots=True)
+class _QueuedApiMessage:
+    payload: dict[str, object]
+    result: asyncio.Future[None]
+
+
+class HttpBatchEmailReminderSender:
+    """Sends reminder emails through an HTTP bulk-send API, many messages per request.
+
+    Concurrent sends are coalesced: a request goes out once ``batch_size`` messages are
+    queued or ``linger_seconds`` after the first one, whichever comes first. Each caller
+    waits for its own message's verdict, so a rejection fails only that reminder.
+
+    The API takes ``{"messages": [{"id", "from", "to", "subject", "text", "headers"}]}``
+    and answers ``{"results": [{"id", "status"}]}`` with ``status`` one of ``accepted``,
+    ``deferred`` or ``rejected``.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        api_key: str | None,
+        from_email: str,
+        timeout_seconds: float,
+        batch_size: int = 100,
+        linger_seconds: float = 0.05,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.api_url = api_url
+        self.from_email = from_email
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key is not None else None
+        self.client = (
+            client
+            if client is not None
+            else httpx.AsyncClient(timeout=timeout_seconds, headers=headers)
+        )
+        self._owns_client = client is None
+        self._pending: list[_QueuedApiMessage] = []
+        self._linger_task: asyncio.Task[None] | None = None
+        self._posts: set[asyncio.Task[None]] = set()
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        await self._submit(build_reminder_message(reminder, from_email=self.from_email))
+
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        await self._submit(build_reminder_digest_message(digest, from_email=self.from_email))
+
+    async def aclose(self) -> None:
+        if self._linger_task is not None:
+            await self._linger_task
+        if self._posts:
+            await asyncio.gather(*self._posts)
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _submit(self, message: EmailMessage) -> None:
+        result: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append(_QueuedApiMessage(payload=_email_api_payload(message), result=result))
+        if len(self._pending) >= self.batch_size:
+            post = asyncio.create_task(self._post_batch(self._take_batch()))
+            self._posts.add(post)
+            post.add_done_callback(self._posts.discard)
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._post_after_linger())
+        await result
+
+    def _take_batch(self) -> list[_QueuedApiMessage]:
+        batch = self._pending[: self.batch_size]
+        del self._pending[: self.batch_size]
+        return batch
+
+    async def _post_after_linger(self) -> None:
+        await asyncio.sleep(self.linger_seconds)
+        self._linger_task = None
+        if self._pending:
+            await self._post_batch(self._take_batch())
+
+    async def _post_batch(self, batch: list[_QueuedApiMessage]) -> None:
+        # Whatever goes wrong, every caller gets a verdict; a pending one would wait forever.
+        try:
+            await self._deliver_batch(batch)
+        except Exception as exc:
+            _settle_all(batch, lambda: TransientReminderDeliveryError("email_api_error"), exc)
+
+    async def _deliver_batch(self, batch: list[_QueuedApiMessage]) -> None:
+        messages = [{"id": str(index), **queued.payload} for index, queued in enumerate(batch)]
+        try:
+            response = await self.client.post(self.api_url, json={"messages": messages})
+        except httpx.HTTPError as exc:
+            _settle_all(batch, lambda: TransientReminderDeliveryError("email_api_unavailable"), exc)
+            return
+        if not response.is_success:
+            _settle_all(batch, lambda: classify_email_api_response(response), None)
+            return
+
+        try:
+            body = response.json()
+        except ValueError as exc:
+            _settle_all(
+                batch, lambda: TransientReminderDeliveryError("email_api_result_missing"), exc
+            )
+            return
+        results = body.get("results") if isinstance(body, dict) else None
+        results_by_id = {
+            str(result.get("id")): result
+            for result in (results if isinstance(results, list) else [])
+            if isinstance(result, dict)
+        }
+        for index, queued in enumerate(batch):
+            error = classify_email_api_result(results_by_id.get(str(index)))
+            _settle(queued, error, None)
+
+
+def _settle(
+    queued: _QueuedApiMessage, error: ReminderDeliveryError | None, cause: Exception | None
+) -> None:
+    # A caller that gave up (was cancelled) has no one left to tell.
+    if queued.result.done():
+        return
+    if error is None:
+        queued.result.set_result(None)
+        return
+    error.__cause__ = cause
+    queued.result.set_exception(error)
+
+
+def _settle_all(
+    batch: list[_QueuedApiMessage],
+    make_error: Callable[[], ReminderDeliveryError],
+    cause: Exception | None,
+) -> None:
+    for queued in batch:
+        # Each caller raises its own instance so tracebacks don't grow across reminders.
+        _settle(queued, make_error(), cause)
+
+
+def build_slack_reminder_sender(settings: Settings) -> SlackReminderSender | None:
+    if settings.slack_webhook_url is None:
+        return None
+
+    return SlackWebhookReminderSender(
+        webhook_url=settings.slack_webhook_url.get_secret_value(),
+        timeout_seconds=settings.slack_timeout_seconds,
+        max_retry_after_seconds=settings.slack_max_retry_after_seconds,
+    )
+
+
 def build_reminder_sender(settings: Settings) -> ReminderSender:
+    if settings.email_api_url is not None and settings.smtp_from_email is not None:
+        return HttpBatchEmailReminderSender(
+            api_url=settings.email_api_url,
+            api_key=(
+                settings.email_api_key.get_secret_value()
+                if settings.email_api_key is not None
+                else None
+            ),
+            from_email=settings.smtp_from_email,
+            timeout_seconds=settings.email_api_timeout_seconds,
+            batch_size=settings.email_api_batch_size,
+            linger_seconds=settings.email_api_batch_linger_seconds,
+        )
+
     if settings.smtp_host is None or settings.smtp_from_email is None:
         return NoopReminderSender()
 
-    return SmtpReminderSender(
+    sender_cls = (
+        AsyncSmtpReminderSender if settings.smtp_transport == "asyncio" else SmtpReminderSender
+    )
+    return sender_cls(
         host=settings.smtp_host,
         port=settings.smtp_port,
         from_email=settings.smtp_from_email,
@@ -179,4 +881,6 @@ def build_reminder_sender(settings: Settings) -> ReminderSender:
         use_ssl=settings.smtp_use_ssl,
         use_starttls=settings.smtp_use_starttls,
         timeout_seconds=settings.smtp_timeout_seconds,
+        max_messages_per_connection=settings.smtp_pool_max_messages_per_connection,
+        idle_timeout_seconds=settings.smtp_pool_idle_timeout_seconds,
     )
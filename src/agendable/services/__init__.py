@@ -48,7 +48,11 @@ from agendable.services.oidc_service import (
     resolve_oidc_login_resolution,
     stage_user_provision_for_oidc,
 )
-from agendable.services.reminder_claim_service import claim_reminder_attempt
+from agendable.services.reminder_claim_service import (
+    claim_due_reminder_batch,
+    claim_reminder_attempt,
+    claim_upcoming_reminders_for_recipients,
+)
 from agendable.services.reminder_delivery_service import run_due_reminders
 
 __all__ = [
@@ -72,7 +76,9 @@ __all__ = [
     "add_agenda_item_for_occurrence",
     "add_attendee_by_email",
     "assignee_exists",
+    "claim_due_reminder_batch",
     "claim_reminder_attempt",
+    "claim_upcoming_reminders_for_recipients",
     "complete_occurrence_and_roll_forward",
     "convert_agenda_item_to_task",
     "create_task_for_occurrence",
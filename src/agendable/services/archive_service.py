@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import agendable.db as db
+from agendable.db.repos import ArchiveRepository
+from agendable.settings import Settings
+
+
+@dataclass(slots=True)
+class ArchiveStats:
+    reminders: int = 0
+    occurrences: int = 0
+    batches: int = 0
+
+
+async def _archive_in_batches(
+    *,
+    lock_ids: Callable[[ArchiveRepository], Awaitable[list[uuid.UUID]]],
+    move: Callable[[ArchiveRepository, list[uuid.UUID]], Awaitable[int]],
+    batch_size: int,
+    stats: ArchiveStats,
+    should_stop: Callable[[], bool] | None,
+) -> int:
+    moved = 0
+    while should_stop is None or not should_stop():
+        async with db.SessionMaker() as session:
+            archive_repo = ArchiveRepository(session)
+            ids = await lock_ids(archive_repo)
+            if not ids:
+                break
+            moved += await move(archive_repo, ids)
+            await session.commit()
+        stats.batches += 1
+        if len(ids) < batch_size:
+            break
+    return moved
+
+
+async def archive_expired_rows(
+    *, now: datetime, settings: Settings, should_stop: Callable[[], bool] | None = None
+) -> ArchiveStats:
+    """Move finished reminders and old completed occurrences into the archive tables.
+
+    Each batch of ``archive_batch_size`` rows is copied and deleted in its own transaction,
+    so a run never holds long locks on the hot tables. ``should_stop`` is checked before
+    each batch, so a shutting-down worker ends the run at the next batch boundary.
+    """
+    stats = ArchiveStats()
+    batch_size = settings.archive_batch_size
+
+    reminders_finished_before = now - timedelta(days=settings.archive_reminder_retention_days)
+    stats.reminders = await _archive_in_batches(
+        lock_ids=lambda repo: repo.lock_archivable_reminder_ids(
+            finished_before=reminders_finished_before, limit=batch_size
+        ),
+        move=lambda repo, ids: repo.move_reminders(ids, archived_at=now),
+        batch_size=batch_size,
+        stats=stats,
+        should_stop=should_stop,
+    )
+
+    occurrences_scheduled_before = now - timedelta(days=settings.archive_occurrence_retention_days)
+    stats.occurrences = await _archive_in_batches(
+        lock_ids=lambda repo: repo.lock_archivable_occurrence_ids(
+            scheduled_before=occurrences_scheduled_before, limit=batch_size
+        ),
+        move=lambda repo, ids: repo.move_occurrences(ids, archived_at=now),
+        batch_size=batch_size,
+        stats=stats,
+        should_stop=should_stop,
+    )
+    return stats
@@ -17,6 +17,7 @@ from agendable.db.repos import (
     MeetingOccurrenceRepository,
     MeetingSeriesRepository,
 )
+from agendable.reminders import as_utc
 from agendable.services.external_calendar_api import ExternalRecurringEventDetails
 from agendable.services.occurrence_service import OccurrenceService
 
@@ -101,10 +102,15 @@ class CalendarEventMappingService:
             return 0
 
         occurrence = linked_occurrence
-        if occurrence is None:
-            occurrence = await self._find_occurrence_by_schedule(
-                series_id=series.id,
-                scheduled_at=normalized_start,
+        if occurrence is None or as_utc(occurrence.scheduled_at) != normalized_start:
+            # A series has one occurrence per start time; an event moved onto a slot that
+            # already has one links to it instead of moving its own occurrence there.
+            occurrence = (
+                await self._find_occurrence_by_schedule(
+                    series_id=series.id,
+                    scheduled_at=normalized_start,
+                )
+                or occurrence
             )
 
         if occurrence is None:
@@ -13,6 +13,7 @@ from agendable.db.repos import (
     MeetingOccurrenceAttendeeRepository,
     MeetingOccurrenceRepository,
     MeetingSeriesRepository,
+    ReminderRepository,
     TaskRepository,
     UserRepository,
 )
@@ -94,6 +95,7 @@ class DevSeedService:
             attendees=self.attendees,
             series=self.series,
             occurrences=self.occurrences,
+            reminders=ReminderRepository(session),
         )
 
     async def seed(
@@ -193,6 +195,8 @@ class DevSeedService:
                 recurrence_timezone=series_spec.recurrence_timezone,
                 generate_count=series_spec.generate_count,
                 settings=self.settings,
+                # Seed data wants a full history and backlog of meetings to click through.
+                window_materialization=False,
             )
             return created_occurrences, 1, len(created_occurrences)
 
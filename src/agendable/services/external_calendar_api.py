@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 @dataclass(frozen=True)
@@ -48,10 +49,28 @@ class ExternalRecurringEventDetails:
     recurrence_timezone: str | None
 
 
+@dataclass(frozen=True)
+class ExternalCalendarPageCursor:
+    """Where an interrupted sync picks back up.
+
+    ``time_min`` is the start of the window a bootstrap sync was listing, since a page
+    token only holds for the query that issued it; incremental syncs leave it None.
+    """
+
+    page_token: str
+    time_min: datetime | None
+
+
 @dataclass(frozen=True)
 class ExternalCalendarSyncBatch:
+    """A sync's events, or one page of them; only the last page has ``next_sync_token``.
+
+    Every page but the last has ``resume_from``, the cursor of the page after it.
+    """
+
     events: Sequence[ExternalCalendarEvent]
     next_sync_token: str | None
+    resume_from: ExternalCalendarPageCursor | None = None
 
 
 class ExternalCalendarClient(Protocol):
@@ -90,3 +109,40 @@ class ExternalCalendarClient(Protocol):
         agendable_occurrence_id: str,
         agendable_occurrence_url: str | None,
     ) -> None: ...
+
+
+@runtime_checkable
+class PagedExternalCalendarClient(Protocol):
+    """A client that can hand over a sync's events one page at a time."""
+
+    def list_event_pages(
+        self,
+        *,
+        auth: ExternalCalendarAuth,
+        calendar_id: str,
+        sync_token: str | None,
+        resume_from: ExternalCalendarPageCursor | None = None,
+    ) -> AsyncIterator[ExternalCalendarSyncBatch]: ...
+
+
+async def iter_event_pages(
+    client: ExternalCalendarClient,
+    *,
+    auth: ExternalCalendarAuth,
+    calendar_id: str,
+    sync_token: str | None,
+    resume_from: ExternalCalendarPageCursor | None = None,
+) -> AsyncIterator[ExternalCalendarSyncBatch]:
+    """Yield a sync's events page by page, from ``resume_from`` when given.
+
+    Clients that can't page yield the whole sync as one batch and can't resume either.
+    """
+    if isinstance(client, PagedExternalCalendarClient):
+        pages = client.list_event_pages(
+            auth=auth, calendar_id=calendar_id, sync_token=sync_token, resume_from=resume_from
+        )
+        async with aclosing(pages):
+            async for page in pages:
+                yield page
+        return
+    yield await client.list_events(auth=auth, calendar_id=calendar_id, sync_token=sync_token)
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator
+from contextlib import aclosing, asynccontextmanager, suppress
 from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 from urllib.parse import quote
@@ -10,10 +14,33 @@ import httpx
 from agendable.services.external_calendar_api import (
     ExternalCalendarAuth,
     ExternalCalendarEvent,
+    ExternalCalendarPageCursor,
     ExternalCalendarSyncBatch,
     ExternalRecurringEventDetails,
 )
 
+# Idle keep-alive connections older than this are dropped rather than reused.
+_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+def build_google_http_client(
+    *, timeout_seconds: float = 15.0, max_connections: int = 20
+) -> httpx.AsyncClient:
+    """Build a keep-alive client for Google API calls, to share across calls and connections.
+
+    HTTP/2 is used when the optional ``h2`` package is installed, so concurrent calls to
+    the same Google host multiplex over one connection. The caller closes the client.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout_seconds,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
 
 def _parse_iso_datetime(value: str) -> datetime:
     normalized = value.strip()
@@ -154,6 +181,21 @@ def _append_agendable_link(description: str | None, url: str) -> str:
     return f"{rebuilt}\n\n{link_line}".strip()
 
 
+async def _get_events_page(
+    client: httpx.AsyncClient,
+    *,
+    url: str,
+    headers: dict[str, str],
+    params: dict[str, str],
+) -> dict[str, object]:
+    response = await client.get(url, headers=headers, params=params)
+    response.raise_for_status()
+    payload: object = response.json()
+    if not isinstance(payload, dict):
+        raise ValueError("Google Calendar events response must be a JSON object")
+    return payload
+
+
 def _event_url(*, api_base_url: str, calendar_id: str, event_id: str) -> str:
     encoded_event_id = quote(event_id, safe="")
     return f"{api_base_url}/calendars/{calendar_id}/events/{encoded_event_id}"
@@ -166,10 +208,21 @@ class GoogleCalendarHttpClient:
         api_base_url: str = "https://www.googleapis.com/calendar/v3",
         initial_sync_days_back: int = 90,
         timeout_seconds: float = 15.0,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.api_base_url = api_base_url.rstrip("/")
         self.initial_sync_days_back = max(1, initial_sync_days_back)
         self.timeout_seconds = timeout_seconds
+        self.client = client
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        # A shared client outlives the call; without one, each call opens its own.
+        if self.client is not None:
+            yield self.client
+            return
+        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+            yield client
 
     async def list_events(
         self,
@@ -180,56 +233,95 @@ class GoogleCalendarHttpClient:
     ) -> ExternalCalendarSyncBatch:
         events: list[ExternalCalendarEvent] = []
         next_sync_token: str | None = None
-        next_page_token: str | None = None
+        async with aclosing(
+            self.list_event_pages(auth=auth, calendar_id=calendar_id, sync_token=sync_token)
+        ) as pages:
+            async for page in pages:
+                events.extend(page.events)
+                next_sync_token = page.next_sync_token or next_sync_token
+        return ExternalCalendarSyncBatch(events=events, next_sync_token=next_sync_token)
 
+    async def list_event_pages(
+        self,
+        *,
+        auth: ExternalCalendarAuth,
+        calendar_id: str,
+        sync_token: str | None,
+        resume_from: ExternalCalendarPageCursor | None = None,
+    ) -> AsyncIterator[ExternalCalendarSyncBatch]:
+        """Yield events one page at a time, from ``resume_from`` when given.
+
+        Only the last page carries the next sync token; every other page carries the
+        cursor to resume after it. The next page is requested as soon as the current one
+        arrives, so its round trip overlaps with whatever the caller does with this page.
+        """
+        time_min: datetime | None = None
+        if sync_token is None:
+            # A resumed bootstrap keeps listing the window its page token was issued for.
+            time_min = resume_from.time_min if resume_from is not None else None
+            if time_min is None:
+                time_min = datetime.now(UTC).replace(microsecond=0) - timedelta(
+                    days=self.initial_sync_days_back
+                )
         headers = {"Authorization": f"Bearer {auth.access_token}"}
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-            while True:
-                params: dict[str, str] = {
-                    "showDeleted": "true",
-                    "maxResults": "2500",
-                    "singleEvents": "true",
-                }
-
-                if sync_token is not None:
-                    params["syncToken"] = sync_token
-                else:
-                    time_min = datetime.now(UTC) - timedelta(days=self.initial_sync_days_back)
-                    params["timeMin"] = (
-                        time_min.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        params = self._list_events_params(sync_token=sync_token, time_min=time_min)
+        first_params = (
+            params if resume_from is None else {**params, "pageToken": resume_from.page_token}
+        )
+        url = f"{self.api_base_url}/calendars/{calendar_id}/events"
+        async with self._http() as client:
+            fetch = asyncio.ensure_future(
+                _get_events_page(client, url=url, headers=headers, params=first_params)
+            )
+            try:
+                while True:
+                    payload = await fetch
+                    next_page_token = _optional_str(payload.get("nextPageToken"))
+                    if next_page_token is not None:
+                        fetch = asyncio.ensure_future(
+                            _get_events_page(
+                                client,
+                                url=url,
+                                headers=headers,
+                                params={**params, "pageToken": next_page_token},
+                            )
+                        )
+
+                    items = payload.get("items")
+                    yield ExternalCalendarSyncBatch(
+                        events=self._parse_items(items) if isinstance(items, list) else [],
+                        next_sync_token=_optional_str(payload.get("nextSyncToken")),
+                        resume_from=(
+                            ExternalCalendarPageCursor(
+                                page_token=next_page_token, time_min=time_min
+                            )
+                            if next_page_token is not None
+                            else None
+                        ),
                     )
-                    params["orderBy"] = "startTime"
-
-                if next_page_token is not None:
-                    params["pageToken"] = next_page_token
-
-                response = await client.get(
-                    f"{self.api_base_url}/calendars/{calendar_id}/events",
-                    headers=headers,
-                    params=params,
-                )
-                response.raise_for_status()
-
-                payload: dict[str, object] = response.json()
-                if not isinstance(payload, dict):
-                    raise ValueError("Google Calendar events response must be a JSON object")
-
-                items = payload.get("items")
-                if isinstance(items, list):
-                    events.extend(self._parse_items(items))
-
-                token = payload.get("nextSyncToken")
-                if isinstance(token, str) and token.strip():
-                    next_sync_token = token
-
-                page = payload.get("nextPageToken")
-                if isinstance(page, str) and page.strip():
-                    next_page_token = page
-                    continue
-
-                break
-
-        return ExternalCalendarSyncBatch(events=events, next_sync_token=next_sync_token)
+                    if next_page_token is None:
+                        return
+            finally:
+                # Collect the prefetch's outcome too, so a page nobody will read (or its
+                # failure) never surfaces as "Task exception was never retrieved".
+                fetch.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await fetch
+
+    def _list_events_params(
+        self, *, sync_token: str | None, time_min: datetime | None
+    ) -> dict[str, str]:
+        params: dict[str, str] = {
+            "showDeleted": "true",
+            "maxResults": "2500",
+            "singleEvents": "true",
+        }
+        if sync_token is not None:
+            params["syncToken"] = sync_token
+        elif time_min is not None:
+            params["timeMin"] = time_min.astimezone(UTC).isoformat().replace("+00:00", "Z")
+            params["orderBy"] = "startTime"
+        return params
 
     async def get_recurring_event_details(
         self,
@@ -240,7 +332,7 @@ class GoogleCalendarHttpClient:
     ) -> ExternalRecurringEventDetails | None:
         headers = {"Authorization": f"Bearer {auth.access_token}"}
         encoded_event_id = quote(recurring_event_id, safe="")
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.api_base_url}/calendars/{calendar_id}/events/{encoded_event_id}",
                 headers=headers,
@@ -285,7 +377,7 @@ class GoogleCalendarHttpClient:
             event_id=recurring_event_id,
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+        async with self._http() as client:
             current_resp = await client.get(event_url, headers=headers)
             current_resp.raise_for_status()
             payload_obj: object = current_resp.json()
@@ -340,7 +432,7 @@ class GoogleCalendarHttpClient:
             event_id=event_id,
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+        async with self._http() as client:
             current_resp = await client.get(event_url, headers=headers)
             current_resp.raise_for_status()
             payload_obj: object = current_resp.json()
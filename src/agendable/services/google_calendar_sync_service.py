@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol, cast
 
 import httpx
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+import agendable.db as db
 from agendable.db.models import (
     CalendarProvider,
     ExternalCalendarConnection,
@@ -24,8 +30,10 @@ from agendable.services.external_calendar_api import (
     ExternalCalendarAuth,
     ExternalCalendarClient,
     ExternalCalendarEvent,
+    ExternalCalendarPageCursor,
     ExternalCalendarSyncBatch,
     ExternalRecurringEventDetails,
+    iter_event_pages,
 )
 from agendable.settings import Settings
 
@@ -56,6 +64,34 @@ class GoogleCalendarConnectionNotFoundError(LookupError):
     pass
 
 
+@dataclass(slots=True)
+class _SeenRecurringEvents:
+    """Recurring masters already handled by earlier pages of the same sync."""
+
+    event_ids: set[str] = field(default_factory=set)
+    details_by_id: dict[str, ExternalRecurringEventDetails] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _SyncedPages:
+    event_count: int = 0
+    next_sync_token: str | None = None
+    # Stopped after a checkpoint because another sync of the connection took over.
+    handed_off: bool = False
+    recurring: _SeenRecurringEvents = field(default_factory=_SeenRecurringEvents)
+
+
+@dataclass(slots=True)
+class GoogleCalendarSyncRunStats:
+    connections: int = 0
+    synced: int = 0
+    failed: int = 0
+    # Not started because shutdown was requested, or disabled since the pass began.
+    skipped: int = 0
+    synced_event_count: int = 0
+    connection_latencies_ms: list[float] = field(default_factory=list)
+
+
 class GoogleCalendarSyncService:
     def __init__(
         self,
@@ -66,6 +102,7 @@ class GoogleCalendarSyncService:
         calendar_client: ExternalCalendarClient,
         event_mapper: CalendarEventMapper | None = None,
         settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.connection_repo = connection_repo
         self.event_mirror_repo = event_mirror_repo
@@ -73,6 +110,8 @@ class GoogleCalendarSyncService:
         self.calendar_client = calendar_client
         self.event_mapper = event_mapper
         self.settings = settings
+        # Shared keep-alive client for token refreshes; None opens one per refresh.
+        self.http_client = http_client
 
     @classmethod
     def from_repositories(
@@ -83,6 +122,7 @@ class GoogleCalendarSyncService:
         calendar_client: ExternalCalendarClient,
         event_mapper: CalendarEventMapper | None = None,
         settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> GoogleCalendarSyncService:
         return cls(
             connection_repo=connection_repo,
@@ -91,6 +131,7 @@ class GoogleCalendarSyncService:
             calendar_client=calendar_client,
             event_mapper=event_mapper,
             settings=settings,
+            http_client=http_client,
         )
 
     async def sync_connection(self, connection: ExternalCalendarConnection) -> int:
@@ -113,67 +154,165 @@ class GoogleCalendarSyncService:
         )
         sync_token_for_request = await self._resolve_sync_token_for_request(connection)
 
-        batch: ExternalCalendarSyncBatch
-
         try:
-            batch = await self.calendar_client.list_events(
-                auth=auth,
-                calendar_id=connection.external_calendar_id,
-                sync_token=sync_token_for_request,
+            synced = await self._sync_event_pages(
+                connection, auth=auth, sync_token=sync_token_for_request
             )
         except httpx.HTTPStatusError as exc:
-            status = exc.response.status_code
+            recovered = await self._retry_after_list_error(
+                connection, exc=exc, auth=auth, sync_token=sync_token_for_request
+            )
+            if recovered is None:
+                return 0
+            synced = recovered
 
-            # 401 typically indicates an expired/revoked access token.
-            if status == 401 and await self._refresh_google_access_token(connection):
-                # Persist the refreshed token immediately. This ensures access-token
-                # updates aren't lost if the sync fails later and the caller doesn't
-                # commit (e.g. manual sync routes that catch exceptions).
-                await self.connection_repo.commit()
-
-                # Re-acquire the per-connection sync lock, since the Postgres
-                # advisory xact lock is released by commits.
-                lock_acquired = await self._try_acquire_connection_sync_lock(connection)
-                if not lock_acquired:
-                    logger.info(
-                        "google calendar sync skipped: connection lock not reacquired after refresh connection_id=%s",
-                        connection.id,
-                    )
-                    return 0
-
-                access_token = self._require_access_token(connection)
-                auth = ExternalCalendarAuth(
-                    access_token=access_token,
-                    refresh_token=connection.refresh_token,
-                )
-                batch = await self.calendar_client.list_events(
-                    auth=auth,
-                    calendar_id=connection.external_calendar_id,
-                    sync_token=sync_token_for_request,
-                )
-            # 410 indicates the sync token is no longer valid; clear it and do a bootstrap sync.
-            elif status == 410 and sync_token_for_request is not None:
+        if synced.handed_off:
+            return synced.event_count
+        self._touch_successful_sync(connection, next_sync_token=synced.next_sync_token)
+        await self.connection_repo.commit()
+        return synced.event_count
+
+    async def _retry_after_list_error(
+        self,
+        connection: ExternalCalendarConnection,
+        *,
+        exc: httpx.HTTPStatusError,
+        auth: ExternalCalendarAuth,
+        sync_token: str | None,
+    ) -> _SyncedPages | None:
+        """Retry a sync the provider rejected, when the error is recoverable; else re-raise.
+
+        Returns None when the connection's sync lock was lost along the way.
+        """
+        status = exc.response.status_code
+
+        # 401 typically indicates an expired/revoked access token.
+        if status == 401 and await self._refresh_google_access_token(connection):
+            # Persist the refreshed token immediately. This ensures access-token
+            # updates aren't lost if the sync fails later and the caller doesn't
+            # commit (e.g. manual sync routes that catch exceptions).
+            await self.connection_repo.commit()
+
+            # Re-acquire the per-connection sync lock, since the Postgres
+            # advisory xact lock is released by commits.
+            lock_acquired = await self._try_acquire_connection_sync_lock(connection)
+            if not lock_acquired:
                 logger.info(
-                    "google calendar sync cursor expired; resetting connection_id=%s",
+                    "google calendar sync skipped: connection lock not reacquired after refresh connection_id=%s",
                     connection.id,
                 )
-                connection.sync_token = None
-                batch = await self.calendar_client.list_events(
-                    auth=auth,
-                    calendar_id=connection.external_calendar_id,
-                    sync_token=None,
+                return None
+
+            auth = ExternalCalendarAuth(
+                access_token=self._require_access_token(connection),
+                refresh_token=connection.refresh_token,
+            )
+            return await self._sync_event_pages(connection, auth=auth, sync_token=sync_token)
+
+        # 410 indicates the sync token is no longer valid; clear it and do a bootstrap sync.
+        if status == 410 and sync_token is not None:
+            logger.info(
+                "google calendar sync cursor expired; resetting connection_id=%s",
+                connection.id,
+            )
+            connection.sync_token = None
+            self._clear_sync_checkpoint(connection)
+            return await self._sync_event_pages(connection, auth=auth, sync_token=None)
+
+        # The checkpointed page token was rejected; start the sync over from its first page.
+        if status in (400, 410) and connection.sync_page_token is not None:
+            logger.info(
+                "google calendar sync checkpoint rejected; restarting connection_id=%s status=%s",
+                connection.id,
+                status,
+            )
+            self._clear_sync_checkpoint(connection)
+            return await self._sync_event_pages(connection, auth=auth, sync_token=sync_token)
+
+        raise exc
+
+    async def _sync_event_pages(
+        self,
+        connection: ExternalCalendarConnection,
+        *,
+        auth: ExternalCalendarAuth,
+        sync_token: str | None,
+    ) -> _SyncedPages:
+        """Upsert and map each page of events as it arrives, rather than the whole sync at once.
+
+        Progress is checkpointed on the connection after every page but the last, and a
+        sync with a checkpoint resumes from it.
+        """
+        synced = _SyncedPages()
+        pages = iter_event_pages(
+            self.calendar_client,
+            auth=auth,
+            calendar_id=connection.external_calendar_id,
+            sync_token=sync_token,
+            resume_from=self._resume_cursor(connection, sync_token=sync_token),
+        )
+        async with aclosing(pages):
+            async for page in pages:
+                touched_mirrors = await self._upsert_mirror_events(
+                    connection=connection, events=page.events
+                )
+                await self._map_mirrors_and_write_back(
+                    connection=connection, mirrors=touched_mirrors, seen=synced.recurring
                 )
-            else:
-                raise
+                synced.event_count += len(page.events)
+                synced.next_sync_token = page.next_sync_token or synced.next_sync_token
+                if page.resume_from is not None and not await self._checkpoint(
+                    connection, page.resume_from
+                ):
+                    synced.handed_off = True
+                    break
+        return synced
+
+    def _resume_cursor(
+        self, connection: ExternalCalendarConnection, *, sync_token: str | None
+    ) -> ExternalCalendarPageCursor | None:
+        page_token = connection.sync_page_token
+        if page_token is None:
+            return None
+        # Bootstrap checkpoints carry their window; one from the other kind of sync is stale.
+        if (sync_token is None) != (connection.sync_page_time_min is not None):
+            self._clear_sync_checkpoint(connection)
+            return None
+        logger.info(
+            "google calendar sync resuming from checkpoint connection_id=%s pages_processed=%s",
+            connection.id,
+            connection.sync_pages_processed,
+        )
+        time_min = connection.sync_page_time_min
+        if time_min is not None and time_min.tzinfo is None:
+            # SQLite hands timestamps back naive; they were stored in UTC.
+            time_min = time_min.replace(tzinfo=UTC)
+        return ExternalCalendarPageCursor(page_token=page_token, time_min=time_min)
+
+    async def _checkpoint(
+        self, connection: ExternalCalendarConnection, cursor: ExternalCalendarPageCursor
+    ) -> bool:
+        """Commit the pages written so far; False when another sync took the lock meanwhile."""
+        connection.sync_page_token = cursor.page_token
+        connection.sync_page_time_min = cursor.time_min
+        connection.sync_pages_processed += 1
+        await self.connection_repo.commit()
 
-        touched_mirrors = await self._upsert_mirror_events(
-            connection=connection, events=batch.events
+        # The commit released the Postgres advisory xact lock. Whoever takes it from here
+        # carries on from this checkpoint.
+        if await self._try_acquire_connection_sync_lock(connection):
+            return True
+        logger.info(
+            "google calendar sync handed off after checkpoint connection_id=%s pages_processed=%s",
+            connection.id,
+            connection.sync_pages_processed,
         )
-        await self._map_mirrors_and_write_back(connection=connection, mirrors=touched_mirrors)
+        return False
 
-        self._touch_successful_sync(connection, next_sync_token=batch.next_sync_token)
-        await self.connection_repo.commit()
-        return len(batch.events)
+    def _clear_sync_checkpoint(self, connection: ExternalCalendarConnection) -> None:
+        connection.sync_page_token = None
+        connection.sync_page_time_min = None
+        connection.sync_pages_processed = 0
 
     async def sync_primary_calendar_for_user(self, user_id: uuid.UUID) -> int:
         connection = await self.connection_repo.get_for_user_provider_calendar(
@@ -292,6 +431,8 @@ class GoogleCalendarSyncService:
         }
 
     async def _post_google_token_refresh(self, data: dict[str, str]) -> httpx.Response:
+        if self.http_client is not None:
+            return await self.http_client.post(_GOOGLE_OAUTH_TOKEN_URL, data=data)
         async with httpx.AsyncClient(timeout=15.0) as client:
             return await client.post(_GOOGLE_OAUTH_TOKEN_URL, data=data)
 
@@ -367,38 +508,58 @@ class GoogleCalendarSyncService:
         connection: ExternalCalendarConnection,
         events: Sequence[ExternalCalendarEvent],
     ) -> list[ExternalCalendarEventMirror]:
-        touched_mirrors: list[ExternalCalendarEventMirror] = []
-        for event in events:
-            touched_mirrors.append(
-                await self._upsert_mirror_event(connection=connection, event=event)
-            )
-        return touched_mirrors
+        if not events:
+            return []
+        seen_at = datetime.now(UTC)
+        return await self.event_mirror_repo.upsert_for_connection_events(
+            connection_id=connection.id,
+            rows=[
+                {
+                    "external_event_id": event.event_id,
+                    "external_recurring_event_id": event.recurring_event_id,
+                    "external_status": event.status,
+                    "etag": event.etag,
+                    "summary": event.summary,
+                    "start_at": event.start_at,
+                    "end_at": event.end_at,
+                    "is_all_day": event.is_all_day,
+                    "external_updated_at": event.external_updated_at,
+                    "last_seen_at": seen_at,
+                }
+                for event in events
+            ],
+        )
 
     async def _map_mirrors_and_write_back(
         self,
         *,
         connection: ExternalCalendarConnection,
         mirrors: list[ExternalCalendarEventMirror],
+        seen: _SeenRecurringEvents,
     ) -> None:
         if self.event_mapper is None or not mirrors:
             return
 
-        recurring_event_ids = self._recurring_event_ids(mirrors)
-        details_by_id = await self._fetch_recurring_event_details(
-            connection=connection,
-            recurring_event_ids=recurring_event_ids,
+        # Masters handled by an earlier page of this sync are neither fetched nor patched again.
+        new_recurring_event_ids = self._recurring_event_ids(mirrors) - seen.event_ids
+        seen.details_by_id.update(
+            await self._fetch_recurring_event_details(
+                connection=connection,
+                recurring_event_ids=new_recurring_event_ids,
+            )
         )
+        seen.event_ids |= new_recurring_event_ids
 
         await self.event_mapper.map_mirrors(
             connection=connection,
             mirrors=mirrors,
-            recurring_event_details_by_id=details_by_id,
+            recurring_event_details_by_id=seen.details_by_id,
         )
 
         await self._maybe_write_back_backlinks(
             connection=connection,
             mirrors=mirrors,
-            recurring_event_ids=sorted(recurring_event_ids),
+            recurring_event_ids=sorted(new_recurring_event_ids),
         )
 
     async def _maybe_write_back_backlinks(
@@ -464,6 +625,7 @@ class GoogleCalendarSyncService:
         next_sync_token: str | None,
     ) -> None:
         connection.sync_token = next_sync_token
+        self._clear_sync_checkpoint(connection)
         connection.last_synced_at = datetime.now(UTC)
         connection.last_sync_error_code = None
         connection.last_sync_error_at = None
@@ -570,59 +732,122 @@ class GoogleCalendarSyncService:
             recurring_event_id=recurring_event_id,
         )
 
-    async def sync_all_enabled_connections(self) -> int:
+    async def sync_all_enabled_connections(
+        self, *, should_stop: Callable[[], bool] | None = None
+    ) -> int:
+        """Sync every enabled Google connection, checking ``should_stop`` between connections."""
         synced_event_count = 0
-        connections = await self.connection_repo.list_enabled_for_provider(
-            provider=CalendarProvider.google,
+        # Ids rather than rows: a failed connection rolls the session back, which expires
+        # every loaded row, and ``get`` reloads each one before it syncs.
+        connection_ids = await self.connection_repo.list_enabled_ids_for_provider(
+            CalendarProvider.google
         )
-        for connection in connections:
-            try:
-                synced_event_count += await self.sync_connection(connection)
-            except httpx.HTTPStatusError as exc:
-                status = exc.response.status_code
-                if status == 401 and not connection.refresh_token:
-                    connection.last_sync_error_code = "needs_reauth"
-                else:
-                    connection.last_sync_error_code = f"http_{status}"
-                connection.last_sync_error_at = datetime.now(UTC)
-                await self.connection_repo.commit()
-                logger.warning(
-                    "google calendar sync failed for connection_id=%s status=%s",
-                    connection.id,
-                    status,
-                )
-            except Exception:
-                connection.last_sync_error_code = "error"
-                connection.last_sync_error_at = datetime.now(UTC)
-                await self.connection_repo.commit()
-                logger.exception(
-                    "google calendar sync failed for connection_id=%s",
-                    connection.id,
+        for index, connection_id in enumerate(connection_ids):
+            if should_stop is not None and should_stop():
+                logger.info(
+                    "google calendar sync stopping early: remaining_connection_count=%s",
+                    len(connection_ids) - index,
                 )
+                break
+            connection = await self.connection_repo.get(connection_id)
+            if connection is None or not connection.is_enabled:
+                continue
+            synced_event_count += await self.sync_connection_recording_errors(connection) or 0
         return synced_event_count
 
-    async def _upsert_mirror_event(
-        self,
-        *,
-        connection: ExternalCalendarConnection,
-        event: ExternalCalendarEvent,
-    ) -> ExternalCalendarEventMirror:
-        existing = await self.event_mirror_repo.get_or_create_for_connection_event(
-            connection_id=connection.id,
-            external_event_id=event.event_id,
-        )
+    async def sync_connection_recording_errors(
+        self, connection: ExternalCalendarConnection
+    ) -> int | None:
+        """Sync ``connection``; on failure record its error code and return None."""
+        connection_id = connection.id
+        try:
+            return await self.sync_connection(connection)
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            error_code = (
+                "needs_reauth"
+                if status == 401 and not connection.refresh_token
+                else f"http_{status}"
+            )
+            await self._record_sync_error(connection, error_code)
+            logger.warning(
+                "google calendar sync failed for connection_id=%s status=%s",
+                connection_id,
+                status,
+            )
+        except Exception:
+            await self._record_sync_error(connection, "error")
+            logger.exception(
+                "google calendar sync failed for connection_id=%s",
+                connection_id,
+            )
+        return None
+
+    async def _record_sync_error(
+        self, connection: ExternalCalendarConnection, error_code: str
+    ) -> None:
+        # Drop the failed sync's uncommitted work first; after a database error the session
+        # refuses to commit anything until it is rolled back.
+        await self.connection_repo.rollback()
+        connection.last_sync_error_code = error_code
+        connection.last_sync_error_at = datetime.now(UTC)
+        await self.connection_repo.commit()
+
+
+async def sync_enabled_connections_concurrently(
+    *,
+    build_service: Callable[[AsyncSession], GoogleCalendarSyncService],
+    concurrency: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> GoogleCalendarSyncRunStats:
+    """Sync every enabled Google connection, up to ``concurrency`` of them at once.
+
+    Each connection gets its own session from ``build_service``, so its Google round trips
+    overlap with the others' and a failure only rolls back that connection's work.
+    ``should_stop`` is checked before each connection starts.
+    """
+    async with db.SessionMaker() as session:
+        connection_ids = await ExternalCalendarConnectionRepository(
+            session
+        ).list_enabled_ids_for_provider(CalendarProvider.google)
+
+    stats = GoogleCalendarSyncRunStats(connections=len(connection_ids))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _sync_bounded(connection_id: uuid.UUID) -> None:
+        # A failure that even recording the error can't absorb (e.g. the database is down)
+        # fails this connection only, instead of escaping through ``gather``.
+        try:
+            await _sync_one(connection_id)
+        except Exception:
+            stats.failed += 1
+            logger.exception(
+                "google calendar sync could not record the outcome for connection_id=%s",
+                connection_id,
+            )
 
-        existing.external_recurring_event_id = event.recurring_event_id
-        existing.external_status = event.status
-        existing.etag = event.etag
-        existing.summary = event.summary
-        existing.start_at = event.start_at
-        existing.end_at = event.end_at
-        existing.is_all_day = event.is_all_day
-        existing.external_updated_at = event.external_updated_at
-        existing.last_seen_at = datetime.now(UTC)
-        await self.event_mirror_repo.session.flush()
-        return existing
+    async def _sync_one(connection_id: uuid.UUID) -> None:
+        async with semaphore:
+            if should_stop is not None and should_stop():
+                stats.skipped += 1
+                return
+            started = time.perf_counter()
+            async with db.SessionMaker() as session:
+                service = build_service(session)
+                connection = await service.connection_repo.get(connection_id)
+                if connection is None or not connection.is_enabled:
+                    stats.skipped += 1
+                    return
+                synced_event_count = await service.sync_connection_recording_errors(connection)
+            stats.connection_latencies_ms.append((time.perf_counter() - started) * 1000)
+            if synced_event_count is None:
+                stats.failed += 1
+                return
+            stats.synced += 1
+            stats.synced_event_count += synced_event_count
+
+    await asyncio.gather(*(_sync_bounded(connection_id) for connection_id in connection_ids))
+    return stats
 
 
 __all__ = [
@@ -630,5 +855,7 @@ __all__ = [
     "ExternalCalendarEvent",
     "ExternalCalendarSyncBatch",
     "ExternalRecurringEventDetails",
+    "GoogleCalendarSyncRunStats",
     "GoogleCalendarSyncService",
+    "sync_enabled_connections_concurrently",
 ]
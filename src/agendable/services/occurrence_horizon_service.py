@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import agendable.db as db
+from agendable.db.models import MeetingSeries, reminder_shard_for
+from agendable.db.repos import (
+    MeetingOccurrenceAttendeeRepository,
+    MeetingOccurrenceRepository,
+    MeetingSeriesRepository,
+    ReminderRepository,
+)
+from agendable.reminders import as_utc, default_email_reminder_values
+from agendable.services.occurrence_materialization_service import upcoming_rule_instances
+from agendable.settings import Settings
+
+
+@dataclass(slots=True)
+class OccurrenceHorizonStats:
+    series: int = 0
+    series_topped_up: int = 0
+    occurrences_created: int = 0
+    attendee_links_created: int = 0
+    reminders_created: int = 0
+    batches: int = 0
+
+
+@dataclass(slots=True)
+class _TopUp:
+    series: MeetingSeries
+    scheduled: list[datetime]
+    materialized_until: datetime
+
+
+@dataclass(slots=True)
+class _BatchRows:
+    occurrences: list[dict[str, Any]] = field(default_factory=list)
+    attendee_links: list[dict[str, Any]] = field(default_factory=list)
+    reminders: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _plan_top_up(
+    series: MeetingSeries, *, now: datetime, count: int, existing: set[datetime]
+) -> _TopUp | None:
+    """Work out which rows bring ``series`` to ``count`` future occurrences.
+
+    The new mark is the ``count``-th upcoming rule instance. Instances that slipped into
+    the past while still virtual are not backfilled.
+    """
+    if series.occurrences_materialized_until is None:
+        return None
+    mark = as_utc(series.occurrences_materialized_until)
+    upcoming = upcoming_rule_instances(series, after=now, limit=count)
+    if not upcoming or upcoming[-1] <= mark:
+        return None
+    return _TopUp(
+        series=series,
+        scheduled=[dt for dt in upcoming if dt > mark and dt not in existing],
+        materialized_until=upcoming[-1],
+    )
+
+
+def _build_rows(
+    plans: list[_TopUp],
+    *,
+    attendees_by_series: dict[uuid.UUID, set[uuid.UUID]],
+    settings: Settings,
+) -> _BatchRows:
+    rows = _BatchRows()
+    for plan in plans:
+        series = plan.series
+        # New meetings inherit the attendees of the series' latest meeting.
+        user_ids = {series.owner_user_id} | attendees_by_series.get(series.id, set())
+        reminders_until = series.reminders_materialized_until
+        for scheduled_at in plan.scheduled:
+            occurrence_id = uuid.uuid4()
+            rows.occurrences.append(
+                {"id": occurrence_id, "series_id": series.id, "scheduled_at": scheduled_at}
+            )
+            rows.attendee_links.extend(
+                {"occurrence_id": occurrence_id, "user_id": user_id} for user_id in user_ids
+            )
+            if not settings.enable_default_email_reminders:
+                continue
+            reminder = default_email_reminder_values(
+                occurrence_id, scheduled_at, settings, series.reminder_minutes_before
+            )
+            # Past the series' reminder high-water mark, the reminder horizon job writes it.
+            if reminders_until is None or reminder["send_at"] <= as_utc(reminders_until):
+                rows.reminders.append({**reminder, "shard": reminder_shard_for(occurrence_id)})
+    return rows
+
+
+async def _top_up_batch(
+    session: AsyncSession,
+    batch: list[MeetingSeries],
+    *,
+    now: datetime,
+    settings: Settings,
+    stats: OccurrenceHorizonStats,
+) -> None:
+    occurrence_repo = MeetingOccurrenceRepository(session)
+    attendee_repo = MeetingOccurrenceAttendeeRepository(session)
+    reminder_repo = ReminderRepository(session)
+
+    existing: dict[uuid.UUID, set[datetime]] = defaultdict(set)
+    for series_id, scheduled_at in await occurrence_repo.list_scheduled_after_for_series(
+        series_ids=[series.id for series in batch], scheduled_after=now
+    ):
+        existing[series_id].add(as_utc(scheduled_at))
+    plans = [
+        plan
+        for series in batch
+        if (
+            plan := _plan_top_up(
+                series,
+                now=now,
+                count=settings.occurrence_horizon_count,
+                existing=existing[series.id],
+            )
+        )
+        is not None
+    ]
+    if not plans:
+        return
+
+    attendees_by_series = await attendee_repo.list_user_ids_for_latest_series_occurrences(
+        [plan.series.id for plan in plans if plan.scheduled]
+    )
+    rows = _build_rows(plans, attendees_by_series=attendees_by_series, settings=settings)
+    await occurrence_repo.insert_many(rows.occurrences)
+    await attendee_repo.insert_many(rows.attendee_links)
+    await reminder_repo.insert_many(rows.reminders)
+    if rows.reminders:
+        await reminder_repo.notify_scheduled(
+            send_at=min(reminder["send_at"] for reminder in rows.reminders)
+        )
+    await MeetingSeriesRepository(session).advance_occurrence_horizons(
+        {plan.series.id: plan.materialized_until for plan in plans}
+    )
+
+    stats.series_topped_up += sum(1 for plan in plans if plan.scheduled)
+    stats.occurrences_created += len(rows.occurrences)
+    stats.attendee_links_created += len(rows.attendee_links)
+    stats.reminders_created += len(rows.reminders)
+
+
+async def materialize_occurrence_horizon(
+    *, now: datetime, settings: Settings, should_stop: Callable[[], bool] | None = None
+) -> OccurrenceHorizonStats:
+    """Top every series with virtual occurrences up to ``occurrence_horizon_count`` ahead.
+
+    Series are walked in id order, ``occurrence_horizon_batch_size`` per transaction. Each
+    batch writes its occurrences, attendee links and default reminders with one multi-row
+    INSERT per table and advances the series' marks with one UPDATE, instead of a round
+    trip per series. ``should_stop`` is checked before each batch.
+    """
+    stats = OccurrenceHorizonStats()
+    batch_size = settings.occurrence_horizon_batch_size
+    after_id: uuid.UUID | None = None
+    while should_stop is None or not should_stop():
+        async with db.SessionMaker() as session:
+            batch = await MeetingSeriesRepository(session).lock_with_virtual_occurrences(
+                after_id=after_id, limit=batch_size
+            )
+            if not batch:
+                break
+            await _top_up_batch(session, batch, now=now, settings=settings, stats=stats)
+            await session.commit()
+
+        stats.batches += 1
+        stats.series += len(batch)
+        after_id = batch[-1].id
+        if len(batch) < batch_size:
+            break
+    return stats
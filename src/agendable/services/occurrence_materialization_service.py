@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import functools
+import uuid
+from collections.abc import Set
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import MeetingOccurrence, MeetingSeries, Reminder
+from agendable.db.repos import (
+    MeetingOccurrenceAttendeeRepository,
+    MeetingOccurrenceRepository,
+    ReminderRepository,
+)
+from agendable.recurrence import expand_between
+from agendable.reminders import as_utc, build_default_email_reminder
+from agendable.settings import Settings
+
+_OCCURRENCE_STAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+# Virtual occurrences are looked for in a window that doubles until it holds enough of them.
+_VIRTUAL_SCAN_INITIAL = timedelta(days=31)
+_VIRTUAL_SCAN_MAX = timedelta(days=31 * 64)
+_INSTANT = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class VirtualOccurrence:
+    """A rule instance of a series that has no ``MeetingOccurrence`` row yet."""
+
+    series_id: uuid.UUID
+    scheduled_at: datetime
+
+    @property
+    def stamp(self) -> str:
+        return format_occurrence_stamp(self.scheduled_at)
+
+
+def format_occurrence_stamp(scheduled_at: datetime) -> str:
+    return as_utc(scheduled_at).strftime(_OCCURRENCE_STAMP_FORMAT)
+
+
+def parse_occurrence_stamp(stamp: str) -> datetime:
+    """Parse a stamp from ``format_occurrence_stamp``; raises ``ValueError`` when malformed."""
+    return datetime.strptime(stamp, _OCCURRENCE_STAMP_FORMAT).replace(tzinfo=UTC)
+
+
+@functools.lru_cache(maxsize=512)
+def _zone_or_none(timezone_name: str) -> ZoneInfo | None:
+    # Cached so an unknown name doesn't repeat a failed tzdata lookup on every call.
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        return None
+
+
+def series_rule_zone(series: MeetingSeries) -> tzinfo:
+    """The zone a series' rule is expanded in: its timezone, else its dtstart's, else UTC."""
+    dtstart = series.recurrence_dtstart
+    fallback = dtstart.tzinfo if dtstart is not None and dtstart.tzinfo is not None else UTC
+    timezone_name = (series.recurrence_timezone or "").strip()
+    if not timezone_name:
+        return fallback
+    return _zone_or_none(timezone_name) or fallback
+
+
+def series_rule_instances(
+    series: MeetingSeries, *, start: datetime, end: datetime
+) -> list[datetime]:
+    """Return the series' rule instances with ``start <= instance < end``, in UTC."""
+    rrule = (series.recurrence_rrule or "").strip()
+    dtstart = series.recurrence_dtstart
+    if not rrule or dtstart is None:
+        return []
+    return [
+        dt.astimezone(UTC)
+        for dt in expand_between(
+            rrule=rrule,
+            dtstart=dtstart,
+            start=start,
+            end=end,
+            tz=series_rule_zone(series),
+        )
+    ]
+
+
+def upcoming_rule_instances(
+    series: MeetingSeries,
+    *,
+    after: datetime,
+    limit: int,
+    exclude: Set[datetime] = frozenset(),
+) -> list[datetime]:
+    """Return the series' first ``limit`` rule instances after ``after`` not in ``exclude``."""
+    start = as_utc(after) + _INSTANT
+    span = _VIRTUAL_SCAN_INITIAL
+    while True:
+        found = [
+            scheduled_at
+            for scheduled_at in series_rule_instances(series, start=start, end=start + span)
+            if scheduled_at not in exclude
+        ]
+        if len(found) >= limit or span >= _VIRTUAL_SCAN_MAX:
+            return found[:limit]
+        span *= 2
+
+
+def occurrence_materialization_end(
+    *, first_scheduled_at: datetime, now: datetime, settings: Settings
+) -> datetime:
+    """Latest start a new series writes a row for; later instances stay virtual."""
+    return max(now, as_utc(first_scheduled_at)) + timedelta(
+        days=settings.occurrence_materialize_days
+    )
+
+
+class OccurrenceMaterializationService:
+    """Turns a series' virtual occurrences into rows, with attendee links and reminders.
+
+    A series' ``occurrences_materialized_until`` mark splits its rule instances: those
+    scheduled by the mark have rows, later ones are computed from the rule on demand. A
+    later instance can also get a row on its own when it is touched before the mark
+    reaches it, so lookups past the mark always check for existing rows first.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: AsyncSession,
+        occurrences: MeetingOccurrenceRepository,
+        attendees: MeetingOccurrenceAttendeeRepository,
+        reminders: ReminderRepository,
+    ) -> None:
+        self.session = session
+        self.occurrences = occurrences
+        self.attendees = attendees
+        self.reminders = reminders
+
+    @classmethod
+    def from_session(cls, session: AsyncSession) -> OccurrenceMaterializationService:
+        return cls(
+            session=session,
+            occurrences=MeetingOccurrenceRepository(session),
+            attendees=MeetingOccurrenceAttendeeRepository(session),
+            reminders=ReminderRepository(session),
+        )
+
+    async def list_virtual_occurrences(
+        self,
+        series: MeetingSeries,
+        *,
+        after: datetime,
+        limit: int,
+    ) -> list[VirtualOccurrence]:
+        """Return up to ``limit`` virtual occurrences scheduled after ``after``."""
+        mark = series.occurrences_materialized_until
+        if mark is None:
+            return []
+
+        start = max(as_utc(mark), as_utc(after))
+        materialized = {
+            as_utc(scheduled_at)
+            for scheduled_at in await self.occurrences.list_scheduled_after(series.id, start)
+        }
+        return [
+            VirtualOccurrence(series_id=series.id, scheduled_at=scheduled_at)
+            for scheduled_at in upcoming_rule_instances(
+                series, after=start, limit=limit, exclude=materialized
+            )
+        ]
+
+    async def materialize_at(
+        self,
+        series: MeetingSeries,
+        *,
+        scheduled_at: datetime,
+        settings: Settings,
+    ) -> MeetingOccurrence | None:
+        """Return the row for the instance at ``scheduled_at``, creating it if it is virtual.
+
+        Returns None when ``scheduled_at`` is not a rule instance past the series' mark and
+        has no row either. The series row is locked for the rest of the transaction, so
+        this serializes with the horizon jobs and other opens of the same instance. The
+        series' mark is left alone; nothing is committed.
+        """
+        scheduled_at = as_utc(scheduled_at)
+        # Reload under the lock: both marks may have moved since the series was loaded.
+        await self.session.flush()
+        await self.session.refresh(series, with_for_update=True)
+        existing = await self.occurrences.get_for_series_scheduled_at(
+            series_id=series.id, scheduled_at=scheduled_at
+        )
+        if existing is not None:
+            return existing
+
+        mark = series.occurrences_materialized_until
+        if mark is None or scheduled_at <= as_utc(mark):
+            return None
+        if not series_rule_instances(series, start=scheduled_at, end=scheduled_at + _INSTANT):
+            return None
+
+        created = await self._materialize(series, [scheduled_at], settings=settings)
+        if created:
+            return created[0]
+        # Lost to a writer that doesn't lock the series, e.g. a calendar import.
+        return await self.occurrences.get_for_series_scheduled_at(
+            series_id=series.id, scheduled_at=scheduled_at
+        )
+
+    async def materialize_through(
+        self,
+        series: MeetingSeries,
+        *,
+        through: datetime,
+        settings: Settings,
+    ) -> list[MeetingOccurrence]:
+        """Write rows for every virtual instance scheduled by ``through`` and advance the mark.
+
+        Series without a mark are left alone. Nothing is committed.
+        """
+        mark = series.occurrences_materialized_until
+        through = as_utc(through)
+        if mark is None or through <= as_utc(mark):
+            return []
+
+        start = as_utc(mark) + _INSTANT
+        existing = {
+            as_utc(scheduled_at)
+            for scheduled_at in await self.occurrences.list_scheduled_after(series.id, start)
+        }
+        scheduled = [
+            scheduled_at
+            for scheduled_at in series_rule_instances(series, start=start, end=through + _INSTANT)
+            if scheduled_at not in existing
+        ]
+        created = await self._materialize(series, scheduled, settings=settings)
+        series.occurrences_materialized_until = through
+        return created
+
+    async def _materialize(
+        self,
+        series: MeetingSeries,
+        scheduled: list[datetime],
+        *,
+        settings: Settings,
+    ) -> list[MeetingOccurrence]:
+        if not scheduled:
+            return []
+
+        # New meetings inherit the attendees of the series' latest meeting.
+        latest = await self.occurrences.get_latest_for_series(series.id)
+        attendee_user_ids = {series.owner_user_id}
+        if latest is not None:
+            attendee_user_ids |= await self.attendees.list_user_ids_for_occurrence(latest.id)
+
+        # Instances another writer got to first are skipped along with their links.
+        occurrences = await self.occurrences.insert_missing_for_series(
+            series_id=series.id, scheduled=scheduled
+        )
+        for occurrence in occurrences:
+            for user_id in attendee_user_ids:
+                await self.attendees.add_link(occurrence_id=occurrence.id, user_id=user_id)
+
+        if settings.enable_default_email_reminders:
+            await self._add_default_reminders(series, occurrences, settings=settings)
+        return occurrences
+
+    async def _add_default_reminders(
+        self,
+        series: MeetingSeries,
+        occurrences: list[MeetingOccurrence],
+        *,
+        settings: Settings,
+    ) -> None:
+        # Past the series' reminder high-water mark, the reminder horizon job writes them later.
+        materialized_until = series.reminders_materialized_until
+        reminders: list[Reminder] = []
+        for occurrence in occurrences:
+            reminder = build_default_email_reminder(
+                occurrence_id=occurrence.id,
+                occurrence_scheduled_at=occurrence.scheduled_at,
+                settings=settings,
+                lead_minutes_before=series.reminder_minutes_before,
+            )
+            if materialized_until is None or reminder.send_at <= as_utc(materialized_until):
+                reminders.append(reminder)
+        if reminders:
+            self.session.add_all(reminders)
+            await self.reminders.notify_scheduled(
+                send_at=min(reminder.send_at for reminder in reminders)
+            )
@@ -2,9 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime, tzinfo
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from dateutil.rrule import rrulestr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.datetime_utils import format_datetime_local_value
@@ -17,7 +15,13 @@ from agendable.db.repos import (
     TaskRepository,
     UserRepository,
 )
-from agendable.recurrence import normalize_rrule
+from agendable.recurrence import compile_rrule
+from agendable.reminders import as_utc
+from agendable.services.occurrence_materialization_service import (
+    OccurrenceMaterializationService,
+    series_rule_zone,
+)
+from agendable.settings import Settings, get_settings
 
 
 class OccurrenceTaskNotFoundError(Exception):
@@ -36,17 +40,6 @@ class OccurrenceAssigneeNotFoundError(Exception):
     pass
 
 
-def _coerce_tzinfo(*, dtstart_tzinfo: tzinfo | None, timezone_name: str) -> tzinfo:
-    if dtstart_tzinfo is None:
-        dtstart_tzinfo = UTC
-    if not timezone_name.strip():
-        return dtstart_tzinfo
-    try:
-        return ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError:
-        return dtstart_tzinfo
-
-
 def _ensure_dt_aware_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
@@ -57,25 +50,39 @@ def _compute_next_occurrence_utc(
     *,
     rrule: str,
     dtstart: datetime,
-    timezone_name: str,
+    zone: tzinfo,
     scheduled_after: datetime,
 ) -> datetime | None:
     dtstart = _ensure_dt_aware_utc(dtstart)
     scheduled_after = _ensure_dt_aware_utc(scheduled_after)
 
-    tzinfo = _coerce_tzinfo(dtstart_tzinfo=dtstart.tzinfo, timezone_name=timezone_name)
-    local_dtstart = dtstart.astimezone(tzinfo)
-    local_after = scheduled_after.astimezone(tzinfo)
+    local_dtstart = dtstart.astimezone(zone)
+    local_after = scheduled_after.astimezone(zone)
 
-    rule = rrulestr(normalize_rrule(rrule), dtstart=local_dtstart)
+    rule = compile_rrule(rrule, dtstart=local_dtstart)
     next_local = rule.after(local_after, inc=False)
     if next_local is None:
         return None
     if next_local.tzinfo is None:
-        next_local = next_local.replace(tzinfo=tzinfo)
+        next_local = next_local.replace(tzinfo=zone)
     return next_local.astimezone(UTC)
 
 
+def _next_rule_occurrence_utc(
+    series: MeetingSeries, *, scheduled_after: datetime
+) -> datetime | None:
+    rrule = (series.recurrence_rrule or "").strip()
+    dtstart = series.recurrence_dtstart
+    if not rrule or dtstart is None:
+        return None
+    return _compute_next_occurrence_utc(
+        rrule=rrule,
+        dtstart=dtstart,
+        zone=series_rule_zone(series),
+        scheduled_after=scheduled_after,
+    )
+
+
 class OccurrenceService:
     def __init__(
         self,
@@ -87,6 +94,8 @@ class OccurrenceService:
         series: MeetingSeriesRepository | None = None,
         tasks: TaskRepository | None = None,
         users: UserRepository | None = None,
+        materializer: OccurrenceMaterializationService | None = None,
+        settings: Settings | None = None,
     ) -> None:
         self.session = session
         self.agenda_items = agenda_items or AgendaItemRepository(session)
@@ -95,6 +104,8 @@ class OccurrenceService:
         self.series = series or MeetingSeriesRepository(session)
         self.tasks = tasks or TaskRepository(session)
         self.users = users or UserRepository(session)
+        self.materializer = materializer or OccurrenceMaterializationService.from_session(session)
+        self.settings = settings if settings is not None else get_settings()
 
     @classmethod
     def from_session(cls, session: AsyncSession) -> OccurrenceService:
@@ -123,41 +134,58 @@ class OccurrenceService:
         self,
         *,
         occurrence: MeetingOccurrence,
+        materialized_next: MeetingOccurrence | None,
     ) -> MeetingOccurrence | None:
+        """Return the rule's next occurrence after ``occurrence``, writing it if needed.
+
+        ``materialized_next`` is the next open row. It wins unless the rule has an earlier
+        instance that is still virtual, or there is no row at all.
+        """
         series = await self.series.get(occurrence.series_id)
         if series is None:
-            return None
-
-        rrule = (series.recurrence_rrule or "").strip()
-        dtstart = series.recurrence_dtstart
-        if not rrule or dtstart is None:
-            return None
-
-        timezone_name = (series.recurrence_timezone or "").strip()
-        next_utc = _compute_next_occurrence_utc(
-            rrule=rrule,
-            dtstart=dtstart,
-            timezone_name=timezone_name,
-            scheduled_after=occurrence.scheduled_at,
-        )
+            return materialized_next
+
+        mark = series.occurrences_materialized_until
+        if materialized_next is not None and (
+            mark is None or as_utc(materialized_next.scheduled_at) <= as_utc(mark)
+        ):
+            return materialized_next
+
+        next_utc = _next_rule_occurrence_utc(series, scheduled_after=occurrence.scheduled_at)
         if next_utc is None:
-            return None
+            return materialized_next
+        if materialized_next is not None and as_utc(materialized_next.scheduled_at) <= next_utc:
+            return materialized_next
+
+        if mark is not None and next_utc > as_utc(mark):
+            return await self.materializer.materialize_at(
+                series, scheduled_at=next_utc, settings=self.settings
+            )
+        return await self._get_or_add_occurrence(series_id=series.id, scheduled_at=next_utc)
 
+    async def _get_or_add_occurrence(
+        self,
+        *,
+        series_id: uuid.UUID,
+        scheduled_at: datetime,
+    ) -> MeetingOccurrence:
         existing = await self._get_occurrence_by_scheduled_at(
-            series_id=occurrence.series_id,
-            scheduled_at=next_utc,
+            series_id=series_id,
+            scheduled_at=scheduled_at,
         )
         if existing is not None:
             return existing
 
-        next_occurrence = MeetingOccurrence(
-            series_id=occurrence.series_id,
-            scheduled_at=next_utc,
-            notes="",
-            is_completed=False,
+        created = await self.occurrences.insert_missing_for_series(
+            series_id=series_id, scheduled=[scheduled_at]
+        )
+        if created:
+            return created[0]
+        # Another writer added it after the lookup above.
+        return await self.occurrences.one_where(
+            MeetingOccurrence.series_id == series_id,
+            MeetingOccurrence.scheduled_at == scheduled_at,
         )
-        await self.occurrences.add(next_occurrence)
-        return next_occurrence
 
     async def get_owned_occurrence(
         self,
@@ -274,9 +302,10 @@ class OccurrenceService:
             occurrence.scheduled_at,
         )
 
-        if next_occurrence is None and create_next_if_missing:
+        if create_next_if_missing:
             next_occurrence = await self._ensure_next_occurrence_from_rrule(
                 occurrence=occurrence,
+                materialized_next=next_occurrence,
             )
 
         if next_occurrence is not None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import uuid
+from collections.abc import Sequence
 from datetime import datetime
 
 import agendable.db as db
-from agendable.db.models import Reminder
+from agendable.db.models import Reminder, ReminderChannel
 from agendable.db.repos import ReminderRepository
 
 
@@ -28,3 +30,49 @@ async def claim_reminder_attempt(
     reminder.attempt_count += 1
     reminder.last_attempted_at = now
     return True
+
+
+async def claim_due_reminder_batch(
+    *,
+    now: datetime,
+    limit: int,
+    claim_lease_seconds: int,
+    channels: Sequence[ReminderChannel],
+    shards: Sequence[int] | None = None,
+) -> list[uuid.UUID]:
+    async with db.SessionMaker() as claim_session:
+        reminder_repo = ReminderRepository(claim_session)
+        claimed_ids = await reminder_repo.claim_due_batch(
+            now=now,
+            limit=limit,
+            claim_lease_seconds=claim_lease_seconds,
+            channels=channels,
+            shards=shards,
+        )
+        if claimed_ids:
+            await claim_session.commit()
+    return claimed_ids
+
+
+async def claim_upcoming_reminders_for_recipients(
+    *,
+    recipient_emails: Sequence[str],
+    now: datetime,
+    until: datetime,
+    claim_lease_seconds: int,
+    channels: Sequence[ReminderChannel],
+    shards: Sequence[int] | None = None,
+) -> list[uuid.UUID]:
+    async with db.SessionMaker() as claim_session:
+        reminder_repo = ReminderRepository(claim_session)
+        claimed_ids = await reminder_repo.claim_upcoming_for_recipients(
+            recipient_emails=recipient_emails,
+            now=now,
+            until=until,
+            claim_lease_seconds=claim_lease_seconds,
+            channels=channels,
+            shards=shards,
+        )
+        if claimed_ids:
+            await claim_session.commit()
+    return claimed_ids
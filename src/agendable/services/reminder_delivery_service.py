@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
+import uuid
 from collections import Counter
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 from agendable.db.models import Reminder, ReminderChannel, ReminderDeliveryStatus
-from agendable.db.repos import ReminderRepository
-from agendable.logging_config import log_with_fields
-from agendable.reminders import ReminderDeliveryError, ReminderEmail, ReminderSender, as_utc
+from agendable.db.repos import ReminderDeliveryRow, ReminderRepository
+from agendable.logging_config import format_tenths, log_with_fields, percentile
+from agendable.reminders import (
+    ReminderDeliveryError,
+    ReminderDigest,
+    ReminderEmail,
+    ReminderSender,
+    SlackReminderSender,
+    TerminalReminderDeliveryError,
+    as_utc,
+    reminder_idempotency_key,
+)
 from agendable.services.reminder_claim_service import (
-    claim_reminder_attempt as claim_reminder_attempt_in_service,
+    claim_due_reminder_batch as claim_due_reminder_batch_in_service,
 )
+from agendable.services.reminder_claim_service import claim_upcoming_reminders_for_recipients
 from agendable.settings import Settings, get_settings
 
 
@@ -24,22 +38,126 @@ class ReminderRunStats:
     skipped: int = 0
     retried: int = 0
     failure_reason_counts: Counter[str] = field(default_factory=Counter)
+    in_flight_peak: int = 0
+    send_latencies_ms: list[float] = field(default_factory=list)
+    digests: int = 0
+    short_circuited: int = 0
+    unrecorded_attempts: int = 0
+    checkpoints: int = 0
+    # Claimed during a shutdown drain but handed back unsent for another worker to deliver.
+    released: int = 0
+    queue_depth_at_start: int = 0
+    oldest_overdue_seconds: float | None = None
+    # How long after ``send_at`` each sent reminder actually went out, in seconds.
+    lateness_seconds: list[float] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _DeliveryCircuitBreaker:
+    """Trips a channel for the rest of a run once one transient reason fails repeatedly.
+
+    Consecutive failures are counted per channel and reason code, and a successful send on
+    a channel resets that channel's counts. Terminal failures are recipient-specific, so
+    they neither count nor reset. An SMTP outage never stops Slack delivery, or vice versa.
+    """
+
+    threshold: int
+    consecutive_failures: Counter[tuple[ReminderChannel, str]] = field(default_factory=Counter)
+    open_reasons: dict[ReminderChannel, str] = field(default_factory=dict)
+
+    def open_reason(self, channel: ReminderChannel) -> str | None:
+        return self.open_reasons.get(channel)
+
+    def record_success(self, channel: ReminderChannel) -> None:
+        for key in [key for key in self.consecutive_failures if key[0] == channel]:
+            del self.consecutive_failures[key]
+
+    def record_failure(self, channel: ReminderChannel, exc: ReminderDeliveryError) -> bool:
+        """Count ``exc`` and return True when it is the failure that opens ``channel``."""
+        if not exc.is_transient or channel in self.open_reasons:
+            return False
+        self.consecutive_failures[channel, exc.reason_code] += 1
+        if self.consecutive_failures[channel, exc.reason_code] < self.threshold:
+            return False
+        self.open_reasons[channel] = exc.reason_code
+        return True
+
+
+@dataclass(slots=True)
+class _OutcomeCheckpoint:
+    """Commits recorded delivery outcomes in bounded chunks while a batch is still sending.
+
+    Outcome mutations and commits both happen under ``lock``, so a commit never flushes a
+    reminder that a concurrent delivery is halfway through updating.
+    """
+
+    commit: Callable[[], Awaitable[None]]
+    max_outcomes: int
+    interval_seconds: float
+    stats: ReminderRunStats
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: int = 0
+    last_commit: float = field(default_factory=time.monotonic)
+
+    async def record(self, outcomes: int) -> None:
+        """Count ``outcomes`` just recorded; the caller must hold ``lock``."""
+        self.pending += outcomes
+        if (
+            self.pending >= self.max_outcomes
+            or time.monotonic() - self.last_commit >= self.interval_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Commit pending outcomes; the caller must hold ``lock``."""
+        self.last_commit = time.monotonic()
+        if self.pending == 0:
+            return
+        await self.commit()
+        self.pending = 0
+        self.stats.checkpoints += 1
+
+    async def flush_periodically(self, stop: asyncio.Event) -> None:
+        # Bounds how long an outcome waits when the sends still in flight are slow.
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.interval_seconds)
+            except TimeoutError:
+                async with self.lock:
+                    await self.flush()
+
+
+# Upper bounds (seconds) of the lateness histogram buckets; anything later lands in "+Inf".
+LATENESS_BUCKET_BOUNDS_SECONDS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+
+def lateness_histogram(lateness_seconds: Sequence[float]) -> dict[str, int]:
+    """Bucket lateness samples into cumulative Prometheus-style ``le`` buckets."""
+    histogram = {
+        f"le_{bound}s": sum(1 for value in lateness_seconds if value <= bound)
+        for bound in LATENESS_BUCKET_BOUNDS_SECONDS
+    }
+    histogram["le_inf"] = len(lateness_seconds)
+    return histogram
 
 
-type ClaimAttemptFn = Callable[..., Awaitable[bool]]
+type ClaimBatchFn = Callable[..., Awaitable[list[uuid.UUID]]]
 
+# Only email merges several reminders into one message.
+_DIGEST_CHANNELS = (ReminderChannel.email,)
 
-def _is_reminder_due(reminder: Reminder, now: datetime) -> bool:
-    next_attempt_at = reminder.next_attempt_at if reminder.next_attempt_at else reminder.send_at
-    return as_utc(next_attempt_at) <= now
 
+def _attempt_key(reminder: Reminder) -> str:
+    return reminder_idempotency_key(reminder.id, reminder.attempt_count)
 
-def _build_reminder_email(reminder: Reminder) -> ReminderEmail:
+
+def _build_reminder_email(row: ReminderDeliveryRow) -> ReminderEmail:
     return ReminderEmail(
-        recipient_email=reminder.occurrence.series.owner.email,
-        meeting_title=reminder.occurrence.series.title,
-        scheduled_at=as_utc(reminder.occurrence.scheduled_at),
-        incomplete_tasks=[task.title for task in reminder.occurrence.tasks if not task.is_done],
+        recipient_email=row.recipient_email,
+        meeting_title=row.meeting_title,
+        scheduled_at=as_utc(row.scheduled_at),
+        incomplete_tasks=row.incomplete_tasks,
+        idempotency_key=_attempt_key(row.reminder),
     )
 
 
@@ -57,7 +175,28 @@ def _log_run_summary(
         skipped=stats.skipped,
         retried=stats.retried,
         duration_ms=duration_ms,
+        in_flight_peak=stats.in_flight_peak,
+        digests=stats.digests,
+        short_circuited=stats.short_circuited,
+        unrecorded_attempts=stats.unrecorded_attempts,
+        checkpoints=stats.checkpoints,
+        released=stats.released,
+        send_latency_p50_ms=format_tenths(percentile(stats.send_latencies_ms, 50)),
+        send_latency_p95_ms=format_tenths(percentile(stats.send_latencies_ms, 95)),
+        queue_depth_at_start=stats.queue_depth_at_start,
+        oldest_overdue_seconds=format_tenths(stats.oldest_overdue_seconds),
+        lateness_p50_seconds=format_tenths(percentile(stats.lateness_seconds, 50)),
+        lateness_p95_seconds=format_tenths(percentile(stats.lateness_seconds, 95)),
+        lateness_p99_seconds=format_tenths(percentile(stats.lateness_seconds, 99)),
+        lateness_max_seconds=format_tenths(max(stats.lateness_seconds, default=None)),
     )
+    if stats.lateness_seconds:
+        log_with_fields(
+            logger,
+            logging.INFO,
+            "reminder run lateness histogram",
+            **lateness_histogram(stats.lateness_seconds),
+        )
 
     for reason_code, count in sorted(stats.failure_reason_counts.items()):
         log_with_fields(
@@ -77,91 +216,388 @@ class ReminderDeliveryService:
         sender: ReminderSender,
         logger: logging.Logger,
         settings: Settings | None = None,
-        claim_attempt: ClaimAttemptFn | None = None,
+        claim_batch: ClaimBatchFn | None = None,
+        shards: Sequence[int] | None = None,
+        slack_sender: SlackReminderSender | None = None,
+        should_stop: Callable[[], bool] | None = None,
     ) -> None:
         self.reminder_repo = reminder_repo
         self.sender = sender
         self.logger = logger
         self.settings = settings if settings is not None else get_settings()
-        self.claim_attempt = claim_attempt
+        self.claim_batch = claim_batch
+        self.shards = shards
+        self.slack_sender = slack_sender
+        self.should_stop = should_stop
+        self.supported_channels: tuple[ReminderChannel, ...] = (ReminderChannel.email,)
+        if slack_sender is not None:
+            self.supported_channels += (ReminderChannel.slack,)
 
-    async def run_due_reminders(self) -> None:
+    async def run_due_reminders(self) -> ReminderRunStats:
         started_at = datetime.now(UTC)
         now = started_at
         stats = ReminderRunStats()
 
-        reminders = await self.reminder_repo.list_pending_for_delivery()
-        for reminder in reminders:
-            if not _is_reminder_due(reminder, now):
-                continue
+        stats.skipped += await self.reminder_repo.skip_due_for_unsupported_channels(
+            now=now,
+            supported_channels=self.supported_channels,
+            shards=self.shards,
+        )
+        queue = await self.reminder_repo.queue_snapshot(
+            now=now, channels=self.supported_channels, shards=self.shards
+        )
+        stats.queue_depth_at_start = queue.due_count
+        if queue.oldest_due_at is not None:
+            stats.oldest_overdue_seconds = (now - as_utc(queue.oldest_due_at)).total_seconds()
+        # Claims commit on their own session, so release this write transaction first.
+        await self.reminder_repo.commit()
 
-            if reminder.channel != ReminderChannel.email:
-                reminder.delivery_status = ReminderDeliveryStatus.skipped
-                reminder.failure_reason_code = "unsupported_channel"
-                stats.skipped += 1
-                continue
+        batch_size = self.settings.reminder_claim_batch_size
+        semaphore = asyncio.Semaphore(self.settings.reminder_delivery_concurrency)
+        breaker = _DeliveryCircuitBreaker(
+            threshold=self.settings.reminder_circuit_breaker_threshold
+        )
+        while not self._stopping():
+            claimed_ids = await self._claim_batch(now=now, limit=batch_size)
+            if not claimed_ids:
+                break
 
-            was_claimed = await self._claim_attempt(reminder=reminder, now=now)
-            if not was_claimed:
-                continue
+            rows = await self.reminder_repo.list_delivery_rows(claimed_ids)
+            if self.settings.reminder_digest_window_minutes > 0:
+                rows += await self._claim_digest_companions(rows=rows, now=now)
+            for row in rows:
+                self._check_previous_attempt_recorded(reminder=row.reminder, stats=stats)
+            await self._deliver_batch(
+                groups=self._group_for_delivery(rows),
+                now=now,
+                stats=stats,
+                semaphore=semaphore,
+                breaker=breaker,
+            )
 
-            stats.attempted += 1
+            if len(claimed_ids) < batch_size:
+                break
 
-            try:
-                await self.sender.send_email_reminder(_build_reminder_email(reminder))
-            except ReminderDeliveryError as exc:
-                reminder.failure_reason_code = exc.reason_code
-                stats.failure_reason_counts[exc.reason_code] += 1
-                if (
-                    exc.is_transient
-                    and reminder.attempt_count < self.settings.reminder_retry_max_attempts
-                ):
-                    backoff_seconds = self.settings.reminder_retry_backoff_seconds * (
-                        2 ** (reminder.attempt_count - 1)
-                    )
-                    reminder.next_attempt_at = now + timedelta(seconds=backoff_seconds)
-                    reminder.delivery_status = ReminderDeliveryStatus.retry_scheduled
-                    stats.retried += 1
-                    log_with_fields(
-                        self.logger,
-                        logging.WARNING,
-                        "reminder delivery transient failure",
-                        reminder_id=reminder.id,
-                        reason_code=exc.reason_code,
-                        attempt_count=reminder.attempt_count,
-                        next_attempt_at=reminder.next_attempt_at.isoformat(),
-                        backoff_seconds=backoff_seconds,
-                    )
-                else:
-                    reminder.delivery_status = ReminderDeliveryStatus.failed_terminal
-                    stats.failed += 1
-                    log_with_fields(
-                        self.logger,
-                        logging.ERROR,
-                        "reminder delivery terminal failure",
-                        reminder_id=reminder.id,
-                        reason_code=exc.reason_code,
-                        attempt_count=reminder.attempt_count,
+        _log_run_summary(logger=self.logger, started_at=started_at, stats=stats)
+        return stats
+
+    async def _claim_digest_companions(
+        self, *, rows: list[ReminderDeliveryRow], now: datetime
+    ) -> list[ReminderDeliveryRow]:
+        # Pull each recipient's upcoming reminders forward so they share the due one's message.
+        companion_ids = await claim_upcoming_reminders_for_recipients(
+            recipient_emails=sorted(
+                {row.recipient_email for row in rows if row.reminder.channel in _DIGEST_CHANNELS}
+            ),
+            now=now,
+            until=now + timedelta(minutes=self.settings.reminder_digest_window_minutes),
+            claim_lease_seconds=self.settings.reminder_claim_lease_seconds,
+            channels=_DIGEST_CHANNELS,
+            shards=self.shards,
+        )
+        return await self.reminder_repo.list_delivery_rows(companion_ids)
+
+    def _group_for_delivery(
+        self, rows: list[ReminderDeliveryRow]
+    ) -> list[list[ReminderDeliveryRow]]:
+        if self.settings.reminder_digest_window_minutes <= 0:
+            return [[row] for row in rows]
+
+        groups: dict[str, list[ReminderDeliveryRow]] = {}
+        singles: list[list[ReminderDeliveryRow]] = []
+        for row in rows:
+            if row.reminder.channel in _DIGEST_CHANNELS:
+                groups.setdefault(row.recipient_email, []).append(row)
+            else:
+                singles.append([row])
+        return [*groups.values(), *singles]
+
+    async def _deliver_batch(
+        self,
+        *,
+        groups: list[list[ReminderDeliveryRow]],
+        now: datetime,
+        stats: ReminderRunStats,
+        semaphore: asyncio.Semaphore,
+        breaker: _DeliveryCircuitBreaker,
+    ) -> None:
+        # Sends overlap, but status mutations happen under the checkpoint lock and never await
+        # a send, so each reminder and the shared stats are updated without interleaving.
+        in_flight = 0
+        checkpoint = _OutcomeCheckpoint(
+            commit=self.reminder_repo.commit,
+            max_outcomes=self.settings.reminder_checkpoint_max_outcomes,
+            interval_seconds=self.settings.reminder_checkpoint_interval_seconds,
+            stats=stats,
+        )
+
+        # Groups whose claim is still untouched; whatever is left when the batch is cancelled
+        # is handed back unsent.
+        unstarted = dict(enumerate(groups))
+
+        async def _deliver_bounded(index: int, group: list[ReminderDeliveryRow]) -> None:
+            nonlocal in_flight
+            async with semaphore:
+                if self._stopping():
+                    async with checkpoint.lock:
+                        del unstarted[index]
+                        self._release_group(group=group, now=now, stats=stats)
+                        await checkpoint.record(len(group))
+                    return
+                open_reason = breaker.open_reason(group[0].reminder.channel)
+                if open_reason is not None:
+                    async with checkpoint.lock:
+                        del unstarted[index]
+                        self._defer_group(
+                            group=group, reason_code=open_reason, now=now, stats=stats
+                        )
+                        await checkpoint.record(len(group))
+                    return
+                del unstarted[index]
+                in_flight += 1
+                stats.in_flight_peak = max(stats.in_flight_peak, in_flight)
+                try:
+                    await self._deliver(
+                        group=group, now=now, stats=stats, breaker=breaker, checkpoint=checkpoint
                     )
-                continue
+                finally:
+                    in_flight -= 1
 
-            reminder.sent_at = now
-            reminder.next_attempt_at = now
-            reminder.delivery_status = ReminderDeliveryStatus.sent
-            reminder.failure_reason_code = None
-            stats.sent += 1
+        stats.attempted += sum(len(group) for group in groups)
+        stop_flushing = asyncio.Event()
+        periodic_flush = asyncio.create_task(checkpoint.flush_periodically(stop_flushing))
+        try:
+            # A task group cancels and awaits the other deliveries if one of them raises, so
+            # none keeps writing to the session after this batch has given up on it.
+            async with asyncio.TaskGroup() as deliveries:
+                for index, group in enumerate(groups):
+                    deliveries.create_task(_deliver_bounded(index, group))
+        finally:
+            stop_flushing.set()
+            # Shielded so a run cancelled at the drain deadline still commits the outcomes it
+            # recorded; uncommitted sends would go out again once their claim lease expires.
+            await asyncio.shield(
+                self._settle_batch(
+                    checkpoint=checkpoint,
+                    periodic_flush=periodic_flush,
+                    unstarted=list(unstarted.values()),
+                    now=now,
+                    stats=stats,
+                )
+            )
 
-        await self.reminder_repo.commit()
-        _log_run_summary(logger=self.logger, started_at=started_at, stats=stats)
+    async def _settle_batch(
+        self,
+        *,
+        checkpoint: _OutcomeCheckpoint,
+        periodic_flush: asyncio.Task[None],
+        unstarted: list[list[ReminderDeliveryRow]],
+        now: datetime,
+        stats: ReminderRunStats,
+    ) -> None:
+        await periodic_flush
+        async with checkpoint.lock:
+            for group in unstarted:
+                self._release_group(group=group, now=now, stats=stats)
+            checkpoint.pending += sum(len(group) for group in unstarted)
+            await checkpoint.flush()
+
+    async def _deliver(
+        self,
+        *,
+        group: list[ReminderDeliveryRow],
+        now: datetime,
+        stats: ReminderRunStats,
+        breaker: _DeliveryCircuitBreaker,
+        checkpoint: _OutcomeCheckpoint,
+    ) -> None:
+        channel = group[0].reminder.channel
+        failure: ReminderDeliveryError | None = None
+        send_started = time.perf_counter()
+        try:
+            await self._send(group)
+        except ReminderDeliveryError as exc:
+            failure = exc
+        except Exception:
+            # A sender bug fails this group for good instead of abandoning the whole batch.
+            self.logger.exception("reminder delivery raised an unexpected error")
+            failure = TerminalReminderDeliveryError("error")
+        finally:
+            stats.send_latencies_ms.append((time.perf_counter() - send_started) * 1000)
+
+        if failure is not None:
+            async with checkpoint.lock:
+                for row in group:
+                    self._record_failure(reminder=row.reminder, exc=failure, now=now, stats=stats)
+                await checkpoint.record(len(group))
+            if breaker.record_failure(channel, failure):
+                log_with_fields(
+                    self.logger,
+                    logging.WARNING,
+                    "reminder delivery circuit open",
+                    channel=channel,
+                    reason_code=failure.reason_code,
+                    consecutive_failures=breaker.threshold,
+                )
+            return
+
+        breaker.record_success(channel)
+        sent_at = datetime.now(UTC)
+        async with checkpoint.lock:
+            if len(group) > 1:
+                stats.digests += 1
+            for row in group:
+                reminder = row.reminder
+                reminder.sent_at = sent_at
+                reminder.next_attempt_at = sent_at
+                reminder.delivery_status = ReminderDeliveryStatus.sent
+                reminder.failure_reason_code = None
+                reminder.outcome_idempotency_key = _attempt_key(reminder)
+                stats.sent += 1
+                # Digest companions go out ahead of send_at; early counts as on time.
+                lateness = (sent_at - as_utc(reminder.send_at)).total_seconds()
+                stats.lateness_seconds.append(max(lateness, 0.0))
+            await checkpoint.record(len(group))
+
+    async def _send(self, group: list[ReminderDeliveryRow]) -> None:
+        if group[0].reminder.channel == ReminderChannel.slack and self.slack_sender is not None:
+            await self.slack_sender.send_slack_reminder(_build_reminder_email(group[0]))
+            return
 
-    async def _claim_attempt(self, *, reminder: Reminder, now: datetime) -> bool:
-        if self.claim_attempt is not None:
-            return await self.claim_attempt(reminder=reminder, now=now)
+        if len(group) == 1:
+            await self.sender.send_email_reminder(_build_reminder_email(group[0]))
+            return
 
-        return await claim_reminder_attempt_in_service(
-            reminder=reminder,
+        await self.sender.send_email_digest(
+            ReminderDigest(
+                recipient_email=group[0].recipient_email,
+                reminders=[_build_reminder_email(row) for row in group],
+            )
+        )
+
+    def _record_failure(
+        self,
+        *,
+        reminder: Reminder,
+        exc: ReminderDeliveryError,
+        now: datetime,
+        stats: ReminderRunStats,
+    ) -> None:
+        reminder.failure_reason_code = exc.reason_code
+        reminder.outcome_idempotency_key = _attempt_key(reminder)
+        stats.failure_reason_counts[exc.reason_code] += 1
+        if exc.is_transient and reminder.attempt_count < self.settings.reminder_retry_max_attempts:
+            backoff_seconds = self._retry_backoff_seconds(reminder.attempt_count)
+            # A digest companion pulled forward ahead of send_at still isn't due before it.
+            reminder.next_attempt_at = max(
+                now + timedelta(seconds=backoff_seconds), as_utc(reminder.send_at)
+            )
+            reminder.delivery_status = ReminderDeliveryStatus.retry_scheduled
+            stats.retried += 1
+            log_with_fields(
+                self.logger,
+                logging.WARNING,
+                "reminder delivery transient failure",
+                reminder_id=reminder.id,
+                reason_code=exc.reason_code,
+                attempt_count=reminder.attempt_count,
+                next_attempt_at=reminder.next_attempt_at.isoformat(),
+                backoff_seconds=round(backoff_seconds, 1),
+            )
+            return
+
+        reminder.delivery_status = ReminderDeliveryStatus.failed_terminal
+        stats.failed += 1
+        log_with_fields(
+            self.logger,
+            logging.ERROR,
+            "reminder delivery terminal failure",
+            reminder_id=reminder.id,
+            reason_code=exc.reason_code,
+            attempt_count=reminder.attempt_count,
+        )
+
+    def _check_previous_attempt_recorded(
+        self, *, reminder: Reminder, stats: ReminderRunStats
+    ) -> None:
+        # The claim already counted this attempt. If the one before it never committed an
+        # outcome, the worker died mid-send and that message may already have gone out.
+        previous_attempt = reminder.attempt_count - 1
+        if previous_attempt < 1:
+            return
+        previous_key = reminder_idempotency_key(reminder.id, previous_attempt)
+        if reminder.outcome_idempotency_key == previous_key:
+            return
+
+        stats.unrecorded_attempts += 1
+        log_with_fields(
+            self.logger,
+            logging.WARNING,
+            "reminder previous attempt outcome unrecorded",
+            reminder_id=reminder.id,
+            previous_idempotency_key=previous_key,
+            idempotency_key=_attempt_key(reminder),
+        )
+
+    def _defer_group(
+        self,
+        *,
+        group: list[ReminderDeliveryRow],
+        reason_code: str,
+        now: datetime,
+        stats: ReminderRunStats,
+    ) -> None:
+        for row in group:
+            reminder = row.reminder
+            # The claim counted an attempt, but no send happened, so give it back.
+            reminder.attempt_count = max(reminder.attempt_count - 1, 0)
+            backoff_seconds = self._deferral_backoff_seconds(max(reminder.attempt_count, 1))
+            reminder.next_attempt_at = max(
+                now + timedelta(seconds=backoff_seconds), as_utc(reminder.send_at)
+            )
+            reminder.delivery_status = ReminderDeliveryStatus.retry_scheduled
+            reminder.failure_reason_code = reason_code
+            stats.short_circuited += 1
+
+    def _release_group(
+        self, *, group: list[ReminderDeliveryRow], now: datetime, stats: ReminderRunStats
+    ) -> None:
+        for row in group:
+            reminder = row.reminder
+            # Undo the claim instead of letting its lease expire, so a peer sends it right away.
+            reminder.attempt_count = max(reminder.attempt_count - 1, 0)
+            reminder.next_attempt_at = max(now, as_utc(reminder.send_at))
+            stats.released += 1
+
+    def _stopping(self) -> bool:
+        return self.should_stop is not None and self.should_stop()
+
+    def _backoff_ceiling_seconds(self, attempt_count: int) -> float:
+        return self.settings.reminder_retry_backoff_seconds * (2 ** (attempt_count - 1))
+
+    def _retry_backoff_seconds(self, attempt_count: int) -> float:
+        # Full jitter spreads retries over the whole exponential window, so reminders that
+        # failed together during an outage don't all retry at the same instant on recovery.
+        return random.uniform(0, self._backoff_ceiling_seconds(attempt_count))
+
+    def _deferral_backoff_seconds(self, attempt_count: int) -> float:
+        # Equal jitter: a reminder deferred by an open breaker waits at least half the window,
+        # so the next run doesn't hit the failing channel again straight away.
+        half = self._backoff_ceiling_seconds(attempt_count) / 2
+        return half + random.uniform(0, half)
+
+    async def _claim_batch(self, *, now: datetime, limit: int) -> list[uuid.UUID]:
+        if self.claim_batch is not None:
+            return await self.claim_batch(
+                now=now, limit=limit, channels=self.supported_channels, shards=self.shards
+            )
+
+        return await claim_due_reminder_batch_in_service(
             now=now,
+            limit=limit,
             claim_lease_seconds=self.settings.reminder_claim_lease_seconds,
+            channels=self.supported_channels,
+            shards=self.shards,
         )
 
 
@@ -171,13 +607,19 @@ async def run_due_reminders(
     sender: ReminderSender,
     logger: logging.Logger,
     settings: Settings | None = None,
-    claim_attempt: ClaimAttemptFn | None = None,
-) -> None:
+    claim_batch: ClaimBatchFn | None = None,
+    shards: Sequence[int] | None = None,
+    slack_sender: SlackReminderSender | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ReminderRunStats:
     service = ReminderDeliveryService(
         reminder_repo=reminder_repo,
         sender=sender,
         logger=logger,
         settings=settings,
-        claim_attempt=claim_attempt,
+        claim_batch=claim_batch,
+        shards=shards,
+        slack_sender=slack_sender,
+        should_stop=should_stop,
     )
-    await service.run_due_reminders()
+    return await service.run_due_reminders()
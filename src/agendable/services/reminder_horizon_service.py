@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import agendable.db as db
+from agendable.db.models import MeetingSeries, Reminder
+from agendable.db.repos import (
+    MeetingOccurrenceRepository,
+    MeetingSeriesRepository,
+    ReminderRepository,
+)
+from agendable.reminders import (
+    as_utc,
+    build_default_email_reminder,
+    default_reminder_send_at,
+)
+from agendable.services.occurrence_materialization_service import (
+    OccurrenceMaterializationService,
+)
+from agendable.settings import Settings
+
+
+@dataclass(slots=True)
+class ReminderHorizonStats:
+    series: int = 0
+    reminders_created: int = 0
+    occurrences_created: int = 0
+    batches: int = 0
+
+
+def reminder_horizon_end(*, now: datetime, settings: Settings) -> datetime:
+    return now + timedelta(days=settings.reminder_horizon_days)
+
+
+async def _materialize_occurrences_for_horizon(
+    session: AsyncSession,
+    batch: list[MeetingSeries],
+    *,
+    horizon_end: datetime,
+    settings: Settings,
+) -> int:
+    """Write the virtual occurrences whose default reminder sends by ``horizon_end``."""
+    materializer = OccurrenceMaterializationService.from_session(session)
+    created = 0
+    for series in batch:
+        lead = timedelta(minutes=max(series.reminder_minutes_before, 0))
+        occurrences = await materializer.materialize_through(
+            series, through=horizon_end + lead, settings=settings
+        )
+        created += len(occurrences)
+    return created
+
+
+async def materialize_reminder_horizon(
+    *, now: datetime, settings: Settings
+) -> ReminderHorizonStats:
+    """Write default email reminders that send by the horizon and advance each series' mark.
+
+    Series are processed in batches of ``reminder_horizon_batch_size``, one transaction per
+    batch. A series only needs work once its high-water mark falls behind the horizon, and
+    each pass only looks at occurrences past that mark, so reruns stay cheap. Virtual
+    occurrences whose reminders fall inside the horizon are materialized first.
+    """
+    stats = ReminderHorizonStats()
+    if not settings.enable_default_email_reminders:
+        return stats
+
+    horizon_end = reminder_horizon_end(now=now, settings=settings)
+    batch_size = settings.reminder_horizon_batch_size
+    while True:
+        async with db.SessionMaker() as session:
+            series_repo = MeetingSeriesRepository(session)
+            batch = await series_repo.lock_behind_reminder_horizon(
+                horizon_end=horizon_end, limit=batch_size
+            )
+            if not batch:
+                break
+
+            series_by_id = {series.id: series for series in batch}
+            # The lock query only returns series with a mark; NULL never compares below it.
+            marks = {
+                series.id: as_utc(series.reminders_materialized_until)
+                for series in batch
+                if series.reminders_materialized_until is not None
+            }
+            occurrences_created = await _materialize_occurrences_for_horizon(
+                session, batch, horizon_end=horizon_end, settings=settings
+            )
+
+            max_lead_minutes = max(max(series.reminder_minutes_before, 0) for series in batch)
+            candidates = await MeetingOccurrenceRepository(
+                session
+            ).list_unreminded_after_reminder_horizon(
+                series_ids=list(series_by_id),
+                scheduled_until=horizon_end + timedelta(minutes=max_lead_minutes),
+            )
+
+            reminders: list[Reminder] = []
+            for occurrence_id, series_id, scheduled_at in candidates:
+                lead_minutes = series_by_id[series_id].reminder_minutes_before
+                send_at = default_reminder_send_at(scheduled_at, settings, lead_minutes)
+                # Reminders sending at or before the old mark belong to an earlier pass.
+                if not marks[series_id] < send_at <= horizon_end:
+                    continue
+                reminders.append(
+                    build_default_email_reminder(
+                        occurrence_id=occurrence_id,
+                        occurrence_scheduled_at=scheduled_at,
+                        settings=settings,
+                        lead_minutes_before=lead_minutes,
+                    )
+                )
+
+            session.add_all(reminders)
+            await series_repo.advance_reminder_horizon(
+                series_ids=list(series_by_id), materialized_until=horizon_end
+            )
+            if reminders:
+                await ReminderRepository(session).notify_scheduled(
+                    send_at=min(reminder.send_at for reminder in reminders)
+                )
+            await session.commit()
+
+        stats.batches += 1
+        stats.series += len(batch)
+        stats.reminders_created += len(reminders)
+        stats.occurrences_created += occurrences_created
+        if len(batch) < batch_size:
+            break
+    return stats
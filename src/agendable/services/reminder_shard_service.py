@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+
+import agendable.db as db
+from agendable.db.models import REMINDER_SHARD_COUNT
+from agendable.db.repos import ReminderShardLeaseRepository
+
+
+def fair_shard_share(*, live_workers: int, shard_count: int = REMINDER_SHARD_COUNT) -> int:
+    return math.ceil(shard_count / max(live_workers, 1))
+
+
+async def rebalance_reminder_shards(
+    *,
+    worker_id: str,
+    now: datetime,
+    lease_seconds: int,
+) -> list[int]:
+    """Heartbeat ``worker_id``, renew its shard leases, and move it toward a fair share.
+
+    Each live worker targets ``ceil(shards / live workers)`` shards: it releases any
+    excess so newcomers can pick them up, and leases unowned or expired shards (e.g.
+    from a dead worker) until it reaches its share. Returns the shards it now owns.
+    """
+    lease_expires_at = now + timedelta(seconds=lease_seconds)
+    async with db.SessionMaker() as session:
+        lease_repo = ReminderShardLeaseRepository(session)
+        await lease_repo.ensure_shards(REMINDER_SHARD_COUNT)
+        await lease_repo.prune_stale_workers(seen_before=now - timedelta(seconds=lease_seconds))
+        await lease_repo.record_heartbeat(worker_id=worker_id, now=now)
+        target = fair_shard_share(live_workers=await lease_repo.count_live_workers())
+
+        owned = await lease_repo.renew(worker_id=worker_id, lease_expires_at=lease_expires_at)
+        if len(owned) > target:
+            await lease_repo.release(worker_id=worker_id, shards=owned[target:])
+            owned = owned[:target]
+        elif len(owned) < target:
+            owned += await lease_repo.acquire_available(
+                worker_id=worker_id,
+                now=now,
+                lease_expires_at=lease_expires_at,
+                limit=target - len(owned),
+            )
+        await lease_repo.commit()
+    return sorted(owned)
+
+
+async def release_reminder_shards(*, worker_id: str) -> None:
+    async with db.SessionMaker() as session:
+        lease_repo = ReminderShardLeaseRepository(session)
+        await lease_repo.release(worker_id=worker_id)
+        await lease_repo.remove_worker(worker_id)
+        await lease_repo.commit()
@@ -1,20 +1,37 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agendable.db.models import MeetingOccurrence, MeetingSeries, User
+from agendable.db.models import (
+    AgendaItemArchive,
+    MeetingOccurrence,
+    MeetingOccurrenceArchive,
+    MeetingSeries,
+    TaskArchive,
+    User,
+)
 from agendable.db.repos import (
+    ArchiveRepository,
     MeetingOccurrenceAttendeeRepository,
     MeetingOccurrenceRepository,
     MeetingSeriesRepository,
+    ReminderRepository,
     UserRepository,
 )
 from agendable.recurrence import generate_datetimes
-from agendable.reminders import build_default_email_reminder
+from agendable.reminders import as_utc, build_default_email_reminder
+from agendable.services.occurrence_materialization_service import (
+    OccurrenceMaterializationService,
+    VirtualOccurrence,
+    occurrence_materialization_end,
+)
+from agendable.services.reminder_horizon_service import reminder_horizon_end
 from agendable.settings import Settings
 
 
@@ -28,6 +45,13 @@ class SeriesNotFoundError(LookupError):
     pass
 
 
+@dataclass(slots=True)
+class ArchivedOccurrence:
+    occurrence: MeetingOccurrenceArchive
+    tasks: list[TaskArchive] = field(default_factory=list)
+    agenda_items: list[AgendaItemArchive] = field(default_factory=list)
+
+
 class SeriesService:
     def __init__(
         self,
@@ -37,12 +61,34 @@ class SeriesService:
         attendees: MeetingOccurrenceAttendeeRepository,
         series: MeetingSeriesRepository,
         occurrences: MeetingOccurrenceRepository,
+        reminders: ReminderRepository,
+        archive: ArchiveRepository | None = None,
+        materializer: OccurrenceMaterializationService | None = None,
     ) -> None:
         self.session = session
         self.users = users
         self.attendees = attendees
         self.series = series
         self.occurrences = occurrences
+        self.reminders = reminders
+        self.archive = archive or ArchiveRepository(session)
+        self.materializer = materializer or OccurrenceMaterializationService(
+            session=session,
+            occurrences=occurrences,
+            attendees=attendees,
+            reminders=reminders,
+        )
+
+    @classmethod
+    def from_session(cls, session: AsyncSession) -> SeriesService:
+        return cls(
+            session=session,
+            users=UserRepository(session),
+            attendees=MeetingOccurrenceAttendeeRepository(session),
+            series=MeetingSeriesRepository(session),
+            occurrences=MeetingOccurrenceRepository(session),
+            reminders=ReminderRepository(session),
+        )
 
     async def list_series_for_owner(self, owner_user_id: uuid.UUID) -> list[MeetingSeries]:
         return await self.series.list_for_owner(owner_user_id)
@@ -62,6 +108,65 @@ class SeriesService:
     ) -> list[MeetingOccurrence]:
         return await self.occurrences.list_for_series(series_id)
 
+    async def list_virtual_series_occurrences(
+        self,
+        *,
+        series: MeetingSeries,
+        after: datetime,
+        limit: int,
+    ) -> list[VirtualOccurrence]:
+        return await self.materializer.list_virtual_occurrences(series, after=after, limit=limit)
+
+    async def materialize_occurrence_for_owner(
+        self,
+        *,
+        owner_user_id: uuid.UUID,
+        series_id: uuid.UUID,
+        scheduled_at: datetime,
+        settings: Settings,
+    ) -> MeetingOccurrence | None:
+        """Return the series' occurrence at ``scheduled_at``, writing it if still virtual.
+
+        Returns None when ``scheduled_at`` is neither an existing nor a virtual occurrence.
+        """
+        series = await self.series.get_for_owner(series_id, owner_user_id)
+        if series is None:
+            raise SeriesNotFoundError
+
+        occurrence = await self.materializer.materialize_at(
+            series, scheduled_at=scheduled_at, settings=settings
+        )
+        if occurrence is not None:
+            await self.session.commit()
+        return occurrence
+
+    async def list_archived_series_occurrences(
+        self,
+        *,
+        series_id: uuid.UUID,
+    ) -> list[ArchivedOccurrence]:
+        """Load a series' archived meetings with their archived tasks and agenda items."""
+        occurrences = await self.archive.list_occurrences_for_series(series_id)
+        if not occurrences:
+            return []
+
+        occurrence_ids = [occ.id for occ in occurrences]
+        tasks_by_occurrence: dict[uuid.UUID, list[TaskArchive]] = defaultdict(list)
+        for task in await self.archive.list_tasks_for_occurrences(occurrence_ids):
+            tasks_by_occurrence[task.occurrence_id].append(task)
+        items_by_occurrence: dict[uuid.UUID, list[AgendaItemArchive]] = defaultdict(list)
+        for item in await self.archive.list_agenda_items_for_occurrences(occurrence_ids):
+            items_by_occurrence[item.occurrence_id].append(item)
+
+        return [
+            ArchivedOccurrence(
+                occurrence=occ,
+                tasks=tasks_by_occurrence.get(occ.id, []),
+                agenda_items=items_by_occurrence.get(occ.id, []),
+            )
+            for occ in occurrences
+        ]
+
     @staticmethod
     def select_active_occurrence(
         occurrences: list[MeetingOccurrence],
@@ -122,7 +227,13 @@ class SeriesService:
         recurrence_timezone: str,
         generate_count: int,
         settings: Settings,
+        window_materialization: bool = True,
     ) -> tuple[MeetingSeries, list[MeetingOccurrence]]:
+        """Create a series and write its first occurrences.
+
+        Up to ``generate_count`` occurrences are written, but with ``window_materialization``
+        only those inside the materialization window; later ones stay virtual until touched.
+        """
         series = MeetingSeries(
             owner_user_id=owner_user_id,
             title=title,
@@ -142,6 +253,14 @@ class SeriesService:
         if not scheduled:
             raise ValueError("RRULE produced no occurrences")
 
+        now = datetime.now(UTC)
+        if window_materialization:
+            materialize_until = occurrence_materialization_end(
+                first_scheduled_at=scheduled[0], now=now, settings=settings
+            )
+            scheduled = [dt for dt in scheduled if as_utc(dt) <= materialize_until]
+        series.occurrences_materialized_until = as_utc(scheduled[-1])
+
         occurrences: list[MeetingOccurrence] = []
         for dt in scheduled:
             occurrence = MeetingOccurrence(
@@ -154,8 +273,13 @@ class SeriesService:
         await self.session.flush()
 
         if settings.enable_default_email_reminders:
-            self.session.add_all(
-                [
+            # Only reminders sending within the horizon are written now; the reminder
+            # horizon job materializes the rest as they come within range.
+            horizon_end = reminder_horizon_end(now=now, settings=settings)
+            series.reminders_materialized_until = horizon_end
+            reminders = [
+                reminder
+                for reminder in (
                     build_default_email_reminder(
                         occurrence_id=occ.id,
                         occurrence_scheduled_at=occ.scheduled_at,
@@ -163,8 +287,14 @@ class SeriesService:
                         lead_minutes_before=series.reminder_minutes_before,
                     )
                     for occ in occurrences
-                ]
-            )
+                )
+                if reminder.send_at <= horizon_end
+            ]
+            if reminders:
+                self.session.add_all(reminders)
+                await self.reminders.notify_scheduled(
+                    send_at=min(reminder.send_at for reminder in reminders)
+                )
 
         return series, occurrences
 
@@ -281,23 +411,32 @@ class SeriesService:
         series = await self.series.get_for_owner(series_id, owner_user_id)
         if series is None:
             raise SeriesNotFoundError
+        # Lock out the horizon jobs so the reminder mark read below stays current.
+        await self.session.refresh(series, with_for_update=True)
 
-        occurrence = MeetingOccurrence(
-            series_id=series_id,
-            scheduled_at=scheduled_at,
-            notes="",
+        created = await self.occurrences.insert_missing_for_series(
+            series_id=series_id, scheduled=[scheduled_at]
         )
-        await self.occurrences.add(occurrence)
+        if not created:
+            # The series already meets then; that meeting keeps its own reminders.
+            return await self.occurrences.one_where(
+                MeetingOccurrence.series_id == series_id,
+                MeetingOccurrence.scheduled_at == scheduled_at,
+            )
+        occurrence = created[0]
 
         if settings.enable_default_email_reminders:
-            self.session.add(
-                build_default_email_reminder(
-                    occurrence_id=occurrence.id,
-                    occurrence_scheduled_at=occurrence.scheduled_at,
-                    settings=settings,
-                    lead_minutes_before=series.reminder_minutes_before,
-                )
+            reminder = build_default_email_reminder(
+                occurrence_id=occurrence.id,
+                occurrence_scheduled_at=occurrence.scheduled_at,
+                settings=settings,
+                lead_minutes_before=series.reminder_minutes_before,
             )
+            # Past the series' high-water mark, the reminder horizon job writes it later.
+            materialized_until = series.reminders_materialized_until
+            if materialized_until is None or reminder.send_at <= as_utc(materialized_until):
+                self.session.add(reminder)
+                await self.reminders.notify_scheduled(send_at=reminder.send_at)
 
         await self.session.commit()
         return occurrence
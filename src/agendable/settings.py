@@ -56,6 +56,9 @@ class Settings(BaseSettings):
 
     # Reminder integrations (optional for now)
     slack_webhook_url: SecretStr | None = None
+    slack_timeout_seconds: float = Field(default=10.0, gt=0)
+    # A 429 asking for a longer pause fails the attempt instead of holding the run.
+    slack_max_retry_after_seconds: float = Field(default=30.0, ge=0)
     smtp_host: str | None = None
     smtp_port: int = 587
     smtp_username: str | None = None
@@ -64,12 +67,48 @@ class Settings(BaseSettings):
     smtp_use_ssl: bool = False
     smtp_use_starttls: bool = True
     smtp_timeout_seconds: float = 10.0
+    # "threaded" sends via smtplib on worker threads; "asyncio" sends on the event loop.
+    smtp_transport: Literal["threaded", "asyncio"] = "threaded"
+    smtp_pool_max_messages_per_connection: int = Field(default=100, ge=1)
+    smtp_pool_idle_timeout_seconds: float = Field(default=30.0, gt=0)
+    # When set, reminder emails go through this HTTP bulk-send API instead of SMTP.
+    email_api_url: str | None = None
+    email_api_key: SecretStr | None = None
+    email_api_timeout_seconds: float = Field(default=10.0, gt=0)
+    email_api_batch_size: int = Field(default=100, ge=1)
+    email_api_batch_linger_seconds: float = Field(default=0.05, ge=0)
     enable_default_email_reminders: bool = True
     default_email_reminder_minutes_before: int = 60
     reminder_worker_poll_seconds: int = 60
     reminder_retry_max_attempts: int = Field(default=3, ge=1)
     reminder_retry_backoff_seconds: int = Field(default=60, ge=1)
+    reminder_circuit_breaker_threshold: int = Field(default=5, ge=1)
     reminder_claim_lease_seconds: int = Field(default=30, ge=1)
+    reminder_claim_batch_size: int = Field(default=100, ge=1)
+    reminder_delivery_concurrency: int = Field(default=10, ge=1)
+    reminder_shard_lease_seconds: int = Field(default=90, ge=3)
+    reminder_digest_window_minutes: int = Field(default=0, ge=0)
+    reminder_checkpoint_max_outcomes: int = Field(default=100, ge=1)
+    reminder_checkpoint_interval_seconds: float = Field(default=2.0, gt=0)
+    # Reminder rows are only materialized for reminders sending within this many days.
+    reminder_horizon_days: int = Field(default=14, ge=1)
+    reminder_horizon_interval_seconds: int = Field(default=3600, ge=1)
+    reminder_horizon_batch_size: int = Field(default=500, ge=1)
+    # New series only write occurrences scheduled within this many days; later ones are virtual.
+    occurrence_materialize_days: int = Field(default=14, ge=1)
+    # The occurrence horizon job tops each recurring series up to this many future occurrences.
+    occurrence_horizon_count: int = Field(default=4, ge=1)
+    occurrence_horizon_batch_size: int = Field(default=500, ge=1)
+    occurrence_horizon_worker_poll_seconds: int = Field(default=3600, ge=1)
+
+    # Archival: rows past their retention age move from the hot tables to *_archive tables.
+    archive_reminder_retention_days: int = Field(default=90, ge=1)
+    archive_occurrence_retention_days: int = Field(default=365, ge=1)
+    archive_batch_size: int = Field(default=500, ge=1)
+    archive_worker_poll_seconds: int = Field(default=3600, ge=1)
+
+    # On SIGTERM/SIGINT, workers stop claiming work and give in-flight work this long to finish.
+    worker_shutdown_grace_seconds: float = Field(default=25.0, gt=0)
 
     # OIDC (optional)
     oidc_client_id: str | None = None
@@ -101,6 +140,10 @@ class Settings(BaseSettings):
     google_calendar_api_base_url: str = "https://www.googleapis.com/calendar/v3"
     google_calendar_initial_sync_days_back: int = Field(default=90, ge=1)
     google_calendar_sync_worker_poll_seconds: int = Field(default=60, ge=1)
+    # Connections synced at once by a sync pass, each in its own session and transaction.
+    google_calendar_sync_concurrency: int = Field(default=4, ge=1)
+    # Connection pool size of the sync worker's shared keep-alive client for Google APIs.
+    google_calendar_http_max_connections: int = Field(default=20, ge=1)
 
     # Optional: write a backlink + stable key back to Google Calendar invites.
     # Requires a write scope such as: https://www.googleapis.com/auth/calendar.events
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import MeetingSeries, User
+from agendable.services.series_service import SeriesService
+from agendable.settings import Settings
+
+
+async def create_weekly_series(
+    session: AsyncSession,
+    *,
+    owner: User,
+    title: str,
+    generate_count: int,
+    settings: Settings,
+    attendees: Sequence[User] = (),
+) -> MeetingSeries:
+    """Create and commit a weekly series starting tomorrow, linking owner and attendees."""
+    dtstart = (datetime.now(UTC) + timedelta(days=1)).replace(microsecond=0)
+    service = SeriesService.from_session(session)
+    series, occurrences = await service.create_series_with_occurrences(
+        owner_user_id=owner.id,
+        title=title,
+        reminder_minutes_before=60,
+        recurrence_rrule="FREQ=WEEKLY;INTERVAL=1",
+        recurrence_dtstart=dtstart,
+        recurrence_timezone="UTC",
+        generate_count=generate_count,
+        settings=settings,
+    )
+    await service.link_attendees_to_occurrences(
+        occurrences=occurrences,
+        attendee_user_ids={owner.id, *(attendee.id for attendee in attendees)},
+    )
+    await session.commit()
+    return series
@@ -13,6 +13,7 @@ from agendable.auth import require_user
 from agendable.db.models import User
 from agendable.dependencies import get_series_service, get_session
 from agendable.logging_config import log_with_fields
+from agendable.services.occurrence_materialization_service import parse_occurrence_stamp
 from agendable.services.series_service import (
     SeriesNotFoundError,
     SeriesService,
@@ -210,6 +211,34 @@ async def series_detail(
     )
 
 
+@router.get("/series/{series_id}/history", response_class=HTMLResponse, name="series_history")
+async def series_history(
+    request: Request,
+    series_id: uuid.UUID,
+    current_user: User = Depends(require_user),
+    series_service: SeriesService = Depends(get_series_service),
+) -> HTMLResponse:
+    series = await series_service.get_owned_series(
+        series_id=series_id,
+        owner_user_id=current_user.id,
+    )
+    if series is None:
+        raise HTTPException(status_code=404)
+
+    archived_occurrences = await series_service.list_archived_series_occurrences(
+        series_id=series_id
+    )
+    return templates.TemplateResponse(
+        request,
+        "series_history.html",
+        {
+            "series": series,
+            "archived_occurrences": archived_occurrences,
+            "current_user": current_user,
+        },
+    )
+
+
 @router.post("/series/{series_id}/attendees", response_class=RedirectResponse)
 async def add_series_attendee(
     request: Request,
@@ -309,3 +338,49 @@ async def create_occurrence(
         url=request.app.url_path_for("series_detail", series_id=str(series_id)),
         status_code=303,
     )
+
+
+# A POST, so link prefetchers and crawlers can't write occurrences and reminders.
+@router.post(
+    "/series/{series_id}/occurrences/at/{stamp}",
+    response_class=RedirectResponse,
+    name="open_planned_occurrence",
+)
+async def open_planned_occurrence(
+    request: Request,
+    series_id: uuid.UUID,
+    stamp: str,
+    current_user: User = Depends(require_user),
+    series_service: SeriesService = Depends(get_series_service),
+) -> RedirectResponse:
+    try:
+        scheduled_at = parse_occurrence_stamp(stamp)
+    except ValueError as exc:
+        raise HTTPException(status_code=404) from exc
+
+    try:
+        occ = await series_service.materialize_occurrence_for_owner(
+            owner_user_id=current_user.id,
+            series_id=series_id,
+            scheduled_at=scheduled_at,
+            settings=get_settings(),
+        )
+    except SeriesNotFoundError as exc:
+        raise HTTPException(status_code=404) from exc
+    if occ is None:
+        raise HTTPException(status_code=404)
+
+    log_with_fields(
+        logger,
+        logging.INFO,
+        "planned occurrence opened",
+        user_id=current_user.id,
+        series_id=series_id,
+        occurrence_id=occ.id,
+        scheduled_at=occ.scheduled_at,
+    )
+
+    return RedirectResponse(
+        url=request.app.url_path_for("occurrence_detail", occurrence_id=str(occ.id)),
+        status_code=303,
+    )
@@ -12,6 +12,8 @@ from agendable.services.series_service import SeriesService
 from agendable.web.routes.common import recurrence_label, templates
 
 VALID_RECURRENCE_FREQS = {"DAILY", "WEEKLY", "MONTHLY"}
+# Upcoming meetings without a row yet that the series page lists after the written ones.
+VIRTUAL_OCCURRENCE_DISPLAY_LIMIT = 10
 
 
 def normalize_recurrence_freq(raw: str) -> str:
@@ -117,10 +119,16 @@ async def render_series_detail(
     if series is None:
         raise HTTPException(status_code=404)
 
+    now = datetime.now(UTC)
     occurrences = await series_service.list_series_occurrences(series_id=series_id)
     active_occurrence: MeetingOccurrence | None = series_service.select_active_occurrence(
         occurrences,
-        now=datetime.now(UTC),
+        now=now,
+    )
+    virtual_occurrences = await series_service.list_virtual_series_occurrences(
+        series=series,
+        after=now,
+        limit=VIRTUAL_OCCURRENCE_DISPLAY_LIMIT,
     )
 
     selected_attendee_form = {"email": ""}
@@ -139,6 +147,7 @@ async def render_series_detail(
                 default_interval_days=series.default_interval_days,
             ),
             "occurrences": occurrences,
+            "virtual_occurrences": virtual_occurrences,
             "active_occurrence": active_occurrence,
             "attendee_form": selected_attendee_form,
             "attendee_form_errors": attendee_form_errors or {},
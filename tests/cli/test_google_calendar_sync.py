@@ -1,20 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from types import SimpleNamespace
-from typing import Any
 
+import httpx
 import pytest
 
-import agendable.db as db
 from agendable.cli import calendar_sync as cli
-
-
-class _FakeSessionContext:
-    async def __aenter__(self) -> object:
-        return object()
-
-    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        return None
+from agendable.services.google_calendar_sync_service import GoogleCalendarSyncRunStats
 
 
 class _DummyConnectionRepo:
@@ -31,8 +24,21 @@ class _FakeSyncService:
     def __init__(self, **kwargs: object) -> None:
         self.kwargs = kwargs
 
-    async def sync_all_enabled_connections(self) -> int:
-        return 7
+
+async def _fake_sync_concurrently(
+    *,
+    build_service: Callable[[object], object],
+    concurrency: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> GoogleCalendarSyncRunStats:
+    _ = should_stop
+    build_service(object())
+    return GoogleCalendarSyncRunStats(
+        connections=concurrency,
+        synced=concurrency,
+        synced_event_count=7,
+        connection_latencies_ms=[12.0, 30.0],
+    )
 
 
 @pytest.mark.asyncio
@@ -61,13 +67,14 @@ async def test_run_google_calendar_sync_executes_when_enabled(
         google_calendar_sync_enabled=True,
         google_calendar_api_base_url="https://www.googleapis.com/calendar/v3",
         google_calendar_initial_sync_days_back=90,
+        google_calendar_sync_concurrency=2,
+        google_calendar_http_max_connections=4,
     )
     monkeypatch.setattr(
         cli,
         "get_settings",
         lambda: settings,
     )
-    monkeypatch.setattr(db, "SessionMaker", lambda: _FakeSessionContext())
     monkeypatch.setattr(cli, "ExternalCalendarConnectionRepository", _DummyConnectionRepo)
     monkeypatch.setattr(cli, "ExternalCalendarEventMirrorRepository", _DummyMirrorRepo)
     captured: dict[str, object] = {}
@@ -77,7 +84,14 @@ async def test_run_google_calendar_sync_executes_when_enabled(
         return _FakeSyncService(**kwargs)
 
     monkeypatch.setattr(cli, "GoogleCalendarSyncService", _capture_sync_service)
+    monkeypatch.setattr(cli, "sync_enabled_connections_concurrently", _fake_sync_concurrently)
 
     synced = await cli.run_google_calendar_sync()
     assert synced == 7
     assert captured.get("settings") is settings
+    shared_client = captured.get("http_client")
+    assert isinstance(shared_client, httpx.AsyncClient)
+    calendar_client = captured.get("calendar_client")
+    assert isinstance(calendar_client, cli.GoogleCalendarHttpClient)
+    assert calendar_client.client is shared_client
+    assert shared_client.is_closed
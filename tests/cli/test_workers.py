@@ -2,10 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import smtplib
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from email.message import EmailMessage
+from typing import Any
 
 import pytest
 
 from agendable.cli import calendar_sync, reminders
+from agendable.cli.shutdown import WorkerDrainTimeoutError, WorkerShutdown
+from agendable.reminders import (
+    ReminderEmail,
+    ReminderSender,
+    SlackReminderSender,
+    SmtpReminderSender,
+)
+from agendable.services.reminder_delivery_service import ReminderRunStats
+from agendable.services.reminder_horizon_service import ReminderHorizonStats
 
 
 @pytest.mark.asyncio
@@ -14,10 +28,11 @@ async def test_google_calendar_sync_worker_logs_iteration_complete(
 ) -> None:
     captured: list[tuple[str, dict[str, object]]] = []
 
-    async def _fake_run() -> int:
+    async def _fake_run(*, should_stop: Callable[[], bool]) -> int:
+        _ = should_stop
         return 3
 
-    async def _cancel_sleep(_: int) -> None:
+    async def _cancel_sleep(_shutdown: WorkerShutdown, _: float) -> None:
         raise asyncio.CancelledError
 
     def _capture_log_with_fields(
@@ -29,7 +44,7 @@ async def test_google_calendar_sync_worker_logs_iteration_complete(
         captured.append((message, fields))
 
     monkeypatch.setattr(calendar_sync, "run_google_calendar_sync", _fake_run)
-    monkeypatch.setattr(asyncio, "sleep", _cancel_sleep)
+    monkeypatch.setattr(WorkerShutdown, "sleep", _cancel_sleep)
     monkeypatch.setattr(calendar_sync, "log_with_fields", _capture_log_with_fields)
 
     with pytest.raises(asyncio.CancelledError):
@@ -48,10 +63,11 @@ async def test_google_calendar_sync_worker_survives_exception(
 ) -> None:
     captured: list[tuple[str, dict[str, object]]] = []
 
-    async def _boom() -> int:
+    async def _boom(*, should_stop: Callable[[], bool]) -> int:
+        _ = should_stop
         raise RuntimeError("boom")
 
-    async def _cancel_sleep(_: int) -> None:
+    async def _cancel_sleep(_shutdown: WorkerShutdown, _: float) -> None:
         raise asyncio.CancelledError
 
     def _capture_log_with_fields(
@@ -63,7 +79,7 @@ async def test_google_calendar_sync_worker_survives_exception(
         captured.append((message, fields))
 
     monkeypatch.setattr(calendar_sync, "run_google_calendar_sync", _boom)
-    monkeypatch.setattr(asyncio, "sleep", _cancel_sleep)
+    monkeypatch.setattr(WorkerShutdown, "sleep", _cancel_sleep)
     monkeypatch.setattr(calendar_sync, "log_with_fields", _capture_log_with_fields)
 
     caplog.set_level(logging.ERROR)
@@ -80,14 +96,130 @@ async def test_google_calendar_sync_worker_survives_exception(
     )
 
 
+def _capture_shutdowns(monkeypatch: pytest.MonkeyPatch) -> list[WorkerShutdown]:
+    """Capture the worker's ``WorkerShutdown`` so a fake run can request shutdown itself."""
+    created: list[WorkerShutdown] = []
+
+    def _build(**kwargs: Any) -> WorkerShutdown:
+        shutdown = WorkerShutdown(**kwargs)
+        created.append(shutdown)
+        return shutdown
+
+    monkeypatch.setattr(calendar_sync, "WorkerShutdown", _build)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_google_calendar_sync_worker_finishes_in_flight_run_on_shutdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: list[tuple[str, dict[str, object]]] = []
+    shutdowns = _capture_shutdowns(monkeypatch)
+    stop_checks: list[bool] = []
+
+    async def _fake_run(*, should_stop: Callable[[], bool]) -> int:
+        shutdowns[0].request("SIGTERM")
+        stop_checks.append(should_stop())
+        return 5
+
+    def _capture_log_with_fields(
+        _logger: logging.Logger,
+        _level: int,
+        message: str,
+        **fields: object,
+    ) -> None:
+        captured.append((message, fields))
+
+    monkeypatch.setattr(calendar_sync, "run_google_calendar_sync", _fake_run)
+    monkeypatch.setattr(calendar_sync, "log_with_fields", _capture_log_with_fields)
+
+    await calendar_sync.run_google_calendar_sync_worker(30)
+
+    assert stop_checks == [True]
+    assert any(
+        msg == "google calendar sync worker drained"
+        and fields.get("signal") == "SIGTERM"
+        and fields.get("synced_event_count") == 5
+        and fields.get("deadline_exceeded") is False
+        for msg, fields in captured
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_shutdown_cancels_work_that_outlives_grace_period() -> None:
+    shutdown = WorkerShutdown(grace_seconds=0.01)
+    cancelled: list[bool] = []
+
+    async def _stuck() -> int:
+        shutdown.request("SIGTERM")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 1
+
+    with pytest.raises(WorkerDrainTimeoutError):
+        await shutdown.finish(_stuck())
+
+    assert cancelled == [True]
+    assert shutdown.deadline_exceeded is True
+
+
+@pytest.mark.asyncio
+async def test_worker_shutdown_sleep_returns_once_requested() -> None:
+    shutdown = WorkerShutdown(grace_seconds=1)
+    shutdown.request("SIGTERM")
+
+    async with asyncio.timeout(1):
+        await shutdown.sleep(60)
+
+
 @pytest.mark.asyncio
 async def test_reminders_worker_logs_iteration_complete(monkeypatch: pytest.MonkeyPatch) -> None:
     captured: list[tuple[str, dict[str, object]]] = []
 
-    async def _fake_run_due() -> None:
-        return None
+    waits: list[float] = []
+
+    released: list[str] = []
+
+    async def _fake_rebalance(*, worker_id: str, now: datetime, lease_seconds: int) -> list[int]:
+        _ = worker_id
+        _ = now
+        _ = lease_seconds
+        return [3, 7]
+
+    async def _fake_release(*, worker_id: str) -> None:
+        released.append(worker_id)
+
+    horizon_runs: list[int] = []
 
-    async def _cancel_sleep(_: int) -> None:
+    async def _fake_horizon() -> ReminderHorizonStats:
+        horizon_runs.append(1)
+        return ReminderHorizonStats()
+
+    async def _fake_run_due(
+        sender: ReminderSender | None = None,
+        *,
+        shards: Sequence[int] | None = None,
+        slack_sender: SlackReminderSender | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ReminderRunStats:
+        _ = slack_sender
+        assert sender is not None
+        assert shards == [3, 7]
+        assert should_stop is not None and should_stop() is False
+        return ReminderRunStats(
+            queue_depth_at_start=4, oldest_overdue_seconds=42.25, lateness_seconds=[0.5, 90.0]
+        )
+
+    async def _fake_seconds_until_next_run(poll_seconds: float, *, shards: Sequence[int]) -> float:
+        assert poll_seconds == 30
+        assert shards == [3, 7]
+        return 12.5
+
+    async def _cancel_wait(_wakeup: reminders.ReminderWakeup, timeout_seconds: float) -> None:
+        waits.append(timeout_seconds)
         raise asyncio.CancelledError
 
     def _capture_log_with_fields(
@@ -98,11 +230,170 @@ async def test_reminders_worker_logs_iteration_complete(monkeypatch: pytest.Monk
     ) -> None:
         captured.append((message, fields))
 
+    monkeypatch.setattr(reminders, "rebalance_reminder_shards", _fake_rebalance)
+    monkeypatch.setattr(reminders, "release_reminder_shards", _fake_release)
+    monkeypatch.setattr(reminders, "run_reminder_horizon", _fake_horizon)
     monkeypatch.setattr(reminders, "run_due_reminders", _fake_run_due)
-    monkeypatch.setattr(asyncio, "sleep", _cancel_sleep)
+    monkeypatch.setattr(reminders, "_seconds_until_next_run", _fake_seconds_until_next_run)
+    monkeypatch.setattr(reminders.ReminderWakeup, "wait", _cancel_wait)
     monkeypatch.setattr(reminders, "log_with_fields", _capture_log_with_fields)
 
     with pytest.raises(asyncio.CancelledError):
         await reminders.run_reminders_worker(30)
 
-    assert any(msg == "reminders worker iteration complete" for msg, _ in captured)
+    assert waits == [12.5]
+    assert horizon_runs == [1]
+    assert len(released) == 1
+    assert any(
+        msg == "reminders worker iteration complete"
+        and fields.get("sleep_seconds") == 12.5
+        and fields.get("shard_count") == 2
+        and fields.get("queue_depth") == 4
+        and fields.get("oldest_overdue_seconds") == 42.2
+        for msg, fields in captured
+    )
+    assert any(
+        msg == "reminders worker lateness histogram"
+        and fields.get("le_1s") == 1
+        and fields.get("le_60s") == 1
+        and fields.get("le_120s") == 2
+        and fields.get("le_inf") == 2
+        for msg, fields in captured
+    )
+
+
+class _FakeSmtpSession:
+    """Stands in for an ``smtplib.SMTP`` session opened by the sender."""
+
+    def __init__(self) -> None:
+        self.logins: list[str] = []
+        self.sent_subjects: list[str] = []
+        self.quit_called = False
+
+    def starttls(self) -> None:
+        return None
+
+    def login(self, username: str, password: str) -> None:
+        _ = password
+        self.logins.append(username)
+
+    def send_message(self, msg: EmailMessage) -> dict[str, object]:
+        self.sent_subjects.append(str(msg["Subject"]))
+        return {}
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_reminders_worker_reuses_one_smtp_session_across_iterations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    opened: list[_FakeSmtpSession] = []
+
+    def _open_session(host: str, port: int, *, timeout: float) -> _FakeSmtpSession:
+        _ = (host, port, timeout)
+        session = _FakeSmtpSession()
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr(smtplib, "SMTP", _open_session)
+    sender = SmtpReminderSender(
+        host="smtp.example.com",
+        port=587,
+        from_email="noreply@example.com",
+        username="mailer",
+        password="secret",
+        use_ssl=False,
+        use_starttls=True,
+        timeout_seconds=1.0,
+    )
+    waits: list[float] = []
+
+    async def _fake_rebalance(*, worker_id: str, now: datetime, lease_seconds: int) -> list[int]:
+        _ = (worker_id, now, lease_seconds)
+        return [0]
+
+    async def _fake_release(*, worker_id: str) -> None:
+        _ = worker_id
+
+    async def _fake_horizon() -> ReminderHorizonStats:
+        return ReminderHorizonStats()
+
+    async def _fake_run_due(
+        sender: ReminderSender | None = None,
+        *,
+        shards: Sequence[int] | None = None,
+        slack_sender: SlackReminderSender | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> ReminderRunStats:
+        _ = (shards, slack_sender, should_stop)
+        assert sender is not None
+        await sender.send_email_reminder(
+            ReminderEmail(
+                recipient_email="owner@example.com",
+                meeting_title="Weekly 1:1",
+                scheduled_at=datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+            )
+        )
+        return ReminderRunStats()
+
+    async def _fake_seconds_until_next_run(poll_seconds: float, *, shards: Sequence[int]) -> float:
+        _ = shards
+        return poll_seconds
+
+    async def _wait_then_cancel(_wakeup: reminders.ReminderWakeup, timeout_seconds: float) -> None:
+        waits.append(timeout_seconds)
+        if len(waits) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(reminders, "build_reminder_sender", lambda _settings: sender)
+    monkeypatch.setattr(reminders, "rebalance_reminder_shards", _fake_rebalance)
+    monkeypatch.setattr(reminders, "release_reminder_shards", _fake_release)
+    monkeypatch.setattr(reminders, "run_reminder_horizon", _fake_horizon)
+    monkeypatch.setattr(reminders, "run_due_reminders", _fake_run_due)
+    monkeypatch.setattr(reminders, "_seconds_until_next_run", _fake_seconds_until_next_run)
+    monkeypatch.setattr(reminders.ReminderWakeup, "wait", _wait_then_cancel)
+
+    with pytest.raises(asyncio.CancelledError):
+        await reminders.run_reminders_worker(30)
+
+    assert len(waits) == 2
+    assert len(opened) == 1
+    session = opened[0]
+    assert session.logins == ["mailer"]
+    assert len(session.sent_subjects) == 2
+    assert session.quit_called is True
+
+
+def test_reminders_worker_sleeps_until_next_due_within_poll_bound() -> None:
+    now = datetime(2030, 1, 1, 9, 0, tzinfo=UTC)
+
+    assert reminders.seconds_until_next_run(None, now=now, poll_seconds=60) == 60
+    assert (
+        reminders.seconds_until_next_run(now + timedelta(seconds=5), now=now, poll_seconds=60) == 5
+    )
+    assert (
+        reminders.seconds_until_next_run(now + timedelta(minutes=5), now=now, poll_seconds=60) == 60
+    )
+    assert (
+        reminders.seconds_until_next_run(now - timedelta(seconds=5), now=now, poll_seconds=60) == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_reminder_wakeup_fires_only_for_reminders_due_before_deadline() -> None:
+    wakeup = reminders.ReminderWakeup()
+    wakeup.deadline = datetime(2030, 1, 1, 9, 0, tzinfo=UTC)
+
+    wakeup.notify("2030-01-01T09:30:00+00:00")
+    assert wakeup.event.is_set() is False
+
+    wakeup.notify("2030-01-01T08:45:00+00:00")
+    assert wakeup.event.is_set() is True
+
+    await wakeup.wait(30)
+    assert wakeup.deadline is None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import gc
+from contextlib import aclosing
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -8,7 +11,10 @@ import httpx
 import pytest
 
 import agendable.services.google_calendar_client as gcal
-from agendable.services.external_calendar_api import ExternalCalendarAuth
+from agendable.services.external_calendar_api import (
+    ExternalCalendarAuth,
+    ExternalCalendarPageCursor,
+)
 from agendable.services.google_calendar_client import GoogleCalendarHttpClient
 
 
@@ -111,6 +117,90 @@ async def test_list_events_paginates_and_parses_items(monkeypatch: pytest.Monkey
     assert second_params["pageToken"] == "page-2"
 
 
+@pytest.mark.asyncio
+async def test_list_events_reuses_shared_client_and_leaves_it_open() -> None:
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"items": [], "nextSyncToken": "sync-1"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as shared:
+        client = GoogleCalendarHttpClient(api_base_url="https://example.test", client=shared)
+        for calendar_id in ("primary", "team"):
+            batch = await client.list_events(
+                auth=ExternalCalendarAuth(access_token="access", refresh_token=None),
+                calendar_id=calendar_id,
+                sync_token="prev-sync",
+            )
+            assert batch.next_sync_token == "sync-1"
+        assert not shared.is_closed
+
+    assert [request.url.path for request in requests] == [
+        "/calendars/primary/events",
+        "/calendars/team/events",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_event_pages_resumes_from_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    resp = _StubResponse({"items": [], "nextSyncToken": "sync-3"})
+    stub = _StubAsyncClient([("GET", resp)])
+    monkeypatch.setattr(httpx, "AsyncClient", lambda *a, **k: stub)
+
+    client = GoogleCalendarHttpClient(api_base_url="https://example.test")
+    pages = [
+        page
+        async for page in client.list_event_pages(
+            auth=ExternalCalendarAuth(access_token="access", refresh_token=None),
+            calendar_id="primary",
+            sync_token=None,
+            resume_from=ExternalCalendarPageCursor(
+                page_token="page-3", time_min=datetime(2026, 1, 1, tzinfo=UTC)
+            ),
+        )
+    ]
+
+    assert [page.next_sync_token for page in pages] == ["sync-3"]
+    assert pages[0].resume_from is None
+    params = stub.calls[0]["params"]
+    assert isinstance(params, dict)
+    assert params["pageToken"] == "page-3"
+    assert params["timeMin"] == "2026-01-01T00:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_list_event_pages_collects_abandoned_prefetch_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = _StubResponse({"items": [], "nextPageToken": "page-2"})
+    stub = _StubAsyncClient([("GET", first), ("GET", _StubResponse({}, status_code=500))])
+    monkeypatch.setattr(httpx, "AsyncClient", lambda *a, **k: stub)
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+
+    try:
+        client = GoogleCalendarHttpClient(api_base_url="https://example.test")
+        async with aclosing(
+            client.list_event_pages(
+                auth=ExternalCalendarAuth(access_token="access", refresh_token=None),
+                calendar_id="primary",
+                sync_token=None,
+            )
+        ) as pages:
+            async for _page in pages:
+                # Let the prefetch of page 2 fail, then stop reading.
+                await asyncio.sleep(0)
+                break
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert len(stub.calls) == 2
+    assert unhandled == []
+
+
 @pytest.mark.asyncio
 async def test_list_events_uses_sync_token_when_provided(monkeypatch: pytest.MonkeyPatch) -> None:
     resp = _StubResponse({"items": [], "nextSyncToken": "sync-1"})
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
+import httpx
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agendable.db.models import (
@@ -21,7 +23,10 @@ from agendable.db.repos import (
     ExternalCalendarEventMirrorRepository,
 )
 from agendable.services.calendar_event_mapping_service import CalendarEventMappingService
-from agendable.services.external_calendar_api import ExternalCalendarAuth
+from agendable.services.external_calendar_api import (
+    ExternalCalendarAuth,
+    ExternalCalendarPageCursor,
+)
 from agendable.services.google_calendar_sync_service import (
     ExternalCalendarEvent,
     ExternalCalendarSyncBatch,
@@ -196,6 +201,222 @@ async def test_google_calendar_sync_service_upserts_mirror_and_sync_token(
     assert series_count == []
 
 
+class _FakePagedGoogleCalendarClient(_FakeGoogleCalendarClient):
+    """Hands over two pages and records how many mirrors exist before the second one."""
+
+    def __init__(self, pages: list[ExternalCalendarSyncBatch], session: AsyncSession) -> None:
+        super().__init__(pages[-1])
+        self.pages = pages
+        self.session = session
+        self.mirror_counts_before_page: list[int] = []
+
+    async def list_event_pages(
+        self,
+        *,
+        auth: ExternalCalendarAuth,
+        calendar_id: str,
+        sync_token: str | None,
+    ) -> AsyncIterator[ExternalCalendarSyncBatch]:
+        assert calendar_id == "primary"
+        assert sync_token is None
+        del auth
+        for page in self.pages:
+            mirror_count = await self.session.scalar(
+                select(func.count()).select_from(ExternalCalendarEventMirror)
+            )
+            self.mirror_counts_before_page.append(mirror_count or 0)
+            yield page
+
+    async def list_events(
+        self,
+        *,
+        auth: ExternalCalendarAuth,
+        calendar_id: str,
+        sync_token: str | None,
+    ) -> ExternalCalendarSyncBatch:
+        raise AssertionError("list_events should not be called for a paged client")
+
+
+def _one_off_event(event_id: str) -> ExternalCalendarEvent:
+    return ExternalCalendarEvent(
+        event_id=event_id,
+        recurring_event_id=None,
+        status="confirmed",
+        etag=None,
+        summary=f"Meeting {event_id}",
+        start_at=datetime(2026, 3, 4, 18, 0, tzinfo=UTC),
+        end_at=datetime(2026, 3, 4, 18, 30, tzinfo=UTC),
+        is_all_day=False,
+        external_updated_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_google_calendar_sync_service_upserts_each_page_as_it_arrives(
+    db_session: AsyncSession,
+) -> None:
+    user = User(
+        email=f"sync-pages-{uuid.uuid4()}@example.com",
+        first_name="Sync",
+        last_name="Pages",
+        display_name="Sync Pages",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    connection = ExternalCalendarConnection(
+        user_id=user.id,
+        provider=CalendarProvider.google,
+        external_calendar_id="primary",
+        access_token="access-token",
+        refresh_token="refresh-token",
+    )
+    db_session.add(connection)
+    await db_session.commit()
+
+    client = _FakePagedGoogleCalendarClient(
+        [
+            ExternalCalendarSyncBatch(
+                events=[_one_off_event("evt-1"), _one_off_event("evt-2")], next_sync_token=None
+            ),
+            ExternalCalendarSyncBatch(
+                events=[_one_off_event("evt-3")], next_sync_token="sync-token-paged"
+            ),
+        ],
+        db_session,
+    )
+    service = GoogleCalendarSyncService(
+        connection_repo=ExternalCalendarConnectionRepository(db_session),
+        event_mirror_repo=ExternalCalendarEventMirrorRepository(db_session),
+        calendar_client=client,
+        event_mapper=CalendarEventMappingService(session=db_session),
+    )
+
+    synced_count = await service.sync_connection(connection)
+
+    assert synced_count == 3
+    # The first page was already written when the second one was handed over.
+    assert client.mirror_counts_before_page == [0, 2]
+    refreshed_connection = await db_session.get(ExternalCalendarConnection, connection.id)
+    assert refreshed_connection is not None
+    assert refreshed_connection.sync_token == "sync-token-paged"
+
+
+class _FakeFlakyPagedGoogleCalendarClient(_FakeGoogleCalendarClient):
+    """Serves three pages, failing the request for the second page on the first sync."""
+
+    def __init__(self) -> None:
+        super().__init__(ExternalCalendarSyncBatch(events=[], next_sync_token=None))
+        self.resumed_from: list[ExternalCalendarPageCursor | None] = []
+        self.fail_page_2 = True
+
+    async def list_event_pages(
+        self,
+        *,
+        auth: ExternalCalendarAuth,
+        calendar_id: str,
+        sync_token: str | None,
+        resume_from: ExternalCalendarPageCursor | None = None,
+    ) -> AsyncIterator[ExternalCalendarSyncBatch]:
+        del auth, calendar_id
+        assert sync_token is None
+        self.resumed_from.append(resume_from)
+        time_min = datetime(2026, 1, 1, tzinfo=UTC)
+        pages = {
+            "page-1": ExternalCalendarSyncBatch(
+                events=[_one_off_event("evt-1")],
+                next_sync_token=None,
+                resume_from=ExternalCalendarPageCursor(page_token="page-2", time_min=time_min),
+            ),
+            "page-2": ExternalCalendarSyncBatch(
+                events=[_one_off_event("evt-2")],
+                next_sync_token=None,
+                resume_from=ExternalCalendarPageCursor(page_token="page-3", time_min=time_min),
+            ),
+            "page-3": ExternalCalendarSyncBatch(
+                events=[_one_off_event("evt-3")], next_sync_token="sync-token-resumed"
+            ),
+        }
+        page_token = "page-1" if resume_from is None else resume_from.page_token
+        while True:
+            if page_token == "page-2" and self.fail_page_2:
+                self.fail_page_2 = False
+                request = httpx.Request("GET", "https://example.test")
+                response = httpx.Response(503, request=request)
+                raise httpx.HTTPStatusError("Unavailable", request=request, response=response)
+            page = pages[page_token]
+            yield page
+            if page.resume_from is None:
+                return
+            page_token = page.resume_from.page_token
+
+
+@pytest.mark.asyncio
+async def test_google_calendar_sync_service_resumes_bootstrap_from_checkpoint(
+    db_session: AsyncSession,
+) -> None:
+    user = User(
+        email=f"sync-resume-{uuid.uuid4()}@example.com",
+        first_name="Sync",
+        last_name="Resume",
+        display_name="Sync Resume",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    connection = ExternalCalendarConnection(
+        user_id=user.id,
+        provider=CalendarProvider.google,
+        external_calendar_id="primary",
+        access_token="access-token",
+        refresh_token="refresh-token",
+    )
+    db_session.add(connection)
+    await db_session.commit()
+
+    client = _FakeFlakyPagedGoogleCalendarClient()
+    service = GoogleCalendarSyncService(
+        connection_repo=ExternalCalendarConnectionRepository(db_session),
+        event_mirror_repo=ExternalCalendarEventMirrorRepository(db_session),
+        calendar_client=client,
+        event_mapper=CalendarEventMappingService(session=db_session),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await service.sync_connection(connection)
+    await db_session.rollback()
+
+    checkpointed = await db_session.get(ExternalCalendarConnection, connection.id)
+    assert checkpointed is not None
+    assert checkpointed.sync_page_token == "page-2"
+    assert checkpointed.sync_pages_processed == 1
+    assert checkpointed.sync_token is None
+
+    synced_count = await service.sync_connection(checkpointed)
+
+    # The second sync picked up at page 2 with the first sync's window.
+    assert synced_count == 2
+    assert client.resumed_from[1] is not None
+    assert client.resumed_from[1].page_token == "page-2"
+    assert client.resumed_from[1].time_min == datetime(2026, 1, 1, tzinfo=UTC)
+    assert checkpointed.sync_token == "sync-token-resumed"
+    assert checkpointed.sync_page_token is None
+    assert checkpointed.sync_page_time_min is None
+    assert checkpointed.sync_pages_processed == 0
+    mirror_ids = (
+        await db_session.execute(
+            select(ExternalCalendarEventMirror.external_event_id).where(
+                ExternalCalendarEventMirror.connection_id == connection.id
+            )
+        )
+    ).scalars()
+    assert sorted(mirror_ids) == ["evt-1", "evt-2", "evt-3"]
+
+
 class _FakeRecurringDetailsClient:
     def __init__(self, batch: ExternalCalendarSyncBatch) -> None:
         self.batch = batch
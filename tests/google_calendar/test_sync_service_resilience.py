@@ -26,6 +26,7 @@ from agendable.services.google_calendar_sync_service import (
     ExternalCalendarSyncBatch,
     ExternalRecurringEventDetails,
     GoogleCalendarSyncService,
+    sync_enabled_connections_concurrently,
 )
 from agendable.settings import Settings
 
@@ -818,6 +819,9 @@ class _FakeFailingAllClient:
         assert auth.access_token
         assert sync_token is None
 
+        if calendar_id == "cal-ok":
+            return ExternalCalendarSyncBatch(events=[], next_sync_token="sync-token-ok")
+
         request = httpx.Request("GET", "https://example.test")
         if calendar_id == "cal-401":
             response = httpx.Response(401, request=request)
@@ -933,6 +937,157 @@ async def test_google_calendar_sync_service_sync_all_records_errors_and_continue
     assert refreshed_error.last_sync_error_at is not None
 
 
+@pytest.mark.asyncio
+async def test_concurrent_sync_uses_a_session_per_connection_and_records_errors(
+    db_session: AsyncSession,
+) -> None:
+    user = User(
+        email=f"sync-concurrent-{uuid.uuid4()}@example.com",
+        first_name="Sync",
+        last_name="Concurrent",
+        display_name="Sync Concurrent",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    connections = {
+        calendar_id: ExternalCalendarConnection(
+            user_id=user.id,
+            provider=CalendarProvider.google,
+            external_calendar_id=calendar_id,
+            access_token=f"access-token-{calendar_id}",
+            refresh_token=None if calendar_id == "cal-401" else f"refresh-{calendar_id}",
+            access_token_expires_at=datetime.now(UTC) + timedelta(hours=2),
+        )
+        for calendar_id in ("cal-ok", "cal-401", "cal-500", "cal-error")
+    }
+    db_session.add_all(connections.values())
+    await db_session.commit()
+
+    sessions: list[AsyncSession] = []
+
+    def _build_service(session: AsyncSession) -> GoogleCalendarSyncService:
+        sessions.append(session)
+        return GoogleCalendarSyncService(
+            connection_repo=ExternalCalendarConnectionRepository(session),
+            event_mirror_repo=ExternalCalendarEventMirrorRepository(session),
+            calendar_client=_FakeFailingAllClient(),
+            settings=Settings(google_calendar_sync_enabled=True),
+        )
+
+    stats = await sync_enabled_connections_concurrently(build_service=_build_service, concurrency=2)
+
+    assert stats.connections == 4
+    assert stats.synced == 1
+    assert stats.failed == 3
+    assert len(stats.connection_latencies_ms) == 4
+    assert len({id(session) for session in sessions}) == 4
+
+    db_session.expire_all()
+    expected_codes = {"cal-ok": None, "cal-401": "needs_reauth", "cal-500": "http_500"}
+    expected_codes["cal-error"] = "error"
+    for calendar_id, expected_code in expected_codes.items():
+        refreshed = await db_session.get(ExternalCalendarConnection, connections[calendar_id].id)
+        assert refreshed is not None
+        assert refreshed.last_sync_error_code == expected_code
+    refreshed_ok = await db_session.get(ExternalCalendarConnection, connections["cal-ok"].id)
+    assert refreshed_ok is not None
+    assert refreshed_ok.sync_token == "sync-token-ok"
+
+
+async def _create_connection(db_session: AsyncSession, label: str) -> ExternalCalendarConnection:
+    user = User(
+        email=f"sync-{label}-{uuid.uuid4()}@example.com",
+        first_name="Sync",
+        last_name=label.title(),
+        display_name=f"Sync {label.title()}",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    connection = ExternalCalendarConnection(
+        user_id=user.id,
+        provider=CalendarProvider.google,
+        external_calendar_id=f"cal-{label}",
+        access_token=f"access-token-{label}",
+        refresh_token=f"refresh-token-{label}",
+        access_token_expires_at=datetime.now(UTC) + timedelta(hours=2),
+    )
+    db_session.add(connection)
+    await db_session.commit()
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_sync_records_error_code_after_a_database_error(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connection = await _create_connection(db_session, "db-error")
+    owner = await db_session.get(User, connection.user_id)
+    assert owner is not None
+    service = GoogleCalendarSyncService(
+        connection_repo=ExternalCalendarConnectionRepository(db_session),
+        event_mirror_repo=ExternalCalendarEventMirrorRepository(db_session),
+        calendar_client=_FakeFailingAllClient(),
+        settings=Settings(google_calendar_sync_enabled=True),
+    )
+
+    async def _fail_flush(_connection: ExternalCalendarConnection) -> int:
+        # A duplicate email leaves the session needing a rollback before its next commit.
+        db_session.add(
+            User(
+                email=owner.email,
+                first_name="Dup",
+                last_name="User",
+                display_name="Dup User",
+                timezone="UTC",
+                password_hash=None,
+            )
+        )
+        await db_session.flush()
+        return 0
+
+    monkeypatch.setattr(service, "sync_connection", _fail_flush)
+
+    assert await service.sync_connection_recording_errors(connection) is None
+
+    db_session.expire_all()
+    refreshed = await db_session.get(ExternalCalendarConnection, connection.id)
+    assert refreshed is not None
+    assert refreshed.last_sync_error_code == "error"
+    assert refreshed.last_sync_error_at is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sync_counts_unrecordable_failures(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await _create_connection(db_session, "unrecordable")
+
+    def _build_service(session: AsyncSession) -> GoogleCalendarSyncService:
+        service = GoogleCalendarSyncService(
+            connection_repo=ExternalCalendarConnectionRepository(session),
+            event_mirror_repo=ExternalCalendarEventMirrorRepository(session),
+            calendar_client=_FakeFailingAllClient(),
+            settings=Settings(google_calendar_sync_enabled=True),
+        )
+
+        async def _database_down(_connection: ExternalCalendarConnection) -> int | None:
+            raise RuntimeError("database is down")
+
+        monkeypatch.setattr(service, "sync_connection_recording_errors", _database_down)
+        return service
+
+    stats = await sync_enabled_connections_concurrently(build_service=_build_service, concurrency=2)
+
+    assert stats.connections == 1
+    assert stats.synced == 0
+    assert stats.failed == 1
+
+
 @pytest.mark.asyncio
 async def test_google_calendar_sync_service_refreshes_expired_access_token(
     db_session: AsyncSession,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import uuid
+from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import agendable.db.repos.external_calendar_event_mirrors as mirror_repo_module
 from agendable.db.models import (
     CalendarProvider,
     ExternalCalendarConnection,
@@ -74,3 +77,80 @@ async def test_get_or_create_for_connection_event_handles_unique_violation_race(
         external_event_id="evt-1",
     )
     assert got.id == mirror.id
+
+
+@pytest.mark.asyncio
+async def test_upsert_for_connection_events_inserts_updates_and_keeps_links(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user = await _new_user(f"mirror-upsert-{uuid.uuid4()}@example.com")
+    db_session.add(user)
+    await db_session.flush()
+
+    connection = ExternalCalendarConnection(
+        user_id=user.id,
+        provider=CalendarProvider.google,
+        external_calendar_id="primary",
+        calendar_display_name="Primary",
+    )
+    db_session.add(connection)
+    await db_session.flush()
+
+    existing = ExternalCalendarEventMirror(
+        connection_id=connection.id,
+        external_event_id="evt-1",
+        summary="Old title",
+    )
+    db_session.add(existing)
+    await db_session.commit()
+
+    # Two events per statement, so the three distinct events take two chunks.
+    monkeypatch.setattr(mirror_repo_module, "UPSERT_CHUNK_SIZE", 2)
+    repo = ExternalCalendarEventMirrorRepository(db_session)
+    seen_at = datetime.now(UTC)
+    mirrors = await repo.upsert_for_connection_events(
+        connection_id=connection.id,
+        rows=[
+            _mirror_row("evt-3", summary="Third", seen_at=seen_at),
+            _mirror_row("evt-1", summary="Stale", seen_at=seen_at),
+            _mirror_row("evt-2", summary="Second", seen_at=seen_at),
+            _mirror_row("evt-1", summary="New title", seen_at=seen_at),
+        ],
+    )
+
+    assert [mirror.external_event_id for mirror in mirrors] == ["evt-3", "evt-1", "evt-2"]
+    assert mirrors[1].id == existing.id
+    assert mirrors[1] is existing
+    assert existing.summary == "New title"
+    assert existing.linked_occurrence_id is None
+    assert mirrors[0].summary == "Third"
+
+    await db_session.commit()
+    rows = (
+        (
+            await db_session.execute(
+                select(ExternalCalendarEventMirror).where(
+                    ExternalCalendarEventMirror.connection_id == connection.id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert sorted(row.external_event_id for row in rows) == ["evt-1", "evt-2", "evt-3"]
+
+
+def _mirror_row(event_id: str, *, summary: str, seen_at: datetime) -> dict[str, object]:
+    return {
+        "external_event_id": event_id,
+        "external_recurring_event_id": None,
+        "external_status": "confirmed",
+        "etag": None,
+        "summary": summary,
+        "start_at": None,
+        "end_at": None,
+        "is_all_day": False,
+        "external_updated_at": None,
+        "last_seen_at": seen_at,
+    }
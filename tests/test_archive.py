@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import (
+    AgendaItem,
+    AgendaItemArchive,
+    Base,
+    MeetingOccurrence,
+    MeetingOccurrenceArchive,
+    MeetingOccurrenceAttendee,
+    MeetingSeries,
+    Reminder,
+    ReminderArchive,
+    ReminderChannel,
+    ReminderDeliveryStatus,
+    Task,
+    TaskArchive,
+    User,
+)
+from agendable.services.archive_service import archive_expired_rows
+from agendable.settings import Settings
+from agendable.testing.web_test_helpers import create_series, login_user
+
+
+async def _count(db_session: AsyncSession, model: type[Base]) -> int:
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+async def _add_owner(db_session: AsyncSession) -> User:
+    owner = User(
+        email="archive-owner@example.com",
+        first_name="Archive",
+        last_name="Owner",
+        display_name="Archive Owner",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    return owner
+
+
+async def _add_occurrence(
+    db_session: AsyncSession,
+    *,
+    series: MeetingSeries,
+    owner: User,
+    scheduled_at: datetime,
+    task_done: bool,
+) -> MeetingOccurrence:
+    occurrence = MeetingOccurrence(
+        series_id=series.id, scheduled_at=scheduled_at, notes="", is_completed=True
+    )
+    db_session.add(occurrence)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            MeetingOccurrenceAttendee(occurrence_id=occurrence.id, user_id=owner.id),
+            AgendaItem(occurrence_id=occurrence.id, body="Discuss roadmap", is_done=True),
+            Task(
+                occurrence_id=occurrence.id,
+                assigned_user_id=owner.id,
+                title="Write notes",
+                due_at=scheduled_at,
+                is_done=task_done,
+            ),
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=scheduled_at - timedelta(hours=1),
+                sent_at=scheduled_at - timedelta(hours=1),
+                delivery_status=ReminderDeliveryStatus.sent,
+            ),
+        ]
+    )
+    await db_session.flush()
+    return occurrence
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_old_completed_occurrences_with_their_rows(
+    db_session: AsyncSession,
+) -> None:
+    owner = await _add_owner(db_session)
+    series = MeetingSeries(owner_user_id=owner.id, title="Archived 1:1", default_interval_days=7)
+    db_session.add(series)
+    await db_session.flush()
+    now = datetime.now(UTC)
+    old = await _add_occurrence(
+        db_session,
+        series=series,
+        owner=owner,
+        scheduled_at=now - timedelta(days=400),
+        task_done=True,
+    )
+    # An open task keeps an old meeting in the hot tables.
+    await _add_occurrence(
+        db_session,
+        series=series,
+        owner=owner,
+        scheduled_at=now - timedelta(days=393),
+        task_done=False,
+    )
+    await db_session.commit()
+
+    stats = await archive_expired_rows(now=now, settings=Settings(archive_batch_size=1))
+
+    assert stats.occurrences == 1
+    # Both sent reminders are past the 90-day reminder retention.
+    assert stats.reminders == 2
+    db_session.expire_all()
+    assert await db_session.get(MeetingOccurrence, old.id) is None
+    assert await _count(db_session, MeetingOccurrence) == 1
+    assert await _count(db_session, MeetingOccurrenceArchive) == 1
+    assert await _count(db_session, TaskArchive) == 1
+    assert await _count(db_session, AgendaItemArchive) == 1
+    assert await _count(db_session, ReminderArchive) == 2
+    assert await _count(db_session, Reminder) == 0
+    assert await _count(db_session, Task) == 1
+
+    rerun = await archive_expired_rows(now=now, settings=Settings())
+    assert rerun.occurrences == 0
+    assert rerun.reminders == 0
+
+
+@pytest.mark.asyncio
+async def test_series_history_page_reads_archived_meetings(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "alice@example.com", "pw-alice")
+    series = await create_series(
+        client, db_session, owner_email="alice@example.com", title="History series"
+    )
+    owner = (
+        await db_session.execute(select(User).where(User.email == "alice@example.com"))
+    ).scalar_one()
+    now = datetime.now(UTC)
+    await _add_occurrence(
+        db_session,
+        series=series,
+        owner=owner,
+        scheduled_at=now - timedelta(days=500),
+        task_done=True,
+    )
+    await db_session.commit()
+    await archive_expired_rows(now=now, settings=Settings())
+
+    resp = await client.get(f"/series/{series.id}/history")
+
+    assert resp.status_code == 200
+    assert "Discuss roadmap" in resp.text
+    assert "Write notes" in resp.text
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import (
+    MeetingOccurrence,
+    MeetingOccurrenceAttendee,
+    MeetingSeries,
+    Reminder,
+    User,
+)
+from agendable.reminders import as_utc
+from agendable.services.occurrence_horizon_service import materialize_occurrence_horizon
+from agendable.settings import Settings
+from agendable.testing.series_test_helpers import create_weekly_series
+
+
+def _user(email: str) -> User:
+    return User(
+        email=email,
+        first_name="Horizon",
+        last_name="User",
+        display_name="Horizon User",
+        password_hash=None,
+    )
+
+
+async def _create_weekly_series(
+    db_session: AsyncSession, *, owner: User, attendee: User | None = None
+) -> MeetingSeries:
+    return await create_weekly_series(
+        db_session,
+        owner=owner,
+        title="Weekly top-up",
+        generate_count=10,
+        settings=Settings(occurrence_materialize_days=14),
+        attendees=() if attendee is None else (attendee,),
+    )
+
+
+async def _scheduled_times(db_session: AsyncSession, series: MeetingSeries) -> list[datetime]:
+    result = await db_session.execute(
+        select(MeetingOccurrence.scheduled_at)
+        .where(MeetingOccurrence.series_id == series.id)
+        .order_by(MeetingOccurrence.scheduled_at.asc())
+    )
+    return [as_utc(scheduled_at) for scheduled_at in result.scalars().all()]
+
+
+@pytest.mark.asyncio
+async def test_occurrence_horizon_tops_series_up_with_attendees_and_reminders(
+    db_session: AsyncSession,
+) -> None:
+    owner = _user("top-up-owner@example.com")
+    teammate = _user("top-up-teammate@example.com")
+    db_session.add_all([owner, teammate])
+    await db_session.flush()
+    series = await _create_weekly_series(db_session, owner=owner, attendee=teammate)
+    first = (await _scheduled_times(db_session, series))[0]
+    assert len(await _scheduled_times(db_session, series)) == 3
+
+    # Reminders sending within the series' reminder mark are written with their meeting.
+    series.reminders_materialized_until = first + timedelta(days=30)
+    await db_session.commit()
+
+    now = first + timedelta(days=20)
+    stats = await materialize_occurrence_horizon(
+        now=now, settings=Settings(occurrence_horizon_count=4)
+    )
+
+    assert stats.series == 1
+    assert stats.series_topped_up == 1
+    assert stats.occurrences_created == 4
+    assert stats.attendee_links_created == 8
+    # Days 21 and 28 send within the reminder mark; days 35 and 42 are left to the horizon job.
+    assert stats.reminders_created == 2
+
+    db_session.expire_all()
+    scheduled = await _scheduled_times(db_session, series)
+    assert scheduled[3:] == [first + timedelta(days=days) for days in (21, 28, 35, 42)]
+    refreshed = await db_session.get(MeetingSeries, series.id)
+    assert refreshed is not None
+    assert refreshed.occurrences_materialized_until is not None
+    assert as_utc(refreshed.occurrences_materialized_until) == first + timedelta(days=42)
+
+    teammate_links = await db_session.scalar(
+        select(func.count())
+        .select_from(MeetingOccurrenceAttendee)
+        .join(MeetingOccurrence, MeetingOccurrenceAttendee.occurrence_id == MeetingOccurrence.id)
+        .where(
+            MeetingOccurrence.series_id == series.id,
+            MeetingOccurrenceAttendee.user_id == teammate.id,
+        )
+    )
+    assert teammate_links == 7
+    reminder_count = await db_session.scalar(
+        select(func.count())
+        .select_from(Reminder)
+        .join(MeetingOccurrence, Reminder.occurrence_id == MeetingOccurrence.id)
+        .where(MeetingOccurrence.series_id == series.id)
+    )
+    # Two from series creation, two from the top-up.
+    assert reminder_count == 4
+
+
+@pytest.mark.asyncio
+async def test_occurrence_horizon_skips_touched_occurrences_and_is_idempotent(
+    db_session: AsyncSession,
+) -> None:
+    owner = _user("top-up-rerun@example.com")
+    db_session.add(owner)
+    await db_session.flush()
+    series = await _create_weekly_series(db_session, owner=owner)
+    first = (await _scheduled_times(db_session, series))[0]
+
+    # A planned meeting opened ahead of the mark already has its row.
+    db_session.add(
+        MeetingOccurrence(series_id=series.id, scheduled_at=first + timedelta(days=21), notes="")
+    )
+    await db_session.commit()
+
+    settings = Settings(occurrence_horizon_count=4)
+    stats = await materialize_occurrence_horizon(now=first, settings=settings)
+
+    # Upcoming after ``first``: days 7 and 14 exist, 21 was opened, 28 is new.
+    assert stats.occurrences_created == 1
+    db_session.expire_all()
+    scheduled = await _scheduled_times(db_session, series)
+    assert scheduled == [first + timedelta(days=days) for days in (0, 7, 14, 21, 28)]
+
+    rerun = await materialize_occurrence_horizon(now=first, settings=settings)
+    assert rerun.series == 1
+    assert rerun.series_topped_up == 0
+    assert rerun.occurrences_created == 0
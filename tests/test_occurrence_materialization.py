@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import agendable.db as db
+from agendable.db.models import (
+    MeetingOccurrence,
+    MeetingOccurrenceAttendee,
+    MeetingSeries,
+    Reminder,
+    User,
+)
+from agendable.services.occurrence_materialization_service import (
+    OccurrenceMaterializationService,
+)
+from agendable.settings import Settings
+
+
+async def _create_planned_series(db_session: AsyncSession) -> MeetingSeries:
+    owner = User(
+        email="planned-owner@example.com",
+        first_name="Planned",
+        last_name="Owner",
+        display_name="Planned Owner",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+
+    dtstart = datetime(2030, 1, 1, 9, 0, tzinfo=UTC)
+    series = MeetingSeries(
+        owner_user_id=owner.id,
+        title="Planned weekly",
+        default_interval_days=7,
+        reminder_minutes_before=60,
+        recurrence_rrule="FREQ=WEEKLY;INTERVAL=1",
+        recurrence_dtstart=dtstart,
+        recurrence_timezone="UTC",
+        occurrences_materialized_until=dtstart,
+        reminders_materialized_until=dtstart + timedelta(days=365),
+    )
+    db_session.add(series)
+    await db_session.flush()
+    db_session.add(MeetingOccurrence(series_id=series.id, scheduled_at=dtstart, notes=""))
+    await db_session.commit()
+    return series
+
+
+async def _materialize_in_own_session(series_id: uuid.UUID, scheduled_at: datetime) -> uuid.UUID:
+    async with db.SessionMaker() as session:
+        series = await session.get(MeetingSeries, series_id)
+        assert series is not None
+        occurrence = await OccurrenceMaterializationService.from_session(session).materialize_at(
+            series, scheduled_at=scheduled_at, settings=Settings()
+        )
+        assert occurrence is not None
+        await session.commit()
+        return occurrence.id
+
+
+@pytest.mark.asyncio
+async def test_concurrent_materialize_at_writes_the_instance_once(
+    db_session: AsyncSession,
+) -> None:
+    series = await _create_planned_series(db_session)
+    scheduled_at = datetime(2030, 1, 15, 9, 0, tzinfo=UTC)
+
+    first_id, second_id = await asyncio.gather(
+        _materialize_in_own_session(series.id, scheduled_at),
+        _materialize_in_own_session(series.id, scheduled_at),
+    )
+
+    assert first_id == second_id
+    occurrence_count = (
+        await db_session.execute(
+            select(func.count())
+            .select_from(MeetingOccurrence)
+            .where(
+                MeetingOccurrence.series_id == series.id,
+                MeetingOccurrence.scheduled_at == scheduled_at,
+            )
+        )
+    ).scalar_one()
+    assert occurrence_count == 1
+
+    reminder_count = (
+        await db_session.execute(
+            select(func.count()).select_from(Reminder).where(Reminder.occurrence_id == first_id)
+        )
+    ).scalar_one()
+    assert reminder_count == 1
+    attendee_count = (
+        await db_session.execute(
+            select(func.count())
+            .select_from(MeetingOccurrenceAttendee)
+            .where(MeetingOccurrenceAttendee.occurrence_id == first_id)
+        )
+    ).scalar_one()
+    assert attendee_count == 1
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import pytest
+from dateutil.rrule import rrulestr
 
-from agendable.recurrence import build_rrule, describe_recurrence, generate_datetimes
+from agendable.recurrence import (
+    build_rrule,
+    clear_rrule_cache,
+    compile_rrule,
+    describe_recurrence,
+    expand_between,
+    generate_datetimes,
+    rrule_cache_stats,
+)
 
 
 def test_describe_recurrence_daily_defaults_and_interval_coercion() -> None:
@@ -167,3 +177,69 @@ def test_generate_datetimes_handles_zero_count_and_naive_dtstart() -> None:
     assert len(generated) == 2
     assert generated[0] == datetime(2030, 1, 1, 9, 0, tzinfo=UTC)
     assert generated[1] == datetime(2030, 1, 2, 9, 0, tzinfo=UTC)
+
+
+def test_compile_rrule_reuses_parsed_rules_per_wall_clock_dtstart_and_zone() -> None:
+    clear_rrule_cache()
+    chicago = ZoneInfo("America/Chicago")
+    dtstart = datetime(2030, 1, 7, 9, 0, tzinfo=chicago)
+
+    first = compile_rrule("RRULE:FREQ=WEEKLY;BYDAY=MO", dtstart=dtstart)
+    again = compile_rrule(" FREQ=WEEKLY;BYDAY=MO ", dtstart=dtstart)
+    # Same instant, different zone: must not reuse the Chicago-anchored rule.
+    utc_rule = compile_rrule("FREQ=WEEKLY;BYDAY=MO", dtstart=dtstart.astimezone(UTC))
+
+    assert again is first
+    assert utc_rule is not first
+    assert first.after(dtstart) == datetime(2030, 1, 14, 9, 0, tzinfo=chicago)
+    stats = rrule_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert stats.max_size > 0
+
+
+@pytest.mark.parametrize(
+    "rrule",
+    [
+        "FREQ=DAILY;INTERVAL=3",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH",
+        "FREQ=MONTHLY;INTERVAL=1;BYMONTHDAY=31",
+        "FREQ=MONTHLY;INTERVAL=2;BYDAY=FR;BYSETPOS=5,-1",
+        # Not a build_rrule shape, so this one exercises the dateutil fallback.
+        "FREQ=DAILY;COUNT=400",
+    ],
+)
+def test_expand_between_matches_dateutil_across_dst(rrule: str) -> None:
+    new_york = ZoneInfo("America/New_York")
+    dtstart = datetime(2029, 11, 20, 9, 30, tzinfo=new_york)
+    start = datetime(2030, 2, 1, 14, 30, tzinfo=UTC)
+    end = start + timedelta(days=365)
+
+    expected = [
+        dt for dt in rrulestr(rrule, dtstart=dtstart).between(start, end, inc=True) if dt < end
+    ]
+    expanded = expand_between(rrule=rrule, dtstart=dtstart, start=start, end=end)
+
+    assert expanded == expected
+    assert [dt.utcoffset() for dt in expanded] == [dt.utcoffset() for dt in expected]
+    # Wall-clock time holds across the March and November DST changes.
+    assert {(dt.hour, dt.minute) for dt in expanded} == {(9, 30)}
+
+
+def test_expand_between_uses_the_given_zone_and_half_open_window() -> None:
+    chicago = ZoneInfo("America/Chicago")
+    dtstart = datetime(2030, 1, 1, 15, 0, tzinfo=UTC)
+    start = datetime(2030, 1, 2, 15, 0, tzinfo=UTC)
+
+    expanded = expand_between(
+        rrule="FREQ=DAILY;INTERVAL=1",
+        dtstart=dtstart,
+        start=start,
+        end=start + timedelta(days=2),
+        tz=chicago,
+    )
+
+    assert expanded == [
+        datetime(2030, 1, 2, 9, 0, tzinfo=chicago),
+        datetime(2030, 1, 3, 9, 0, tzinfo=chicago),
+    ]
+    assert expand_between(rrule="FREQ=DAILY", dtstart=dtstart, start=start, end=start) == []
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import socket
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import pytest
+
+from agendable.reminders import (
+    AsyncSmtpReminderSender,
+    ReminderDigest,
+    ReminderEmail,
+    SmtpReminderSender,
+    TerminalReminderDeliveryError,
+    TransientReminderDeliveryError,
+    build_reminder_sender,
+)
+from agendable.settings import Settings
+
+
+@dataclass
+class SmtpStandIn:
+    """Minimal in-process SMTP server that accepts mail and records what it saw."""
+
+    rcpt_reply: bytes = b"250 OK"
+    connections: int = 0
+    auth_credentials: list[str] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        writer.write(b"220 stand-in ESMTP\r\n")
+        await writer.drain()
+        while line := await reader.readline():
+            command = line.decode().strip()
+            upper = command.upper()
+            if upper.startswith("EHLO"):
+                writer.write(b"250-stand-in\r\n250-AUTH PLAIN\r\n250 8BITMIME\r\n")
+            elif upper.startswith("AUTH PLAIN"):
+                decoded = base64.b64decode(command.split(" ", 2)[2]).decode()
+                self.auth_credentials.append(decoded.strip("\x00").replace("\x00", ":"))
+                writer.write(b"235 Authenticated\r\n")
+            elif upper.startswith("RCPT"):
+                writer.write(self.rcpt_reply + b"\r\n")
+            elif upper.startswith(("MAIL", "RSET", "NOOP")):
+                writer.write(b"250 OK\r\n")
+            elif upper == "DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                body_lines: list[str] = []
+                while (data_line := await reader.readline()) not in (b".\r\n", b""):
+                    body_lines.append(data_line.decode())
+                self.messages.append("".join(body_lines))
+                writer.write(b"250 Queued\r\n")
+            elif upper == "QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"502 Not implemented\r\n")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+async def smtp_stand_in() -> AsyncIterator[tuple[SmtpStandIn, int]]:
+    stand_in = SmtpStandIn()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield stand_in, port
+        server.close_clients()
+
+
+def _sender(port: int, *, username: str | None = None) -> AsyncSmtpReminderSender:
+    return AsyncSmtpReminderSender(
+        host="127.0.0.1",
+        port=port,
+        from_email="noreply@example.com",
+        username=username,
+        password="secret" if username is not None else None,
+        use_ssl=False,
+        use_starttls=False,
+        timeout_seconds=5.0,
+    )
+
+
+def _reminder(title: str) -> ReminderEmail:
+    return ReminderEmail(
+        recipient_email="owner@example.com",
+        meeting_title=title,
+        scheduled_at=datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+        incomplete_tasks=["Prepare agenda"],
+        idempotency_key=f"{title}:1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_sender_reuses_authenticated_session(
+    smtp_stand_in: tuple[SmtpStandIn, int],
+) -> None:
+    stand_in, port = smtp_stand_in
+    sender = _sender(port, username="mailer")
+
+    await sender.send_email_reminder(_reminder("Weekly 1:1"))
+    await sender.send_email_reminder(_reminder("Planning"))
+    await sender.aclose()
+
+    assert stand_in.connections == 1
+    assert stand_in.auth_credentials == ["mailer:secret"]
+    assert len(stand_in.messages) == 2
+    assert "Subject: Reminder: Weekly 1:1" in stand_in.messages[0]
+    assert "X-Agendable-Idempotency-Key: Weekly 1:1:1" in stand_in.messages[0]
+    assert "- Prepare agenda" in stand_in.messages[0]
+    assert "Subject: Reminder: Planning" in stand_in.messages[1]
+
+
+@pytest.mark.asyncio
+async def test_async_sender_sends_digest_as_one_message(
+    smtp_stand_in: tuple[SmtpStandIn, int],
+) -> None:
+    stand_in, port = smtp_stand_in
+    sender = _sender(port)
+
+    await sender.send_email_digest(
+        ReminderDigest(
+            recipient_email="owner@example.com",
+            reminders=[_reminder("Planning"), _reminder("Weekly 1:1")],
+        )
+    )
+    await sender.aclose()
+
+    assert len(stand_in.messages) == 1
+    assert "Subject: Reminder: 2 upcoming meetings" in stand_in.messages[0]
+    assert "Reminder for: Planning" in stand_in.messages[0]
+    assert "Reminder for: Weekly 1:1" in stand_in.messages[0]
+    assert "X-Agendable-Idempotency-Key: Planning:1" in stand_in.messages[0]
+    assert "X-Agendable-Idempotency-Key: Weekly 1:1:1" in stand_in.messages[0]
+
+
+@pytest.mark.asyncio
+async def test_async_sender_classifies_recipient_rejections(
+    smtp_stand_in: tuple[SmtpStandIn, int],
+) -> None:
+    stand_in, port = smtp_stand_in
+    sender = _sender(port)
+
+    stand_in.rcpt_reply = b"450 Mailbox busy"
+    with pytest.raises(TransientReminderDeliveryError) as transient_info:
+        await sender.send_email_reminder(_reminder("Busy"))
+
+    stand_in.rcpt_reply = b"550 No such user"
+    with pytest.raises(TerminalReminderDeliveryError) as terminal_info:
+        await sender.send_email_reminder(_reminder("Unknown"))
+    await sender.aclose()
+
+    assert transient_info.value.reason_code == "smtp_transient_response"
+    assert terminal_info.value.reason_code == "smtp_permanent_response"
+    assert stand_in.connections == 1
+    assert stand_in.messages == []
+
+
+@pytest.mark.asyncio
+async def test_async_sender_reports_unreachable_server_as_transient() -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        closed_port = probe.getsockname()[1]
+
+    sender = _sender(closed_port)
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_email_reminder(_reminder("Offline"))
+
+    assert exc_info.value.reason_code == "smtp_unavailable"
+
+
+def test_build_reminder_sender_selects_transport_from_settings() -> None:
+    threaded = build_reminder_sender(
+        Settings(smtp_host="smtp.example.com", smtp_from_email="noreply@example.com")
+    )
+    native = build_reminder_sender(
+        Settings(
+            smtp_host="smtp.example.com",
+            smtp_from_email="noreply@example.com",
+            smtp_transport="asyncio",
+        )
+    )
+
+    assert isinstance(threaded, SmtpReminderSender)
+    assert isinstance(native, AsyncSmtpReminderSender)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from pydantic import SecretStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import agendable.db as db
+from agendable.cli.reminders import run_due_reminders
+from agendable.db.models import (
+    MeetingOccurrence,
+    MeetingSeries,
+    Reminder,
+    ReminderChannel,
+    ReminderDeliveryStatus,
+    User,
+)
+from agendable.reminders import (
+    HttpBatchEmailReminderSender,
+    ReminderDigest,
+    ReminderEmail,
+    TerminalReminderDeliveryError,
+    TransientReminderDeliveryError,
+    build_reminder_sender,
+)
+from agendable.settings import Settings
+
+API_URL = "https://email-api.test/v1/send-batch"
+
+
+@dataclass
+class BulkEmailApiStub:
+    """Local stand-in for a bulk-send API; answers each message by recipient address."""
+
+    status_by_recipient: dict[str, str] = field(default_factory=dict)
+    batches: list[list[dict[str, object]]] = field(default_factory=list)
+    authorization: list[str | None] = field(default_factory=list)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        messages = json.loads(request.content)["messages"]
+        self.batches.append(messages)
+        self.authorization.append(request.headers.get("Authorization"))
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "id": message["id"],
+                        "status": self.status_by_recipient.get(message["to"], "accepted"),
+                    }
+                    for message in messages
+                ]
+            },
+        )
+
+
+def _sender(
+    transport: httpx.MockTransport, *, batch_size: int = 100
+) -> HttpBatchEmailReminderSender:
+    return HttpBatchEmailReminderSender(
+        api_url=API_URL,
+        api_key=None,
+        from_email="noreply@example.com",
+        timeout_seconds=5.0,
+        batch_size=batch_size,
+        linger_seconds=0.01,
+        client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def _reminder(recipient: str, title: str = "Weekly 1:1") -> ReminderEmail:
+    return ReminderEmail(
+        recipient_email=recipient,
+        meeting_title=title,
+        scheduled_at=datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+        incomplete_tasks=["Prepare agenda"],
+        idempotency_key=f"{recipient}:1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_sender_coalesces_concurrent_sends_with_per_message_results() -> None:
+    stub = BulkEmailApiStub(
+        status_by_recipient={"gone@example.com": "rejected", "full@example.com": "deferred"}
+    )
+    sender = _sender(httpx.MockTransport(stub.handle))
+
+    outcomes = await asyncio.gather(
+        sender.send_email_reminder(_reminder("ok@example.com")),
+        sender.send_email_reminder(_reminder("gone@example.com")),
+        sender.send_email_reminder(_reminder("full@example.com")),
+        return_exceptions=True,
+    )
+    await sender.aclose()
+
+    assert len(stub.batches) == 1
+    first = stub.batches[0][0]
+    assert first["to"] == "ok@example.com"
+    assert first["subject"] == "Reminder: Weekly 1:1"
+    assert first["headers"] == {"X-Agendable-Idempotency-Key": "ok@example.com:1"}
+    assert "- Prepare agenda" in str(first["text"])
+
+    assert outcomes[0] is None
+    assert isinstance(outcomes[1], TerminalReminderDeliveryError)
+    assert outcomes[1].reason_code == "email_api_rejected"
+    assert isinstance(outcomes[2], TransientReminderDeliveryError)
+    assert outcomes[2].reason_code == "email_api_deferred"
+
+
+@pytest.mark.asyncio
+async def test_api_sender_caps_messages_per_request() -> None:
+    stub = BulkEmailApiStub()
+    sender = _sender(httpx.MockTransport(stub.handle), batch_size=2)
+
+    await asyncio.gather(
+        *(sender.send_email_reminder(_reminder(f"user{i}@example.com")) for i in range(5))
+    )
+    await sender.send_email_digest(
+        ReminderDigest(
+            recipient_email="digest@example.com",
+            reminders=[
+                _reminder("digest@example.com", "Planning"),
+                _reminder("digest@example.com", "Retro"),
+            ],
+        )
+    )
+    await sender.aclose()
+
+    assert [len(batch) for batch in stub.batches] == [2, 2, 1, 1]
+    assert stub.batches[-1][0]["subject"] == "Reminder: 2 upcoming meetings"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status_code", "error_type", "reason_code"),
+    [
+        (503, TransientReminderDeliveryError, "email_api_transient_response"),
+        (429, TransientReminderDeliveryError, "email_api_transient_response"),
+        (401, TerminalReminderDeliveryError, "email_api_auth_failed"),
+        (422, TerminalReminderDeliveryError, "email_api_permanent_response"),
+    ],
+)
+async def test_api_sender_fails_whole_request_on_error_response(
+    status_code: int, error_type: type[Exception], reason_code: str
+) -> None:
+    sender = _sender(httpx.MockTransport(lambda _: httpx.Response(status_code)))
+
+    outcomes = await asyncio.gather(
+        sender.send_email_reminder(_reminder("a@example.com")),
+        sender.send_email_reminder(_reminder("b@example.com")),
+        return_exceptions=True,
+    )
+    await sender.aclose()
+
+    assert all(isinstance(outcome, error_type) for outcome in outcomes)
+    assert {getattr(outcome, "reason_code", None) for outcome in outcomes} == {reason_code}
+
+
+@pytest.mark.asyncio
+async def test_api_sender_retries_messages_without_a_result() -> None:
+    sender = _sender(httpx.MockTransport(lambda _: httpx.Response(200, json={"results": []})))
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_email_reminder(_reminder("a@example.com"))
+    await sender.aclose()
+
+    assert exc_info.value.reason_code == "email_api_result_missing"
+
+
+@pytest.mark.asyncio
+async def test_api_sender_reports_transport_errors_as_transient() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    sender = _sender(httpx.MockTransport(handle))
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_email_reminder(_reminder("a@example.com"))
+    await sender.aclose()
+
+    assert exc_info.value.reason_code == "email_api_unavailable"
+
+
+@pytest.mark.asyncio
+async def test_api_sender_fails_every_send_when_posting_raises_unexpectedly() -> None:
+    def handle(_request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("transport bug")
+
+    sender = _sender(httpx.MockTransport(handle))
+
+    async with asyncio.timeout(1):
+        results = await asyncio.gather(
+            sender.send_email_reminder(_reminder("a@example.com")),
+            sender.send_email_reminder(_reminder("b@example.com")),
+            return_exceptions=True,
+        )
+        await sender.aclose()
+
+    assert all(isinstance(result, TransientReminderDeliveryError) for result in results)
+    assert {
+        result.reason_code
+        for result in results
+        if isinstance(result, TransientReminderDeliveryError)
+    } == {"email_api_error"}
+
+
+def test_build_reminder_sender_prefers_email_api_when_configured() -> None:
+    sender = build_reminder_sender(
+        Settings(
+            smtp_host="smtp.example.com",
+            smtp_from_email="noreply@example.com",
+            email_api_url=API_URL,
+            email_api_key=SecretStr("api-key"),
+        )
+    )
+
+    assert isinstance(sender, HttpBatchEmailReminderSender)
+    assert sender.client.headers["Authorization"] == "Bearer api-key"
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_records_per_message_api_results(
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(UTC)
+    reminder_ids: dict[str, uuid.UUID] = {}
+    for email in ("ok-api@example.com", "gone-api@example.com"):
+        owner = User(
+            email=email,
+            first_name="Test",
+            last_name="Owner",
+            display_name="Test Owner",
+            timezone="UTC",
+            password_hash=None,
+        )
+        db_session.add(owner)
+        await db_session.flush()
+        series = MeetingSeries(owner_user_id=owner.id, title="API", default_interval_days=7)
+        db_session.add(series)
+        await db_session.flush()
+        occurrence = MeetingOccurrence(
+            series_id=series.id, scheduled_at=now + timedelta(days=1), notes=""
+        )
+        db_session.add(occurrence)
+        await db_session.flush()
+        reminder = Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=now - timedelta(minutes=1),
+            sent_at=None,
+        )
+        db_session.add(reminder)
+        await db_session.flush()
+        reminder_ids[email] = reminder.id
+    await db_session.commit()
+
+    stub = BulkEmailApiStub(status_by_recipient={"gone-api@example.com": "rejected"})
+    sender = _sender(httpx.MockTransport(stub.handle))
+    await run_due_reminders(sender=sender)
+    await sender.aclose()
+
+    assert len(stub.batches) == 1
+    async with db.SessionMaker() as verify_session:
+        rows = (
+            await verify_session.execute(
+                select(Reminder.id, Reminder.delivery_status, Reminder.failure_reason_code)
+            )
+        ).tuples()
+        outcomes = {reminder_id: (status, reason) for reminder_id, status, reason in rows}
+    assert outcomes[reminder_ids["ok-api@example.com"]] == (ReminderDeliveryStatus.sent, None)
+    assert outcomes[reminder_ids["gone-api@example.com"]] == (
+        ReminderDeliveryStatus.failed_terminal,
+        "email_api_rejected",
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agendable.db.models import MeetingOccurrence, MeetingSeries, Reminder, User
+from agendable.reminders import as_utc
+from agendable.services.reminder_horizon_service import materialize_reminder_horizon
+from agendable.settings import Settings
+from agendable.testing.series_test_helpers import create_weekly_series
+
+
+async def _create_weekly_series(db_session: AsyncSession, *, count: int) -> MeetingSeries:
+    owner = User(
+        email="horizon-owner@example.com",
+        first_name="Horizon",
+        last_name="Owner",
+        display_name="Horizon Owner",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    return await create_weekly_series(
+        db_session,
+        owner=owner,
+        title="Weekly horizon",
+        generate_count=count,
+        settings=Settings(reminder_horizon_days=14),
+    )
+
+
+async def _reminder_send_times(db_session: AsyncSession, series: MeetingSeries) -> list[datetime]:
+    result = await db_session.execute(
+        select(Reminder.send_at)
+        .join(MeetingOccurrence, Reminder.occurrence_id == MeetingOccurrence.id)
+        .where(MeetingOccurrence.series_id == series.id)
+        .order_by(Reminder.send_at.asc())
+    )
+    return [as_utc(send_at) for send_at in result.scalars().all()]
+
+
+@pytest.mark.asyncio
+async def test_series_creation_only_writes_reminders_within_horizon(
+    db_session: AsyncSession,
+) -> None:
+    series = await _create_weekly_series(db_session, count=10)
+
+    # Weekly from tomorrow: days 1 and 8 send within 14 days, day 15 does not.
+    assert len(await _reminder_send_times(db_session, series)) == 2
+    assert series.reminders_materialized_until is not None
+
+
+@pytest.mark.asyncio
+async def test_horizon_job_materializes_reminders_incrementally(
+    db_session: AsyncSession,
+) -> None:
+    series = await _create_weekly_series(db_session, count=10)
+    settings = Settings(reminder_horizon_days=14)
+    now = datetime.now(UTC)
+
+    stats = await materialize_reminder_horizon(now=now + timedelta(days=21), settings=settings)
+
+    assert stats.series == 1
+    assert stats.reminders_created == 3
+    # Days 22 and 29 were still virtual; their reminders now fall inside the horizon.
+    assert stats.occurrences_created == 2
+    send_times = await _reminder_send_times(db_session, series)
+    assert len(send_times) == 5
+    assert len(set(send_times)) == 5
+
+    # Already at the horizon: nothing left to do until time moves on.
+    rerun = await materialize_reminder_horizon(now=now + timedelta(days=21), settings=settings)
+    assert rerun.series == 0
+    assert rerun.reminders_created == 0
+
+
+@pytest.mark.asyncio
+async def test_horizon_job_skips_series_without_high_water_mark(
+    db_session: AsyncSession,
+) -> None:
+    owner = User(
+        email="no-mark@example.com",
+        first_name="No",
+        last_name="Mark",
+        display_name="No Mark",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    series = MeetingSeries(owner_user_id=owner.id, title="Imported", default_interval_days=7)
+    db_session.add(series)
+    await db_session.flush()
+    db_session.add(
+        MeetingOccurrence(
+            series_id=series.id,
+            scheduled_at=datetime.now(UTC) + timedelta(days=2),
+            notes="",
+        )
+    )
+    await db_session.commit()
+
+    stats = await materialize_reminder_horizon(now=datetime.now(UTC), settings=Settings())
+
+    assert stats.series == 0
+    assert await _reminder_send_times(db_session, series) == []
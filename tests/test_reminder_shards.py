@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+import agendable.db as db
+from agendable.db.models import (
+    REMINDER_SHARD_COUNT,
+    MeetingOccurrence,
+    MeetingSeries,
+    Reminder,
+    ReminderChannel,
+    ReminderShardLease,
+    User,
+    reminder_shard_for,
+)
+from agendable.db.repos import ReminderRepository
+from agendable.services.reminder_shard_service import (
+    rebalance_reminder_shards,
+    release_reminder_shards,
+)
+
+LEASE_SECONDS = 90
+
+
+async def _lease_owners() -> dict[int, str | None]:
+    async with db.SessionMaker() as session:
+        result = await session.execute(
+            select(ReminderShardLease.shard, ReminderShardLease.worker_id)
+        )
+        return dict(result.tuples().all())
+
+
+@pytest.mark.asyncio
+async def test_single_worker_leases_every_shard(test_engine: AsyncEngine) -> None:
+    _ = test_engine
+    now = datetime.now(UTC)
+
+    shards = await rebalance_reminder_shards(worker_id="w1", now=now, lease_seconds=LEASE_SECONDS)
+
+    assert shards == list(range(REMINDER_SHARD_COUNT))
+
+
+@pytest.mark.asyncio
+async def test_joining_worker_receives_shards_released_by_peer(test_engine: AsyncEngine) -> None:
+    _ = test_engine
+    now = datetime.now(UTC)
+
+    await rebalance_reminder_shards(worker_id="w1", now=now, lease_seconds=LEASE_SECONDS)
+    # The newcomer announces itself but every shard is still leased to w1.
+    assert (
+        await rebalance_reminder_shards(worker_id="w2", now=now, lease_seconds=LEASE_SECONDS) == []
+    )
+
+    later = now + timedelta(seconds=10)
+    w1_shards = await rebalance_reminder_shards(
+        worker_id="w1", now=later, lease_seconds=LEASE_SECONDS
+    )
+    w2_shards = await rebalance_reminder_shards(
+        worker_id="w2", now=later, lease_seconds=LEASE_SECONDS
+    )
+
+    assert len(w1_shards) == REMINDER_SHARD_COUNT // 2
+    assert len(w2_shards) == REMINDER_SHARD_COUNT // 2
+    assert set(w1_shards).isdisjoint(w2_shards)
+
+
+@pytest.mark.asyncio
+async def test_surviving_worker_takes_over_expired_leases(test_engine: AsyncEngine) -> None:
+    _ = test_engine
+    now = datetime.now(UTC)
+
+    await rebalance_reminder_shards(worker_id="w1", now=now, lease_seconds=LEASE_SECONDS)
+    await rebalance_reminder_shards(worker_id="w2", now=now, lease_seconds=LEASE_SECONDS)
+    await rebalance_reminder_shards(worker_id="w1", now=now, lease_seconds=LEASE_SECONDS)
+    await rebalance_reminder_shards(worker_id="w2", now=now, lease_seconds=LEASE_SECONDS)
+
+    # w1 stops heartbeating; once its heartbeat and leases lapse, w2 owns everything.
+    after_expiry = now + timedelta(seconds=LEASE_SECONDS + 1)
+    w2_shards = await rebalance_reminder_shards(
+        worker_id="w2", now=after_expiry, lease_seconds=LEASE_SECONDS
+    )
+
+    assert w2_shards == list(range(REMINDER_SHARD_COUNT))
+
+
+@pytest.mark.asyncio
+async def test_release_returns_shards_to_the_pool(test_engine: AsyncEngine) -> None:
+    _ = test_engine
+    now = datetime.now(UTC)
+
+    await rebalance_reminder_shards(worker_id="w1", now=now, lease_seconds=LEASE_SECONDS)
+    await release_reminder_shards(worker_id="w1")
+
+    owners = await _lease_owners()
+    assert len(owners) == REMINDER_SHARD_COUNT
+    assert set(owners.values()) == {None}
+
+
+@pytest.mark.asyncio
+async def test_claim_due_batch_only_scans_requested_shards(db_session: AsyncSession) -> None:
+    owner = User(
+        email="owner-shards@example.com",
+        first_name="Test",
+        last_name="Owner",
+        display_name="Test Owner",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    series = MeetingSeries(owner_user_id=owner.id, title="Sharded", default_interval_days=7)
+    db_session.add(series)
+    await db_session.flush()
+
+    now = datetime.now(UTC)
+    occurrences = [
+        MeetingOccurrence(
+            series_id=series.id, scheduled_at=now + timedelta(days=1, hours=index), notes=""
+        )
+        for index in range(6)
+    ]
+    db_session.add_all(occurrences)
+    await db_session.flush()
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=now - timedelta(minutes=1),
+            sent_at=None,
+        )
+        for occurrence in occurrences
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    for reminder in reminders:
+        assert reminder.shard == reminder_shard_for(reminder.occurrence_id)
+
+    owned_shard = reminders[0].shard
+    claimed = await ReminderRepository(db_session).claim_due_batch(
+        now=now,
+        limit=10,
+        claim_lease_seconds=30,
+        channels=[ReminderChannel.email],
+        shards=[owned_shard],
+    )
+
+    assert set(claimed) == {r.id for r in reminders if r.shard == owned_shard}
+
+
+@pytest.mark.asyncio
+async def test_claim_upcoming_for_recipients_only_scans_requested_shards(
+    db_session: AsyncSession,
+) -> None:
+    owner = User(
+        email="owner-digest-shards@example.com",
+        first_name="Test",
+        last_name="Owner",
+        display_name="Test Owner",
+        timezone="UTC",
+        password_hash=None,
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    series = MeetingSeries(owner_user_id=owner.id, title="Digest", default_interval_days=7)
+    db_session.add(series)
+    await db_session.flush()
+
+    now = datetime.now(UTC)
+    occurrences = [
+        MeetingOccurrence(
+            series_id=series.id, scheduled_at=now + timedelta(hours=2, minutes=index), notes=""
+        )
+        for index in range(6)
+    ]
+    db_session.add_all(occurrences)
+    await db_session.flush()
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=now + timedelta(hours=1),
+            sent_at=None,
+        )
+        for occurrence in occurrences
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    owned_shard = reminders[0].shard
+    claimed = await ReminderRepository(db_session).claim_upcoming_for_recipients(
+        recipient_emails=[owner.email],
+        now=now,
+        until=now + timedelta(hours=4),
+        claim_lease_seconds=30,
+        channels=[ReminderChannel.email],
+        shards=[owned_shard],
+    )
+
+    # Companions in shards leased to a peer stay with that peer.
+    assert set(claimed) == {r.id for r in reminders if r.shard == owned_shard}
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from agendable.reminders import (
+    ReminderEmail,
+    SlackWebhookReminderSender,
+    TerminalReminderDeliveryError,
+    TransientReminderDeliveryError,
+    build_slack_reminder_sender,
+)
+from agendable.settings import Settings
+
+WEBHOOK_URL = "https://hooks.slack.test/services/T000/B000/XXXX"
+
+
+def _reminder(title: str) -> ReminderEmail:
+    return ReminderEmail(
+        recipient_email="owner@example.com",
+        meeting_title=title,
+        scheduled_at=datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+        incomplete_tasks=["Prepare agenda"],
+    )
+
+
+def _sender(
+    handler: httpx.MockTransport, *, max_retry_after_seconds: float = 30.0
+) -> SlackWebhookReminderSender:
+    return SlackWebhookReminderSender(
+        webhook_url=WEBHOOK_URL,
+        timeout_seconds=5.0,
+        max_retry_after_seconds=max_retry_after_seconds,
+        client=httpx.AsyncClient(transport=handler),
+    )
+
+
+@pytest.mark.asyncio
+async def test_slack_sender_posts_reminder_text_to_webhook() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text="ok")
+
+    sender = _sender(httpx.MockTransport(handle))
+    await sender.send_slack_reminder(_reminder("Weekly 1:1"))
+    await sender.send_slack_reminder(_reminder("Planning"))
+
+    assert [str(request.url) for request in requests] == [WEBHOOK_URL, WEBHOOK_URL]
+    text = json.loads(requests[0].content)["text"]
+    assert "*Reminder:* Weekly 1:1" in text
+    assert "For: owner@example.com" in text
+    assert "- Prepare agenda" in text
+
+
+@pytest.mark.asyncio
+async def test_slack_sender_waits_out_retry_after_then_retries() -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, text="ok"),
+        ]
+    )
+    calls = 0
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        _ = request
+        calls += 1
+        return next(responses)
+
+    sender = _sender(httpx.MockTransport(handle))
+    await sender.send_slack_reminder(_reminder("Busy"))
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_slack_sender_fails_transiently_when_retry_after_exceeds_budget() -> None:
+    sender = _sender(
+        httpx.MockTransport(lambda _: httpx.Response(429, headers={"Retry-After": "120"})),
+        max_retry_after_seconds=5.0,
+    )
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_slack_reminder(_reminder("Throttled"))
+
+    assert exc_info.value.reason_code == "slack_rate_limited"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status_code", "error_type", "reason_code"),
+    [
+        (503, TransientReminderDeliveryError, "slack_transient_response"),
+        (404, TerminalReminderDeliveryError, "slack_permanent_response"),
+        (410, TerminalReminderDeliveryError, "slack_permanent_response"),
+    ],
+)
+async def test_slack_sender_classifies_error_responses(
+    status_code: int, error_type: type[Exception], reason_code: str
+) -> None:
+    sender = _sender(httpx.MockTransport(lambda _: httpx.Response(status_code)))
+
+    with pytest.raises(error_type) as exc_info:
+        await sender.send_slack_reminder(_reminder("Broken"))
+
+    assert getattr(exc_info.value, "reason_code", None) == reason_code
+
+
+@pytest.mark.asyncio
+async def test_slack_sender_reports_transport_errors_as_transient() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    sender = _sender(httpx.MockTransport(handle))
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_slack_reminder(_reminder("Offline"))
+
+    assert exc_info.value.reason_code == "slack_unavailable"
+
+
+@pytest.mark.asyncio
+async def test_slack_sender_queues_posts_per_webhook() -> None:
+    in_flight: dict[str, int] = {}
+    max_in_flight: dict[str, int] = {}
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        in_flight[url] = in_flight.get(url, 0) + 1
+        max_in_flight[url] = max(max_in_flight.get(url, 0), in_flight[url])
+        await asyncio.sleep(0.01)
+        in_flight[url] -= 1
+        return httpx.Response(200, text="ok")
+
+    sender = _sender(httpx.MockTransport(handle))
+    other_webhook = f"{WEBHOOK_URL}-other"
+    await asyncio.gather(
+        *(sender.post(WEBHOOK_URL, {"text": str(i)}) for i in range(3)),
+        *(sender.post(other_webhook, {"text": str(i)}) for i in range(3)),
+    )
+
+    assert max_in_flight == {WEBHOOK_URL: 1, other_webhook: 1}
+
+
+def test_build_slack_reminder_sender_requires_webhook_url() -> None:
+    assert build_slack_reminder_sender(Settings(slack_webhook_url=None)) is None
+    assert isinstance(
+        build_slack_reminder_sender(Settings(slack_webhook_url=SecretStr(WEBHOOK_URL))),
+        SlackWebhookReminderSender,
+    )
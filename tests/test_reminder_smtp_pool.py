@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import smtplib
+from datetime import UTC, datetime
+from email.message import EmailMessage
+
+import pytest
+
+from agendable.reminders import (
+    ReminderEmail,
+    SmtpConnectionPool,
+    SmtpReminderSender,
+    TransientReminderDeliveryError,
+)
+
+
+class FakeSmtp(smtplib.SMTP):
+    def __init__(self, *, fail_with: Exception | None = None) -> None:
+        super().__init__()
+        self.fail_with = fail_with
+        self.sent_subjects: list[str] = []
+        self.quit_called = False
+        self.close_called = False
+
+    def send_message(self, msg: object, *args: object, **kwargs: object) -> dict[str, object]:  # type: ignore[override]
+        _ = args
+        _ = kwargs
+        assert isinstance(msg, EmailMessage)
+        if self.fail_with is not None:
+            raise self.fail_with
+        self.sent_subjects.append(str(msg["Subject"]))
+        return {}
+
+    def quit(self) -> tuple[int, bytes]:
+        self.quit_called = True
+        return (221, b"bye")
+
+    def close(self) -> None:
+        self.close_called = True
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message.set_content("body")
+    return message
+
+
+def _pool(
+    connections: list[FakeSmtp],
+    *,
+    max_messages: int = 100,
+    idle_timeout: float = 30.0,
+    clock: FakeClock | None = None,
+) -> tuple[SmtpConnectionPool, list[FakeSmtp]]:
+    opened: list[FakeSmtp] = []
+
+    def _connect() -> smtplib.SMTP:
+        connection = connections.pop(0)
+        opened.append(connection)
+        return connection
+
+    pool = SmtpConnectionPool(
+        connect=_connect,
+        max_messages_per_connection=max_messages,
+        idle_timeout_seconds=idle_timeout,
+        clock=clock if clock is not None else FakeClock(),
+    )
+    return pool, opened
+
+
+def test_pool_reuses_session_across_messages() -> None:
+    pool, opened = _pool([FakeSmtp(), FakeSmtp()])
+
+    pool.send(_message("one"))
+    pool.send(_message("two"))
+
+    assert len(opened) == 1
+    assert opened[0].sent_subjects == ["one", "two"]
+
+
+def test_pool_retires_session_after_max_messages() -> None:
+    pool, opened = _pool([FakeSmtp(), FakeSmtp()], max_messages=2)
+
+    pool.send(_message("one"))
+    pool.send(_message("two"))
+    pool.send(_message("three"))
+
+    assert len(opened) == 2
+    assert opened[0].quit_called is True
+    assert opened[0].sent_subjects == ["one", "two"]
+    assert opened[1].sent_subjects == ["three"]
+
+
+def test_pool_drops_sessions_idle_past_timeout() -> None:
+    clock = FakeClock()
+    pool, opened = _pool([FakeSmtp(), FakeSmtp()], idle_timeout=10.0, clock=clock)
+
+    pool.send(_message("one"))
+    clock.now = 11.0
+    pool.send(_message("two"))
+
+    assert len(opened) == 2
+    assert opened[0].quit_called is True
+    assert opened[1].sent_subjects == ["two"]
+
+
+def test_pool_replaces_dead_reused_session_and_resends() -> None:
+    pool, opened = _pool([FakeSmtp(), FakeSmtp()])
+
+    pool.send(_message("one"))
+    opened[0].fail_with = smtplib.SMTPServerDisconnected("gone")
+    pool.send(_message("two"))
+
+    assert len(opened) == 2
+    assert opened[0].close_called is True
+    assert opened[1].sent_subjects == ["two"]
+
+
+def test_pool_raises_disconnect_from_fresh_session() -> None:
+    pool, opened = _pool([FakeSmtp(fail_with=smtplib.SMTPServerDisconnected("gone"))])
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        pool.send(_message("one"))
+
+    assert opened[0].close_called is True
+
+
+def test_pool_keeps_session_after_rejected_message() -> None:
+    pool, opened = _pool([FakeSmtp()])
+
+    pool.send(_message("one"))
+    opened[0].fail_with = smtplib.SMTPDataError(550, b"rejected")
+    with pytest.raises(smtplib.SMTPDataError):
+        pool.send(_message("two"))
+    opened[0].fail_with = None
+    pool.send(_message("three"))
+
+    assert len(opened) == 1
+    assert opened[0].sent_subjects == ["one", "three"]
+
+
+def test_pool_close_quits_idle_sessions() -> None:
+    pool, opened = _pool([FakeSmtp()])
+
+    pool.send(_message("one"))
+    pool.close()
+
+    assert opened[0].quit_called is True
+
+
+@pytest.mark.asyncio
+async def test_sender_classifies_pool_errors() -> None:
+    sender = SmtpReminderSender(
+        host="smtp.example.com",
+        port=587,
+        from_email="noreply@example.com",
+        username=None,
+        password=None,
+        use_ssl=False,
+        use_starttls=True,
+        timeout_seconds=1.0,
+    )
+    pool, _ = _pool([FakeSmtp(fail_with=smtplib.SMTPConnectError(421, b"busy"))])
+    sender.pool = pool
+
+    with pytest.raises(TransientReminderDeliveryError) as exc_info:
+        await sender.send_email_reminder(
+            ReminderEmail(
+                recipient_email="owner@example.com",
+                meeting_title="Weekly 1:1",
+                scheduled_at=datetime(2030, 1, 1, 9, 0, tzinfo=UTC),
+            )
+        )
+
+    assert exc_info.value.reason_code == "smtp_unavailable"
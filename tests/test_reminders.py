@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
@@ -21,12 +25,16 @@ from agendable.db.models import (
 )
 from agendable.db.repos import ReminderRepository
 from agendable.reminders import (
+    ReminderDigest,
     ReminderEmail,
     ReminderSender,
+    SlackReminderSender,
     TerminalReminderDeliveryError,
     TransientReminderDeliveryError,
     as_utc,
+    reminder_idempotency_key,
 )
+from agendable.services.reminder_delivery_service import lateness_histogram
 
 
 @dataclass
@@ -37,6 +45,65 @@ class CapturingSender(ReminderSender):
         self.sent.append(reminder)
 
 
+@dataclass
+class SlowCapturingSender(ReminderSender):
+    sent: list[ReminderEmail]
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        self.sent.append(reminder)
+
+
+@dataclass
+class CommittedSentObservingSender(ReminderSender):
+    """Records how many sent outcomes were already committed when each send started."""
+
+    occurrence_id: uuid.UUID
+    committed_sent_seen: list[int]
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        _ = reminder
+        async with db.SessionMaker() as observer:
+            committed = (
+                await observer.execute(
+                    select(Reminder.id)
+                    .where(Reminder.occurrence_id == self.occurrence_id)
+                    .where(Reminder.delivery_status == ReminderDeliveryStatus.sent)
+                )
+            ).all()
+        self.committed_sent_seen.append(len(committed))
+
+
+@dataclass
+class DigestCapturingSender(ReminderSender):
+    sent: list[ReminderEmail]
+    digests: list[ReminderDigest]
+    digest_error: Exception | None = None
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        self.sent.append(reminder)
+
+    async def send_email_digest(self, digest: ReminderDigest) -> None:
+        if self.digest_error is not None:
+            raise self.digest_error
+        self.digests.append(digest)
+
+
+@dataclass
+class CapturingSlackSender(SlackReminderSender):
+    sent: list[ReminderEmail]
+
+    async def send_slack_reminder(self, reminder: ReminderEmail) -> None:
+        self.sent.append(reminder)
+
+
 @dataclass
 class TransientFailingSender(ReminderSender):
     reason_code: str
@@ -46,6 +113,17 @@ class TransientFailingSender(ReminderSender):
         raise TransientReminderDeliveryError(self.reason_code)
 
 
+@dataclass
+class CountingTransientFailingSender(ReminderSender):
+    reason_code: str
+    calls: int = 0
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        _ = reminder
+        self.calls += 1
+        raise TransientReminderDeliveryError(self.reason_code)
+
+
 @dataclass
 class TerminalFailingSender(ReminderSender):
     reason_code: str
@@ -55,6 +133,29 @@ class TerminalFailingSender(ReminderSender):
         raise TerminalReminderDeliveryError(self.reason_code)
 
 
+@dataclass
+class HangsAfterFirstSender(ReminderSender):
+    sent: list[ReminderEmail]
+    hanging: asyncio.Event
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        if self.sent:
+            self.hanging.set()
+            await asyncio.Event().wait()
+        self.sent.append(reminder)
+
+
+@dataclass
+class BrokenForOneRecipientSender(ReminderSender):
+    broken_email: str
+    sent: list[ReminderEmail]
+
+    async def send_email_reminder(self, reminder: ReminderEmail) -> None:
+        if reminder.recipient_email == self.broken_email:
+            raise RuntimeError("sender bug")
+        self.sent.append(reminder)
+
+
 async def _create_occurrence(
     db_session: AsyncSession, *, email: str, title: str
 ) -> MeetingOccurrence:
@@ -154,6 +255,383 @@ async def test_run_due_reminders_sends_due_email_and_marks_sent(db_session: Asyn
         assert refreshed_future.sent_at is None
 
 
+@pytest.mark.asyncio
+async def test_run_due_reminders_reports_lateness_and_queue_depth(
+    db_session: AsyncSession,
+) -> None:
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-lateness@example.com",
+        title="Lateness Meeting",
+    )
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now - timedelta(minutes=minutes),
+                sent_at=None,
+            )
+            for minutes in (10, 1)
+        ]
+        + [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now + timedelta(hours=1),
+                sent_at=None,
+            )
+        ]
+    )
+    await db_session.commit()
+
+    stats = await run_due_reminders(sender=CapturingSender(sent=[]))
+
+    assert stats.queue_depth_at_start == 2
+    assert stats.oldest_overdue_seconds == pytest.approx(600, abs=5)
+    assert sorted(round(value / 60) for value in stats.lateness_seconds) == [1, 10]
+    assert lateness_histogram(stats.lateness_seconds) == {
+        "le_1s": 0,
+        "le_5s": 0,
+        "le_15s": 0,
+        "le_30s": 0,
+        "le_60s": 0,
+        "le_120s": 1,
+        "le_300s": 1,
+        "le_600s": 1,
+        "le_1800s": 2,
+        "le_3600s": 2,
+        "le_inf": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_drains_multiple_claim_batches(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_CLAIM_BATCH_SIZE", "2")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-batches@example.com",
+        title="Batched Meeting",
+    )
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=datetime.now(UTC) - timedelta(minutes=minutes + 1),
+            sent_at=None,
+        )
+        for minutes in range(5)
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    sender = CapturingSender(sent=[])
+    await run_due_reminders(sender=sender)
+
+    assert len(sender.sent) == 5
+
+    async with db.SessionMaker() as verify_session:
+        statuses = (
+            (
+                await verify_session.execute(
+                    select(Reminder.delivery_status).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    assert statuses == [ReminderDeliveryStatus.sent] * 5
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_commits_outcomes_in_checkpoints_mid_batch(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_CHECKPOINT_MAX_OUTCOMES", "2")
+    monkeypatch.setenv("AGENDABLE_REMINDER_CHECKPOINT_INTERVAL_SECONDS", "3600")
+    monkeypatch.setenv("AGENDABLE_REMINDER_DELIVERY_CONCURRENCY", "1")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-checkpoint@example.com",
+        title="Checkpoint Meeting",
+    )
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=datetime.now(UTC) - timedelta(minutes=minutes + 1),
+                sent_at=None,
+            )
+            for minutes in range(5)
+        ]
+    )
+    await db_session.commit()
+
+    sender = CommittedSentObservingSender(occurrence_id=occurrence.id, committed_sent_seen=[])
+    await run_due_reminders(sender=sender)
+
+    # One claim batch holds all five; outcomes are committed every two sends, not at the end.
+    assert sender.committed_sent_seen == [0, 0, 2, 2, 4]
+
+    async with db.SessionMaker() as verify_session:
+        statuses = (
+            (
+                await verify_session.execute(
+                    select(Reminder.delivery_status).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    assert statuses == [ReminderDeliveryStatus.sent] * 5
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_flags_attempt_whose_outcome_was_never_committed(
+    db_session: AsyncSession,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.WARNING, logger="agendable.cli.reminders")
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-crashed@example.com",
+        title="Crashed Meeting",
+    )
+    # A worker claimed attempt 1 and died before committing its outcome; the lease lapsed.
+    crashed = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.email,
+        send_at=datetime.now(UTC) - timedelta(minutes=5),
+        next_attempt_at=datetime.now(UTC) - timedelta(minutes=1),
+        sent_at=None,
+        attempt_count=1,
+    )
+    db_session.add(crashed)
+    await db_session.commit()
+
+    sender = CapturingSender(sent=[])
+    await run_due_reminders(sender=sender)
+
+    attempt_key = reminder_idempotency_key(crashed.id, 2)
+    assert [reminder.idempotency_key for reminder in sender.sent] == [attempt_key]
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(
+        "reminder previous attempt outcome unrecorded" in message
+        and f"previous_idempotency_key={reminder_idempotency_key(crashed.id, 1)}" in message
+        for message in messages
+    )
+
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            await verify_session.execute(select(Reminder).where(Reminder.id == crashed.id))
+        ).scalar_one()
+    assert refreshed.delivery_status == ReminderDeliveryStatus.sent
+    assert refreshed.outcome_idempotency_key == attempt_key
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_sends_concurrently_up_to_configured_limit(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_DELIVERY_CONCURRENCY", "3")
+    caplog.set_level("INFO", logger="agendable.cli.reminders")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-concurrent@example.com",
+        title="Concurrent Meeting",
+    )
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=datetime.now(UTC) - timedelta(minutes=minutes + 1),
+                sent_at=None,
+            )
+            for minutes in range(7)
+        ]
+    )
+    await db_session.commit()
+
+    sender = SlowCapturingSender(sent=[])
+    await run_due_reminders(sender=sender)
+
+    assert len(sender.sent) == 7
+    assert sender.max_in_flight == 3
+
+    async with db.SessionMaker() as verify_session:
+        statuses = (
+            (
+                await verify_session.execute(
+                    select(Reminder.delivery_status).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    assert statuses == [ReminderDeliveryStatus.sent] * 7
+
+    summary = next(
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("reminder run complete")
+    )
+    assert "attempted=7" in summary
+    assert "sent=7" in summary
+    assert "in_flight_peak=3" in summary
+    assert "send_latency_p50_ms=" in summary
+    assert "send_latency_p95_ms=" in summary
+
+
+async def _add_occurrence_for_same_owner(
+    db_session: AsyncSession, *, occurrence: MeetingOccurrence, title: str
+) -> MeetingOccurrence:
+    first_series = await db_session.get(MeetingSeries, occurrence.series_id)
+    assert first_series is not None
+    series = MeetingSeries(
+        owner_user_id=first_series.owner_user_id, title=title, default_interval_days=7
+    )
+    db_session.add(series)
+    await db_session.flush()
+    other = MeetingOccurrence(
+        series_id=series.id,
+        scheduled_at=occurrence.scheduled_at + timedelta(hours=2),
+        notes="",
+        is_completed=False,
+    )
+    db_session.add(other)
+    await db_session.commit()
+    return other
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_merges_recipient_window_into_digest(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_DIGEST_WINDOW_MINUTES", "240")
+
+    first = await _create_occurrence(db_session, email="manager@example.com", title="1:1 Alex")
+    second = await _add_occurrence_for_same_owner(db_session, occurrence=first, title="1:1 Sam")
+    solo = await _create_occurrence(db_session, email="solo@example.com", title="Solo Sync")
+
+    now = datetime.now(UTC)
+    due = Reminder(
+        occurrence_id=first.id,
+        channel=ReminderChannel.email,
+        send_at=now - timedelta(minutes=1),
+        sent_at=None,
+    )
+    upcoming = Reminder(
+        occurrence_id=second.id,
+        channel=ReminderChannel.email,
+        send_at=now + timedelta(hours=2),
+        sent_at=None,
+    )
+    outside_window = Reminder(
+        occurrence_id=second.id,
+        channel=ReminderChannel.email,
+        send_at=now + timedelta(days=2),
+        sent_at=None,
+    )
+    solo_due = Reminder(
+        occurrence_id=solo.id,
+        channel=ReminderChannel.email,
+        send_at=now - timedelta(minutes=2),
+        sent_at=None,
+    )
+    db_session.add_all([due, upcoming, outside_window, solo_due])
+    await db_session.commit()
+
+    sender = DigestCapturingSender(sent=[], digests=[])
+    await run_due_reminders(sender=sender)
+
+    assert [reminder.meeting_title for reminder in sender.sent] == ["Solo Sync"]
+    assert len(sender.digests) == 1
+    assert sender.digests[0].recipient_email == "manager@example.com"
+    assert sorted(reminder.meeting_title for reminder in sender.digests[0].reminders) == [
+        "1:1 Alex",
+        "1:1 Sam",
+    ]
+
+    async with db.SessionMaker() as verify_session:
+        rows = (await verify_session.execute(select(Reminder))).scalars().all()
+        status_by_id = {row.id: row.delivery_status for row in rows}
+
+    assert status_by_id[due.id] == ReminderDeliveryStatus.sent
+    assert status_by_id[upcoming.id] == ReminderDeliveryStatus.sent
+    assert status_by_id[solo_due.id] == ReminderDeliveryStatus.sent
+    assert status_by_id[outside_window.id] == ReminderDeliveryStatus.pending
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_records_digest_failure_on_each_reminder(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_DIGEST_WINDOW_MINUTES", "240")
+
+    first = await _create_occurrence(db_session, email="busy@example.com", title="1:1 Kim")
+    second = await _add_occurrence_for_same_owner(db_session, occurrence=first, title="1:1 Lee")
+
+    now = datetime.now(UTC)
+    reminders = [
+        Reminder(
+            occurrence_id=first.id,
+            channel=ReminderChannel.email,
+            send_at=now - timedelta(minutes=1),
+            sent_at=None,
+        ),
+        Reminder(
+            occurrence_id=second.id,
+            channel=ReminderChannel.email,
+            send_at=now + timedelta(hours=1),
+            sent_at=None,
+        ),
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    sender = DigestCapturingSender(
+        sent=[],
+        digests=[],
+        digest_error=TransientReminderDeliveryError("smtp_unavailable"),
+    )
+    await run_due_reminders(sender=sender)
+
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.id.in_([r.id for r in reminders]))
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    assert len(refreshed) == 2
+    for reminder in refreshed:
+        assert reminder.sent_at is None
+        assert reminder.attempt_count == 1
+        assert reminder.delivery_status == ReminderDeliveryStatus.retry_scheduled
+        assert reminder.failure_reason_code == "smtp_unavailable"
+        # The companion pulled forward is not retried ahead of its own send time.
+        assert reminder.next_attempt_at is not None
+        assert as_utc(reminder.next_attempt_at) >= as_utc(reminder.send_at)
+
+
 @pytest.mark.asyncio
 async def test_run_due_reminders_skips_non_email_channels(db_session: AsyncSession) -> None:
     occurrence = await _create_occurrence(
@@ -185,6 +663,58 @@ async def test_run_due_reminders_skips_non_email_channels(db_session: AsyncSessi
         assert refreshed.failure_reason_code == "unsupported_channel"
 
 
+@pytest.mark.asyncio
+async def test_run_due_reminders_delivers_slack_when_sender_configured(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_CIRCUIT_BREAKER_THRESHOLD", "1")
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-slack-send@example.com",
+        title="Slack Standup",
+    )
+    slack_reminder = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.slack,
+        send_at=datetime.now(UTC) - timedelta(minutes=1),
+        sent_at=None,
+    )
+    email_reminder = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.email,
+        send_at=datetime.now(UTC) - timedelta(minutes=2),
+        sent_at=None,
+    )
+    db_session.add_all([slack_reminder, email_reminder])
+    await db_session.commit()
+
+    slack_sender = CapturingSlackSender(sent=[])
+    # An SMTP outage trips only the email circuit; Slack still goes out.
+    await run_due_reminders(
+        sender=TransientFailingSender(reason_code="smtp_unavailable"),
+        slack_sender=slack_sender,
+    )
+
+    assert [reminder.meeting_title for reminder in slack_sender.sent] == ["Slack Standup"]
+    async with db.SessionMaker() as verify_session:
+        statuses = dict(
+            (
+                await verify_session.execute(
+                    select(Reminder.channel, Reminder.delivery_status).where(
+                        Reminder.occurrence_id == occurrence.id
+                    )
+                )
+            )
+            .tuples()
+            .all()
+        )
+    assert statuses == {
+        ReminderChannel.slack: ReminderDeliveryStatus.sent,
+        ReminderChannel.email: ReminderDeliveryStatus.retry_scheduled,
+    }
+
+
 @pytest.mark.asyncio
 async def test_run_due_reminders_transient_failure_schedules_retry(
     db_session: AsyncSession,
@@ -192,6 +722,10 @@ async def test_run_due_reminders_transient_failure_schedules_retry(
 ) -> None:
     monkeypatch.setenv("AGENDABLE_REMINDER_RETRY_MAX_ATTEMPTS", "3")
     monkeypatch.setenv("AGENDABLE_REMINDER_RETRY_BACKOFF_SECONDS", "30")
+    # Pin the jitter to the top of its window so the exponential ceiling is observable.
+    monkeypatch.setattr(
+        "agendable.services.reminder_delivery_service.random.uniform", lambda low, high: high
+    )
 
     occurrence = await _create_occurrence(
         db_session,
@@ -227,6 +761,227 @@ async def test_run_due_reminders_transient_failure_schedules_retry(
         assert retry_delay == pytest.approx(30, rel=0, abs=1)
 
 
+@pytest.mark.asyncio
+async def test_run_due_reminders_spreads_retries_with_full_jitter(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_RETRY_MAX_ATTEMPTS", "3")
+    monkeypatch.setenv("AGENDABLE_REMINDER_RETRY_BACKOFF_SECONDS", "30")
+    monkeypatch.setenv("AGENDABLE_REMINDER_CIRCUIT_BREAKER_THRESHOLD", "100")
+    jitter_windows: list[tuple[float, float]] = []
+
+    def fake_uniform(low: float, high: float) -> float:
+        jitter_windows.append((low, high))
+        return high * len(jitter_windows) / 10
+
+    monkeypatch.setattr("agendable.services.reminder_delivery_service.random.uniform", fake_uniform)
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-jitter@example.com",
+        title="Jitter Meeting",
+    )
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=datetime.now(UTC) - timedelta(minutes=2),
+            sent_at=None,
+        )
+        for _ in range(3)
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    await run_due_reminders(sender=TransientFailingSender(reason_code="smtp_unavailable"))
+
+    assert jitter_windows == [(0, 30)] * 3
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    delays = sorted(
+        round((as_utc(r.next_attempt_at) - as_utc(r.last_attempted_at)).total_seconds())
+        for r in refreshed
+        if r.next_attempt_at is not None and r.last_attempted_at is not None
+    )
+    assert delays == [3, 6, 9]
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_circuit_breaker_defers_rest_of_run(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_CIRCUIT_BREAKER_THRESHOLD", "2")
+    monkeypatch.setenv("AGENDABLE_REMINDER_DELIVERY_CONCURRENCY", "1")
+    monkeypatch.setenv("AGENDABLE_REMINDER_CLAIM_BATCH_SIZE", "3")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-breaker@example.com",
+        title="Breaker Meeting",
+    )
+    now = datetime.now(UTC)
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=now - timedelta(minutes=minutes + 1),
+            sent_at=None,
+        )
+        for minutes in range(6)
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    sender = CountingTransientFailingSender(reason_code="smtp_unavailable")
+    await run_due_reminders(sender=sender)
+
+    assert sender.calls == 2
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    assert {r.delivery_status for r in refreshed} == {ReminderDeliveryStatus.retry_scheduled}
+    assert {r.failure_reason_code for r in refreshed} == {"smtp_unavailable"}
+    assert sorted(r.attempt_count for r in refreshed) == [0, 0, 0, 0, 1, 1]
+    assert all(
+        r.next_attempt_at is not None and as_utc(r.next_attempt_at) >= now for r in refreshed
+    )
+    # Deferred reminders wait at least half the backoff window (60s by default), so the
+    # next run doesn't go straight back to the failing channel.
+    deferred = [r for r in refreshed if r.attempt_count == 0]
+    assert all(
+        r.next_attempt_at is not None and as_utc(r.next_attempt_at) >= now + timedelta(seconds=30)
+        for r in deferred
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_due_reminders_releases_unsent_claims_once_told_to_stop(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_DELIVERY_CONCURRENCY", "1")
+    monkeypatch.setenv("AGENDABLE_REMINDER_CLAIM_BATCH_SIZE", "3")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-drain@example.com",
+        title="Drain Meeting",
+    )
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now - timedelta(minutes=minutes + 1),
+                sent_at=None,
+            )
+            for minutes in range(5)
+        ]
+    )
+    await db_session.commit()
+
+    sender = CapturingSender(sent=[])
+
+    def _stop_after_first_send() -> bool:
+        return len(sender.sent) >= 1
+
+    stats = await run_due_reminders(sender=sender, should_stop=_stop_after_first_send)
+
+    assert len(sender.sent) == 1
+    assert stats.sent == 1
+    assert stats.released == 2
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    unsent = [r for r in refreshed if r.sent_at is None]
+    assert len(unsent) == 4
+    # Released claims give their attempt back and are immediately due for another worker.
+    assert {r.attempt_count for r in unsent} == {0}
+    assert {r.delivery_status for r in unsent} == {ReminderDeliveryStatus.pending}
+    assert all(
+        r.next_attempt_at is None or as_utc(r.next_attempt_at) <= datetime.now(UTC) for r in unsent
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_commits_recorded_outcomes_and_releases_unstarted_claims(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("AGENDABLE_REMINDER_CHECKPOINT_MAX_OUTCOMES", "100")
+    monkeypatch.setenv("AGENDABLE_REMINDER_CHECKPOINT_INTERVAL_SECONDS", "3600")
+    monkeypatch.setenv("AGENDABLE_REMINDER_DELIVERY_CONCURRENCY", "1")
+
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-cancelled@example.com",
+        title="Cancelled Meeting",
+    )
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=datetime.now(UTC) - timedelta(minutes=minutes + 1),
+                sent_at=None,
+            )
+            for minutes in range(3)
+        ]
+    )
+    await db_session.commit()
+
+    sender = HangsAfterFirstSender(sent=[], hanging=asyncio.Event())
+    run = asyncio.create_task(run_due_reminders(sender=sender))
+    await asyncio.wait_for(sender.hanging.wait(), timeout=5)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    async with db.SessionMaker() as verify_session:
+        refreshed = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    # The first send's outcome was only checkpointed in memory; cancelling commits it.
+    assert [r.delivery_status for r in refreshed].count(ReminderDeliveryStatus.sent) == 1
+    unsent = [r for r in refreshed if r.sent_at is None]
+    # The send cut off mid-flight keeps its claim; the one that never started is handed back.
+    assert sorted(r.attempt_count for r in unsent) == [0, 1]
+    released = next(r for r in unsent if r.attempt_count == 0)
+    assert released.next_attempt_at is not None
+    assert as_utc(released.next_attempt_at) <= datetime.now(UTC)
+
+
 @pytest.mark.asyncio
 async def test_run_due_reminders_terminal_failure_marks_failed(
     db_session: AsyncSession,
@@ -268,6 +1023,48 @@ async def test_run_due_reminders_terminal_failure_marks_failed(
     assert any("reason_code=smtp_auth_failed" in message for message in messages)
 
 
+@pytest.mark.asyncio
+async def test_run_due_reminders_records_unexpected_sender_error_and_keeps_batch(
+    db_session: AsyncSession,
+) -> None:
+    broken = await _create_occurrence(
+        db_session, email="owner-broken@example.com", title="Broken Meeting"
+    )
+    healthy = await _create_occurrence(
+        db_session, email="owner-healthy@example.com", title="Healthy Meeting"
+    )
+    due_at = datetime.now(UTC) - timedelta(minutes=1)
+    reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=due_at,
+            next_attempt_at=due_at,
+            sent_at=None,
+        )
+        for occurrence in (broken, healthy)
+    ]
+    db_session.add_all(reminders)
+    await db_session.commit()
+
+    sender = BrokenForOneRecipientSender(broken_email="owner-broken@example.com", sent=[])
+    await run_due_reminders(sender=sender)
+
+    assert [reminder.recipient_email for reminder in sender.sent] == ["owner-healthy@example.com"]
+    async with db.SessionMaker() as verify_session:
+        by_occurrence = {
+            reminder.occurrence_id: reminder
+            for reminder in (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.id.in_([r.id for r in reminders]))
+                )
+            ).scalars()
+        }
+    assert by_occurrence[broken.id].delivery_status == ReminderDeliveryStatus.failed_terminal
+    assert by_occurrence[broken.id].failure_reason_code == "error"
+    assert by_occurrence[healthy.id].delivery_status == ReminderDeliveryStatus.sent
+
+
 @pytest.mark.asyncio
 async def test_run_due_reminders_stops_retrying_at_max_attempts(
     db_session: AsyncSession,
@@ -327,12 +1124,20 @@ async def test_run_due_reminders_skips_send_when_claim_not_acquired(
     db_session.add(reminder)
     await db_session.commit()
 
-    async def fake_claim(*, reminder: Reminder, now: datetime) -> bool:
-        _ = reminder
+    async def fake_claim(
+        *,
+        now: datetime,
+        limit: int,
+        channels: Sequence[ReminderChannel],
+        shards: Sequence[int] | None = None,
+    ) -> list[uuid.UUID]:
         _ = now
-        return False
+        _ = limit
+        _ = channels
+        _ = shards
+        return []
 
-    monkeypatch.setattr(reminder_cli, "claim_reminder_attempt", fake_claim)
+    monkeypatch.setattr(reminder_cli, "claim_due_reminder_batch", fake_claim)
 
     sender = CapturingSender(sent=[])
     await run_due_reminders(sender=sender)
@@ -399,3 +1204,180 @@ async def test_try_claim_attempt_applies_lease_and_blocks_immediate_reclaim(
         await second_claim_session.commit()
 
     assert second_claim is False
+
+
+@pytest.mark.asyncio
+async def test_claim_due_batch_leases_only_due_email_reminders_up_to_limit(
+    db_session: AsyncSession,
+) -> None:
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-batch@example.com",
+        title="Batch Meeting",
+    )
+
+    now = datetime.now(UTC)
+    due_reminders = [
+        Reminder(
+            occurrence_id=occurrence.id,
+            channel=ReminderChannel.email,
+            send_at=now - timedelta(minutes=10 - minutes),
+            sent_at=None,
+        )
+        for minutes in range(3)
+    ]
+    future_reminder = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.email,
+        send_at=now + timedelta(hours=1),
+        sent_at=None,
+    )
+    slack_reminder = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.slack,
+        send_at=now - timedelta(minutes=30),
+        sent_at=None,
+    )
+    db_session.add_all([*due_reminders, future_reminder, slack_reminder])
+    await db_session.commit()
+
+    async with db.SessionMaker() as claim_session:
+        repo = ReminderRepository(claim_session)
+        first_batch = await repo.claim_due_batch(
+            now=now,
+            limit=2,
+            claim_lease_seconds=45,
+            channels=[ReminderChannel.email],
+        )
+        second_batch = await repo.claim_due_batch(
+            now=now,
+            limit=2,
+            claim_lease_seconds=45,
+            channels=[ReminderChannel.email],
+        )
+        await claim_session.commit()
+
+    assert set(first_batch) == {due_reminders[0].id, due_reminders[1].id}
+    assert second_batch == [due_reminders[2].id]
+
+    async with db.SessionMaker() as verify_session:
+        rows = (
+            (
+                await verify_session.execute(
+                    select(Reminder).where(Reminder.occurrence_id == occurrence.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+
+    for reminder in due_reminders:
+        refreshed = by_id[reminder.id]
+        assert refreshed.attempt_count == 1
+        assert refreshed.next_attempt_at is not None
+        assert as_utc(refreshed.next_attempt_at) > now
+    assert by_id[future_reminder.id].attempt_count == 0
+    assert by_id[slack_reminder.id].attempt_count == 0
+
+
+@pytest.mark.asyncio
+async def test_list_delivery_rows_projects_message_fields_and_open_tasks(
+    db_session: AsyncSession,
+) -> None:
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-projection@example.com",
+        title="Projection Meeting",
+    )
+    series = (
+        await db_session.execute(
+            select(MeetingSeries).where(MeetingSeries.id == occurrence.series_id)
+        )
+    ).scalar_one()
+    reminder = Reminder(
+        occurrence_id=occurrence.id,
+        channel=ReminderChannel.email,
+        send_at=datetime.now(UTC) - timedelta(minutes=1),
+        sent_at=None,
+    )
+    db_session.add_all(
+        [
+            reminder,
+            Task(
+                occurrence_id=occurrence.id,
+                assigned_user_id=series.owner_user_id,
+                due_at=occurrence.scheduled_at,
+                title="Open item",
+                is_done=False,
+            ),
+            Task(
+                occurrence_id=occurrence.id,
+                assigned_user_id=series.owner_user_id,
+                due_at=occurrence.scheduled_at,
+                title="Closed item",
+                is_done=True,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    async with db.SessionMaker() as load_session:
+        rows = await ReminderRepository(load_session).list_delivery_rows([reminder.id])
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert row.reminder.id == reminder.id
+    assert row.recipient_email == "owner-projection@example.com"
+    assert row.meeting_title == "Projection Meeting"
+    assert as_utc(row.scheduled_at) == as_utc(occurrence.scheduled_at)
+    assert row.incomplete_tasks == ["Open item"]
+
+
+@pytest.mark.asyncio
+async def test_next_due_at_returns_earliest_undelivered_attempt(db_session: AsyncSession) -> None:
+    occurrence = await _create_occurrence(
+        db_session,
+        email="owner-next-due@example.com",
+        title="Next Due Meeting",
+    )
+
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now - timedelta(hours=2),
+                sent_at=now - timedelta(hours=2),
+                delivery_status=ReminderDeliveryStatus.sent,
+            ),
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now - timedelta(hours=1),
+                sent_at=None,
+                delivery_status=ReminderDeliveryStatus.failed_terminal,
+            ),
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now - timedelta(minutes=30),
+                sent_at=None,
+                delivery_status=ReminderDeliveryStatus.retry_scheduled,
+                next_attempt_at=now + timedelta(minutes=5),
+            ),
+            Reminder(
+                occurrence_id=occurrence.id,
+                channel=ReminderChannel.email,
+                send_at=now + timedelta(minutes=20),
+                sent_at=None,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    next_due_at = await ReminderRepository(db_session).next_due_at()
+
+    assert next_due_at is not None
+    assert as_utc(next_due_at) == now + timedelta(minutes=5)
@@ -9,7 +9,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import agendable.db as db
-from agendable.db.models import AgendaItem, MeetingOccurrence, Task, User
+from agendable.db.models import (
+    AgendaItem,
+    MeetingOccurrence,
+    MeetingOccurrenceAttendee,
+    Task,
+    User,
+)
 from agendable.testing.web_test_helpers import create_series, login_user
 
 
@@ -417,3 +423,57 @@ async def test_completed_occurrence_is_read_only(
         )
         assert len(still_one_task) == 0
         assert len(still_one_agenda) == 0
+
+
+async def test_complete_occurrence_materializes_next_planned_occurrence(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "alice@example.com", "pw-alice")
+
+    series = await create_series(
+        client,
+        db_session,
+        owner_email="alice@example.com",
+        title=f"Roll planned {uuid.uuid4()}",
+    )
+    first = (
+        await db_session.execute(
+            select(MeetingOccurrence).where(MeetingOccurrence.series_id == series.id)
+        )
+    ).scalar_one()
+
+    # A meeting opened further out must not hide the planned one right after ``first``.
+    later = MeetingOccurrence(
+        series_id=series.id,
+        scheduled_at=first.scheduled_at + timedelta(days=5),
+        notes="",
+    )
+    db_session.add(later)
+    await db_session.commit()
+
+    resp = await client.post(f"/occurrences/{first.id}/complete", follow_redirects=False)
+    assert resp.status_code == 303
+
+    async with db.SessionMaker() as verify_session:
+        next_occurrence = (
+            await verify_session.execute(
+                select(MeetingOccurrence).where(
+                    MeetingOccurrence.series_id == series.id,
+                    MeetingOccurrence.scheduled_at == first.scheduled_at + timedelta(days=1),
+                )
+            )
+        ).scalar_one()
+        attendee_ids = (
+            (
+                await verify_session.execute(
+                    select(MeetingOccurrenceAttendee.user_id).where(
+                        MeetingOccurrenceAttendee.occurrence_id == next_occurrence.id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    assert resp.headers["location"] == f"/occurrences/{next_occurrence.id}"
+    assert attendee_ids == [series.owner_user_id]
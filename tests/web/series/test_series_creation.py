@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
@@ -13,6 +14,7 @@ from agendable.db.models import (
     MeetingSeries,
     User,
 )
+from agendable.reminders import as_utc
 from agendable.testing.web_test_helpers import login_user
 
 
@@ -278,3 +280,137 @@ async def test_create_series_requires_auth(client: AsyncClient) -> None:
         },
     )
     assert resp.status_code == 401
+
+
+async def test_create_series_keeps_occurrences_past_window_virtual(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "alice@example.com", "pw-alice")
+
+    title = f"Virtual {uuid.uuid4()}"
+    start = datetime.now(UTC).date() + timedelta(days=1)
+    resp = await client.post(
+        "/series",
+        data={
+            "title": title,
+            "reminder_minutes_before": 60,
+            "recurrence_start_date": start.isoformat(),
+            "recurrence_time": "09:00",
+            "recurrence_timezone": "UTC",
+            "recurrence_freq": "DAILY",
+            "recurrence_interval": 1,
+            "generate_count": 30,
+        },
+        follow_redirects=True,
+    )
+    assert resp.status_code == 200
+
+    series = (
+        await db_session.execute(select(MeetingSeries).where(MeetingSeries.title == title))
+    ).scalar_one()
+    occurrence_times = (
+        (
+            await db_session.execute(
+                select(MeetingOccurrence.scheduled_at)
+                .where(MeetingOccurrence.series_id == series.id)
+                .order_by(MeetingOccurrence.scheduled_at.asc())
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    # Only the first 14 days after the first meeting are written; the rest are planned.
+    assert len(occurrence_times) == 15
+    assert series.occurrences_materialized_until is not None
+    assert as_utc(series.occurrences_materialized_until) == as_utc(occurrence_times[-1])
+
+    detail = await client.get(f"/series/{series.id}")
+    assert detail.status_code == 200
+    planned_at = as_utc(occurrence_times[-1]) + timedelta(days=1)
+    planned_link = f"/series/{series.id}/occurrences/at/{planned_at:%Y%m%dT%H%M%SZ}"
+    assert planned_link in detail.text
+    assert "Planned" in detail.text
+
+
+async def test_opening_planned_occurrence_materializes_it(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "teammate@example.com", "pw-teammate")
+    await client.post("/logout", follow_redirects=True)
+    await login_user(client, "alice@example.com", "pw-alice")
+
+    title = f"Planned {uuid.uuid4()}"
+    resp = await client.post(
+        "/series",
+        data={
+            "title": title,
+            "reminder_minutes_before": 60,
+            "recurrence_start_date": "2030-01-01",
+            "recurrence_time": "09:00",
+            "recurrence_timezone": "UTC",
+            "recurrence_freq": "WEEKLY",
+            "recurrence_interval": 1,
+            "weekly_byday": ["TU"],
+            "attendee_emails": "teammate@example.com",
+            "generate_count": 1,
+        },
+        follow_redirects=True,
+    )
+    assert resp.status_code == 200
+    series = (
+        await db_session.execute(select(MeetingSeries).where(MeetingSeries.title == title))
+    ).scalar_one()
+
+    # 2030-03-05 is a Tuesday; 2030-03-06 is not an occurrence of the series.
+    not_planned = await client.post(
+        f"/series/{series.id}/occurrences/at/20300306T090000Z", follow_redirects=False
+    )
+    assert not_planned.status_code == 404
+
+    # Following the URL with a GET (e.g. a link prefetcher) writes nothing.
+    prefetched = await client.get(
+        f"/series/{series.id}/occurrences/at/20300305T090000Z", follow_redirects=False
+    )
+    assert prefetched.status_code == 405
+    assert (
+        await db_session.execute(
+            select(MeetingOccurrence).where(
+                MeetingOccurrence.series_id == series.id,
+                MeetingOccurrence.scheduled_at == datetime(2030, 3, 5, 9, 0, tzinfo=UTC),
+            )
+        )
+    ).scalar_one_or_none() is None
+
+    opened = await client.post(
+        f"/series/{series.id}/occurrences/at/20300305T090000Z", follow_redirects=False
+    )
+    assert opened.status_code == 303
+    occurrence = (
+        await db_session.execute(
+            select(MeetingOccurrence).where(
+                MeetingOccurrence.series_id == series.id,
+                MeetingOccurrence.scheduled_at == datetime(2030, 3, 5, 9, 0, tzinfo=UTC),
+            )
+        )
+    ).scalar_one()
+    assert opened.headers["location"] == f"/occurrences/{occurrence.id}"
+
+    attendee_ids = (
+        (
+            await db_session.execute(
+                select(MeetingOccurrenceAttendee.user_id).where(
+                    MeetingOccurrenceAttendee.occurrence_id == occurrence.id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert len(attendee_ids) == 2
+
+    # Opening it again reuses the row.
+    reopened = await client.post(
+        f"/series/{series.id}/occurrences/at/20300305T090000Z", follow_redirects=False
+    )
+    assert reopened.headers["location"] == f"/occurrences/{occurrence.id}"
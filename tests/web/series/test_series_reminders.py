@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
@@ -15,9 +15,20 @@ from agendable.db.models import (
     ReminderChannel,
     User,
 )
+from agendable.settings import get_settings
 from agendable.testing.web_test_helpers import login_user
 
 
+def _soon() -> date:
+    # Series are scheduled in UTC, so "soon" is counted from the UTC date, not the local one.
+    return datetime.now(UTC).date() + timedelta(days=2)
+
+
+def _beyond_reminder_horizon() -> date:
+    # Default reminders are only written up front within the reminder horizon.
+    return datetime.now(UTC).date() + timedelta(days=get_settings().reminder_horizon_days + 30)
+
+
 def _as_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
@@ -48,7 +59,7 @@ async def test_create_series_auto_creates_email_reminders(
         data={
             "title": title,
             "reminder_minutes_before": 120,
-            "recurrence_start_date": "2030-01-01",
+            "recurrence_start_date": _soon().isoformat(),
             "recurrence_time": "09:00",
             "recurrence_timezone": "UTC",
             "recurrence_freq": "DAILY",
@@ -109,7 +120,7 @@ async def test_create_series_rejects_invalid_reminder_minutes_before(client: Asy
         data={
             "title": "Invalid Reminder",
             "reminder_minutes_before": -1,
-            "recurrence_start_date": "2030-01-01",
+            "recurrence_start_date": _soon().isoformat(),
             "recurrence_time": "09:00",
             "recurrence_timezone": "UTC",
             "recurrence_freq": "DAILY",
@@ -133,7 +144,7 @@ async def test_manual_occurrence_creation_auto_creates_email_reminder(
         data={
             "title": title,
             "reminder_minutes_before": 45,
-            "recurrence_start_date": "2030-01-01",
+            "recurrence_start_date": _soon().isoformat(),
             "recurrence_time": "09:00",
             "recurrence_timezone": "UTC",
             "recurrence_freq": "DAILY",
@@ -158,7 +169,7 @@ async def test_manual_occurrence_creation_auto_creates_email_reminder(
 
     resp = await client.post(
         f"/series/{series.id}/occurrences",
-        data={"scheduled_at": "2030-01-10T09:00:00Z"},
+        data={"scheduled_at": f"{_soon() + timedelta(days=3)}T09:00:00Z"},
         follow_redirects=False,
     )
     assert resp.status_code == 303
@@ -192,6 +203,70 @@ async def test_manual_occurrence_creation_auto_creates_email_reminder(
     assert _as_utc(reminder.send_at) == _as_utc(manual_occ.scheduled_at) - timedelta(minutes=45)
 
 
+async def test_manual_occurrence_at_existing_time_returns_existing_occurrence(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "alice@example.com", "pw-alice")
+
+    title = f"Manual duplicate {uuid.uuid4()}"
+    create_resp = await client.post(
+        "/series",
+        data={
+            "title": title,
+            "reminder_minutes_before": 45,
+            "recurrence_start_date": _soon().isoformat(),
+            "recurrence_time": "09:00",
+            "recurrence_timezone": "UTC",
+            "recurrence_freq": "DAILY",
+            "recurrence_interval": 1,
+            "generate_count": 1,
+        },
+        follow_redirects=True,
+    )
+    assert create_resp.status_code == 200
+
+    alice = (
+        await db_session.execute(select(User).where(User.email == "alice@example.com"))
+    ).scalar_one()
+    series = (
+        await db_session.execute(
+            select(MeetingSeries).where(
+                MeetingSeries.owner_user_id == alice.id,
+                MeetingSeries.title == title,
+            )
+        )
+    ).scalar_one()
+    existing = (
+        await db_session.execute(
+            select(MeetingOccurrence).where(MeetingOccurrence.series_id == series.id)
+        )
+    ).scalar_one()
+
+    resp = await client.post(
+        f"/series/{series.id}/occurrences",
+        data={"scheduled_at": f"{_soon()}T09:00:00Z"},
+        follow_redirects=False,
+    )
+    assert resp.status_code == 303
+
+    occurrences = list(
+        (
+            await db_session.execute(
+                select(MeetingOccurrence).where(MeetingOccurrence.series_id == series.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [occ.id for occ in occurrences] == [existing.id]
+    reminders = list(
+        (await db_session.execute(select(Reminder).where(Reminder.occurrence_id == existing.id)))
+        .scalars()
+        .all()
+    )
+    assert len(reminders) == 1
+
+
 async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
     client: AsyncClient,
     db_session: AsyncSession,
@@ -206,7 +281,7 @@ async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
         data={
             "title": title,
             "reminder_minutes_before": 45,
-            "recurrence_start_date": "2030-01-01",
+            "recurrence_start_date": _soon().isoformat(),
             "recurrence_time": "09:00",
             "recurrence_timezone": "UTC",
             "recurrence_freq": "DAILY",
@@ -231,7 +306,7 @@ async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
 
     resp = await client.post(
         f"/series/{series.id}/occurrences",
-        data={"scheduled_at": "2030-01-10T09:00:00Z"},
+        data={"scheduled_at": f"{_soon() + timedelta(days=3)}T09:00:00Z"},
         follow_redirects=False,
     )
     assert resp.status_code == 303
@@ -261,3 +336,50 @@ async def test_manual_occurrence_creation_skips_reminder_when_default_disabled(
         .first()
     )
     assert reminder is None
+
+
+async def test_manual_occurrence_beyond_reminder_horizon_defers_reminder(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await login_user(client, "alice@example.com", "pw-alice")
+
+    title = f"Far reminder {uuid.uuid4()}"
+    create_resp = await client.post(
+        "/series",
+        data={
+            "title": title,
+            "reminder_minutes_before": 45,
+            "recurrence_start_date": _soon().isoformat(),
+            "recurrence_time": "09:00",
+            "recurrence_timezone": "UTC",
+            "recurrence_freq": "DAILY",
+            "recurrence_interval": 1,
+            "generate_count": 1,
+        },
+        follow_redirects=True,
+    )
+    assert create_resp.status_code == 200
+
+    series = (
+        await db_session.execute(select(MeetingSeries).where(MeetingSeries.title == title))
+    ).scalar_one()
+
+    resp = await client.post(
+        f"/series/{series.id}/occurrences",
+        data={"scheduled_at": f"{_beyond_reminder_horizon()}T09:00:00Z"},
+        follow_redirects=False,
+    )
+    assert resp.status_code == 303
+
+    far_occ = (
+        await db_session.execute(
+            select(MeetingOccurrence)
+            .where(MeetingOccurrence.series_id == series.id)
+            .order_by(MeetingOccurrence.scheduled_at.desc())
+            .limit(1)
+        )
+    ).scalar_one()
+    reminder = (
+        await db_session.execute(select(Reminder).where(Reminder.occurrence_id == far_occ.id))
+    ).scalar_one_or_none()
+    assert reminder is None